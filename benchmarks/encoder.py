@@ -0,0 +1,72 @@
+"""Encoding cost of the types registered in ``cachetoolz.coder.encoder``.
+
+Encodes a list of ``SIZE`` values of each type with the JSON coder and with
+``json.dumps`` calling the ``singledispatch`` ``encode`` for every item, the
+path of the coder without the exact-type dispatch cache.
+
+Run from the repository root with ``python -m benchmarks.encoder``.
+"""
+
+import json
+import re
+from collections import deque
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from ipaddress import (
+    IPv4Address,
+    IPv4Interface,
+    IPv4Network,
+    IPv6Address,
+    IPv6Interface,
+    IPv6Network,
+)
+from pathlib import PosixPath
+from timeit import repeat
+from uuid import uuid4
+
+from cachetoolz.coder import coder
+from cachetoolz.coder.encoder import encode
+from cachetoolz.types import CachedError
+
+SIZE = 10_000
+NUMBER = 5
+
+VALUES = {
+    'set': lambda index: {index, -index},
+    'frozenset': lambda index: frozenset({index}),
+    'timedelta': lambda index: timedelta(seconds=index),
+    'deque': lambda index: deque([index], 2),
+    'pattern': lambda index: re.compile(rf'\d{{{index}}}'),
+    'cachederror': lambda index: CachedError('builtins.ValueError', [index]),
+    'bytes': lambda index: b'%d' % index,
+    'time': lambda index: time(index % 24),
+    'date': lambda index: date.fromordinal(index + 1),
+    'datetime': lambda index: datetime.fromordinal(index + 1),
+    'decimal': lambda index: Decimal(index) / 7,
+    'uuid': lambda index: uuid4(),
+    'posixpath': lambda index: PosixPath(f'/tmp/{index}'),
+    'ipv4address': lambda index: IPv4Address(index),
+    'ipv4interface': lambda index: IPv4Interface(index),
+    'ipv4network': lambda index: IPv4Network(index),
+    'ipv6address': lambda index: IPv6Address(index),
+    'ipv6interface': lambda index: IPv6Interface(index),
+    'ipv6network': lambda index: IPv6Network(index),
+}
+
+
+def best(stmt) -> float:
+    """Best time per item in microseconds."""
+    return min(repeat(stmt, number=NUMBER, repeat=3)) / NUMBER / SIZE * 1e6
+
+
+def main():
+    print(f'{"type":<16} {"coder":>10} {"dispatch":>10} (us/item)')
+    for name, factory in VALUES.items():
+        values = [factory(index) for index in range(SIZE)]
+        cached = best(lambda: coder.encode(values))
+        dispatched = best(lambda: json.dumps(values, default=encode))
+        print(f'{name:<16} {cached:10.3f} {dispatched:10.3f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""Per-call cost of a cache hit compared with ``functools.lru_cache``.
+
+A hit of an in memory backend builds the key, reads it and decodes the
+value, so it can not be as fast as ``lru_cache``. The cost of each step is
+reported along with the hit, the rest is the decorator itself.
+
+Measured on Python 3.11, in ``lru_cache`` hits, the ranges of five runs:
+
+===========================  ======
+InMemory sync hit            19-44x
+build the key                7-18x
+InMemory get                 4-7x
+decode the value             4-8x
+decorator                    3-14x
+sync hit with ``key_cache``  12-25x
+===========================  ======
+
+Building the key, a ``blake2b`` hash of the arguments, is the largest step,
+``key_cache`` skips it for recent arguments. The ratio is only reported, an
+``lru_cache`` hit is too short for a stable threshold.
+
+Run from the repository root with ``python -m benchmarks.hit_path``.
+"""
+
+import asyncio
+from functools import lru_cache
+from timeit import repeat
+
+from cachetoolz import AsyncInMemory, Cache, InMemory
+from cachetoolz.coder import coder
+from cachetoolz.utils import key_function
+
+NUMBER = 10_000
+
+
+def add(x, y):
+    return x + y
+
+
+async def async_add(x, y):
+    return x + y
+
+
+def best(stmt) -> float:
+    """Best time per call in microseconds."""
+    return min(repeat(stmt, number=NUMBER, repeat=7)) / NUMBER * 1e6
+
+
+def best_async(func, *args) -> float:
+    """Best time per awaited call in microseconds."""
+
+    async def calls():
+        for _ in range(NUMBER):
+            await func(*args)
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(func(*args))
+        elapsed = repeat(
+            lambda: loop.run_until_complete(calls()), number=1, repeat=5
+        )
+        return min(elapsed) / NUMBER * 1e6
+    finally:
+        loop.close()
+
+
+def main():
+    lru = lru_cache(maxsize=None)(add)
+    lru(1, 2)
+
+    backend = InMemory()
+    cache = Cache(backend)
+    sync_hit = cache(add)
+    sync_hit(1, 2)
+    key_cache_hit = cache(key_cache=128)(add)
+    key_cache_hit(1, 2)
+
+    async_hit = Cache(AsyncInMemory())(async_add)
+
+    key = key_function('default', None, False, add)
+    hit_key = key(1, 2)
+    encoded = backend.get(hit_key)
+
+    results = {
+        'lru_cache hit': best(lambda: lru(1, 2)),
+        'InMemory sync hit': best(lambda: sync_hit(1, 2)),
+        'build the key': best(lambda: key(1, 2)),
+        'InMemory get': best(lambda: backend.get(hit_key)),
+        'decode the value': best(lambda: coder.decode(encoded)),
+        'sync hit with key_cache': best(lambda: key_cache_hit(1, 2)),
+        'AsyncInMemory async hit': best_async(async_hit, 1, 2),
+    }
+    results['decorator'] = results['InMemory sync hit'] - sum(
+        results[step]
+        for step in ('build the key', 'InMemory get', 'decode the value')
+    )
+
+    lru_hit = results['lru_cache hit']
+    for name, elapsed in results.items():
+        ratio = elapsed / lru_hit
+        print(f'{name:<28} {elapsed:10.2f} us/call {ratio:8.1f}x')
+
+
+if __name__ == '__main__':
+    main()
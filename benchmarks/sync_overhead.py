@@ -0,0 +1,52 @@
+"""Per-call overhead of synchronous functions with a synchronous backend.
+
+Compares a cache hit through the native synchronous pipeline with a hit of
+the asynchronous pipeline run inside ``asyncio.run``, an approximation of
+the previous synchronous pipeline, which created an event loop per call.
+
+Run from the repository root with ``python -m benchmarks.sync_overhead``.
+"""
+
+import asyncio
+from timeit import repeat
+
+from cachetoolz import Cache, InMemory
+
+NUMBER = 10_000
+
+
+def add(x, y):
+    return x + y
+
+
+def best(stmt) -> float:
+    """Best time per call in microseconds."""
+    return min(repeat(stmt, number=NUMBER, repeat=5)) / NUMBER * 1e6
+
+
+def main():
+    cache = Cache(InMemory())
+
+    native = cache(add)
+    native(1, 2)
+
+    @cache
+    async def async_add(x, y):
+        return x + y
+
+    def legacy(*args):
+        return asyncio.run(async_add(*args))
+
+    legacy(1, 2)
+
+    results = {
+        'plain call': best(lambda: add(1, 2)),
+        'async hit in asyncio.run': best(lambda: legacy(1, 2)),
+        'native sync hit': best(lambda: native(1, 2)),
+    }
+    for name, elapsed in results.items():
+        print(f'{name:<28} {elapsed:10.2f} us/call')
+
+
+if __name__ == '__main__':
+    main()
@@ -8,6 +8,7 @@ from .backend import (
     MongoBackend,
     RedisBackend,
 )
+from .breaker import CircuitBreaker
 from .decorator import Cache
 
 __all__ = (
@@ -18,6 +19,7 @@ __all__ = (
     'AsyncRedisBackend',
     'RedisBackend',
     'Cache',
+    'CircuitBreaker',
     'cache',
 )
 
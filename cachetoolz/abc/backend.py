@@ -1,11 +1,14 @@
 """Abstract backend module."""
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from datetime import timedelta
-from typing import Any, List
+from typing import Any, DefaultDict, List, Sequence, Tuple
 
 from ..log import get_logger
+from ..types import Value
 
 
 class BaseBackend:
@@ -34,6 +37,28 @@ class BaseBackend:
         """
         return key.split(':')
 
+    def _group_by_namespace(
+        self, keys: Sequence[str]
+    ) -> DefaultDict[str, List[str]]:
+        """Group the key hashes by namespace.
+
+        Parameters
+        ----------
+        keys : Sequence[str]
+            Keys with namespace and key_hash
+
+        Returns
+        -------
+        groups : collections.defaultdict[str, list[str]]
+            Key hashes of each namespace
+
+        """
+        groups = defaultdict(list)
+        for key in keys:
+            namespace, key_hash = self._separate_namespace(key)
+            groups[namespace].append(key_hash)
+        return groups
+
     @property
     def logger(self) -> logging.Logger:
         """Get logger.
@@ -50,6 +75,10 @@ class BaseBackend:
 class BackendABC(BaseBackend, ABC):
     """Abstract backend.
 
+    Deleting values is optional, backends that support it implement
+    ``delete(key)`` and ``delete_many(keys)``, like the built-in backends.
+    Check for them with ``hasattr`` before calling them.
+
     Attributes
     ----------
     logger : logging.Logger
@@ -76,14 +105,14 @@ class BackendABC(BaseBackend, ABC):
         """
 
     @abstractmethod
-    def set(self, key: str, value: str, expires_at: timedelta) -> None:
+    def set(self, key: str, value: Value, expires_at: timedelta) -> None:
         """Set a value with expires time.
 
         Parameters
         ----------
         key : str
             cache identifier key.
-        value : str
+        value : str | bytes
             value to cache encoded.
         expires_at : datetime.timedelta
             expiry time.
@@ -101,10 +130,81 @@ class BackendABC(BaseBackend, ABC):
 
         """
 
+    def acquire_lease(self, key: str, ttl: timedelta) -> bool:
+        """Acquire the lease to compute the value of a key.
+
+        Only the lease holder recomputes a missing value, the other callers
+        wait for it. Backends without lease support always grant it.
+
+        Parameters
+        ----------
+        key : str
+            cache identifier key.
+        ttl : datetime.timedelta
+            lease expiry time.
+
+        Returns
+        -------
+        acquired : bool
+            If the lease was acquired.
+
+        """
+        return True
+
+    def release_lease(self, key: str) -> None:
+        """Release a lease acquired by this backend.
+
+        Parameters
+        ----------
+        key : str
+            cache identifier key.
+
+        """
+
+    def get_many(self, keys: Sequence[str]) -> List[Any]:
+        """Get many values if not expired.
+
+        By default there is a call per key, backends should read
+        them in a single round trip.
+
+        Parameters
+        ----------
+        keys : Sequence[str]
+            cache identifier keys.
+
+        Returns
+        -------
+        values : list[Any]
+            Values cached in the order of the keys, ``None`` for the keys
+            that do not exist or expired.
+
+        """
+        return [self.get(key) for key in keys]
+
+    def set_many(self, items: Sequence[Tuple[str, Value, timedelta]]) -> None:
+        """Set many values with expires time.
+
+        By default there is a call per value, backends should write
+        them in a single round trip.
+
+        Parameters
+        ----------
+        items : Sequence[tuple[str, str | bytes, datetime.timedelta]]
+            cache identifier key, value to cache encoded and expiry time of
+            each value.
+
+        """
+        for key, value, expires_at in items:
+            self.set(key, value, expires_at)
+
 
 class AsyncBackendABC(BaseBackend, ABC):
     """Abstract async backend.
 
+    Deleting values is optional, backends that support it implement
+    ``delete(key)`` and ``delete_many(keys)``, like the built-in backends.
+    Check for them with ``hasattr`` before calling them.
+
     Attributes
     ----------
     logger : logging.Logger
@@ -131,14 +231,14 @@ class AsyncBackendABC(BaseBackend, ABC):
         """
 
     @abstractmethod
-    async def set(self, key: str, value: str, expires_at: timedelta) -> None:
+    async def set(self, key: str, value: Value, expires_at: timedelta) -> None:
         """Set a value with expires time.
 
         Parameters
         ----------
         key : str
             cache identifier key.
-        value : str
+        value : str | bytes
             value to cache encoded.
         expires_at : datetime.timedelta
             expiry time.
@@ -155,3 +255,76 @@ class AsyncBackendABC(BaseBackend, ABC):
             namespace to cache.
 
         """
+
+    async def acquire_lease(self, key: str, ttl: timedelta) -> bool:
+        """Acquire the lease to compute the value of a key.
+
+        Only the lease holder recomputes a missing value, the other callers
+        wait for it. Backends without lease support always grant it.
+
+        Parameters
+        ----------
+        key : str
+            cache identifier key.
+        ttl : datetime.timedelta
+            lease expiry time.
+
+        Returns
+        -------
+        acquired : bool
+            If the lease was acquired.
+
+        """
+        return True
+
+    async def release_lease(self, key: str) -> None:
+        """Release a lease acquired by this backend.
+
+        Parameters
+        ----------
+        key : str
+            cache identifier key.
+
+        """
+
+    async def get_many(self, keys: Sequence[str]) -> List[Any]:
+        """Get many values if not expired.
+
+        By default there is a call per key, backends should read
+        them in a single round trip.
+
+        Parameters
+        ----------
+        keys : Sequence[str]
+            cache identifier keys.
+
+        Returns
+        -------
+        values : list[Any]
+            Values cached in the order of the keys, ``None`` for the keys
+            that do not exist or expired.
+
+        """
+        return list(await asyncio.gather(*map(self.get, keys)))
+
+    async def set_many(
+        self, items: Sequence[Tuple[str, Value, timedelta]]
+    ) -> None:
+        """Set many values with expires time.
+
+        By default there is a call per value, backends should write
+        them in a single round trip.
+
+        Parameters
+        ----------
+        items : Sequence[tuple[str, str | bytes, datetime.timedelta]]
+            cache identifier key, value to cache encoded and expiry time of
+            each value.
+
+        """
+        await asyncio.gather(
+            *[
+                self.set(key, value, expires_at)
+                for key, value, expires_at in items
+            ]
+        )
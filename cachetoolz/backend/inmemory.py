@@ -1,15 +1,18 @@
 """In backend module."""
 
+import logging
+import threading
 from asyncio import Lock
 from collections import defaultdict
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 from functools import partial
-from typing import Any, DefaultDict, Dict, TypeVar
+from typing import Any, DefaultDict, Dict, List, Sequence, Tuple, TypeVar
 
 from funcy import walk_values
 
 from ..abc import AsyncBackendABC, BackendABC
+from ..types import Value
 
 
 @dataclass
@@ -18,7 +21,7 @@ class Cached:
 
     Attributes
     ----------
-    value : str
+    value : str | bytes
         value to cache encoded.
     expires_at : datetime.datetime
         expiry time.
@@ -29,7 +32,7 @@ class Cached:
 
     """
 
-    value: str
+    value: Value
     expires_at: datetime
 
 
@@ -46,6 +49,8 @@ class InMemory(BackendABC):
     def __init__(self):
         """Initialize the instance."""
         self._store: Store = defaultdict(lambda: {})
+        self._leases: Dict[str, datetime] = {}
+        self._leases_lock = threading.Lock()
 
     def __repr__(self):
         """Creates a visual representation of the instance."""
@@ -70,7 +75,10 @@ class InMemory(BackendABC):
             If not exists or expired.
 
         """
-        self.logger.debug("Get 'key=%s'", key)
+        # The hit path only checks the level, a call per message costs more
+        logger = self.logger
+        if debug := logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Get 'key=%s'", key)
 
         namespace, key_hash = self._separate_namespace(key)
 
@@ -80,16 +88,17 @@ class InMemory(BackendABC):
 
             del self._store[namespace][key_hash]
 
-        self.logger.debug("No cache to 'key=%s'", key)
+        if debug:
+            logger.debug("No cache to 'key=%s'", key)
 
-    def set(self, key: str, value: str, expires_at: timedelta) -> None:
+    def set(self, key: str, value: Value, expires_at: timedelta) -> None:
         """Set a value with expires time.
 
         Parameters
         ----------
         key : str
             cache identifier key.
-        value : str
+        value : str | bytes
             value to cache encoded.
         expires_at : datetime.timedelta
             expiry time.
@@ -122,6 +131,123 @@ class InMemory(BackendABC):
 
         self._store.pop(namespace)
 
+    def acquire_lease(self, key: str, ttl: timedelta) -> bool:
+        """Acquire the lease to compute the value of a key.
+
+        Parameters
+        ----------
+        key : str
+            cache identifier key.
+        ttl : datetime.timedelta
+            lease expiry time.
+
+        Returns
+        -------
+        acquired : bool
+            If the lease was acquired.
+
+        """
+        self.logger.debug("Acquire lease 'key=%s', 'ttl=%s'", key, ttl)
+
+        now = datetime.now()
+        with self._leases_lock:
+            if self._leases.get(key, now) > now:
+                return False
+            self._leases[key] = now + ttl
+        return True
+
+    def release_lease(self, key: str) -> None:
+        """Release a lease acquired by this backend.
+
+        Parameters
+        ----------
+        key : str
+            cache identifier key.
+
+        """
+        self.logger.debug("Release lease 'key=%s'", key)
+
+        with self._leases_lock:
+            self._leases.pop(key, None)
+
+    def get_many(self, keys: Sequence[str]) -> List[Any]:
+        """Get many values if not expired.
+
+        Parameters
+        ----------
+        keys : Sequence[str]
+            cache identifier keys.
+
+        Returns
+        -------
+        values : list[Any]
+            Values cached in the order of the keys, ``None`` for the keys
+            that do not exist or expired.
+
+        """
+        self.logger.debug("Get many 'keys=%s'", keys)
+
+        now = datetime.now()
+        values = []
+        for key in keys:
+            namespace, key_hash = self._separate_namespace(key)
+            store = self._store[namespace]
+            if (cached := store.get(key_hash)) and cached.expires_at < now:
+                del store[key_hash]
+                cached = None
+            values.append(cached and cached.value)
+
+        return values
+
+    def set_many(self, items: Sequence[Tuple[str, Value, timedelta]]) -> None:
+        """Set many values with expires time.
+
+        Parameters
+        ----------
+        items : Sequence[tuple[str, str | bytes, datetime.timedelta]]
+            cache identifier key, value to cache encoded and expiry time of
+            each value.
+
+        """
+        self.logger.debug("Set many 'keys=%s'", [key for key, *_ in items])
+
+        now = datetime.now()
+        for key, value, expires_at in items:
+            namespace, key_hash = self._separate_namespace(key)
+            self._store[namespace][key_hash] = Cached(
+                value=value, expires_at=now + expires_at
+            )
+
+    def delete(self, key: str) -> None:
+        """Delete a value.
+
+        Parameters
+        ----------
+        key : str
+            cache identifier key.
+
+        """
+        self.logger.debug("Delete 'key=%s'", key)
+
+        namespace, key_hash = self._separate_namespace(key)
+
+        self._store[namespace].pop(key_hash, None)
+
+    def delete_many(self, keys: Sequence[str]) -> None:
+        """Delete many values.
+
+        Parameters
+        ----------
+        keys : Sequence[str]
+            cache identifier keys.
+
+        """
+        self.logger.debug("Delete many 'keys=%s'", keys)
+
+        for key in keys:
+            namespace, key_hash = self._separate_namespace(key)
+            self._store[namespace].pop(key_hash, None)
+
 
 class AsyncInMemory(AsyncBackendABC):
     """Async in memory backend.
@@ -133,6 +259,7 @@ class AsyncInMemory(AsyncBackendABC):
     def __init__(self):
         """Initialize the instance."""
         self._store: Store = defaultdict(lambda: {})
+        self._leases: Dict[str, datetime] = {}
         self._lock: Lock = Lock()
 
     def __repr__(self):
@@ -158,7 +285,10 @@ class AsyncInMemory(AsyncBackendABC):
             If not exists or expired.
 
         """
-        self.logger.debug("Get 'key=%s'", key)
+        # The hit path only checks the level, a call per message costs more
+        logger = self.logger
+        if debug := logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Get 'key=%s'", key)
 
         namespace, key_hash = self._separate_namespace(key)
 
@@ -168,16 +298,17 @@ class AsyncInMemory(AsyncBackendABC):
                     return cached.value
                 del self._store[namespace][key_hash]
 
-        self.logger.debug("No cache to 'key=%s'", key)
+        if debug:
+            logger.debug("No cache to 'key=%s'", key)
 
-    async def set(self, key: str, value: str, expires_at: timedelta) -> None:
+    async def set(self, key: str, value: Value, expires_at: timedelta) -> None:
         """Set a value with expires time.
 
         Parameters
         ----------
         key : str
             cache identifier key.
-        value : str
+        value : str | bytes
             value to cache encoded.
         expires_at : datetime.timedelta
             expiry time.
@@ -211,3 +342,126 @@ class AsyncInMemory(AsyncBackendABC):
 
         async with self._lock:
             self._store.pop(namespace, None)
+
+    async def acquire_lease(self, key: str, ttl: timedelta) -> bool:
+        """Acquire the lease to compute the value of a key.
+
+        Parameters
+        ----------
+        key : str
+            cache identifier key.
+        ttl : datetime.timedelta
+            lease expiry time.
+
+        Returns
+        -------
+        acquired : bool
+            If the lease was acquired.
+
+        """
+        self.logger.debug("Acquire lease 'key=%s', 'ttl=%s'", key, ttl)
+
+        now = datetime.now()
+        async with self._lock:
+            if self._leases.get(key, now) > now:
+                return False
+            self._leases[key] = now + ttl
+        return True
+
+    async def release_lease(self, key: str) -> None:
+        """Release a lease acquired by this backend.
+
+        Parameters
+        ----------
+        key : str
+            cache identifier key.
+
+        """
+        self.logger.debug("Release lease 'key=%s'", key)
+
+        async with self._lock:
+            self._leases.pop(key, None)
+
+    async def get_many(self, keys: Sequence[str]) -> List[Any]:
+        """Get many values if not expired.
+
+        Parameters
+        ----------
+        keys : Sequence[str]
+            cache identifier keys.
+
+        Returns
+        -------
+        values : list[Any]
+            Values cached in the order of the keys, ``None`` for the keys
+            that do not exist or expired.
+
+        """
+        self.logger.debug("Get many 'keys=%s'", keys)
+
+        now = datetime.now()
+        values = []
+        async with self._lock:
+            for key in keys:
+                namespace, key_hash = self._separate_namespace(key)
+                store = self._store[namespace]
+                if (cached := store.get(key_hash)) and cached.expires_at < now:
+                    del store[key_hash]
+                    cached = None
+                values.append(cached and cached.value)
+
+        return values
+
+    async def set_many(
+        self, items: Sequence[Tuple[str, Value, timedelta]]
+    ) -> None:
+        """Set many values with expires time.
+
+        Parameters
+        ----------
+        items : Sequence[tuple[str, str | bytes, datetime.timedelta]]
+            cache identifier key, value to cache encoded and expiry time of
+            each value.
+
+        """
+        self.logger.debug("Set many 'keys=%s'", [key for key, *_ in items])
+
+        now = datetime.now()
+        async with self._lock:
+            for key, value, expires_at in items:
+                namespace, key_hash = self._separate_namespace(key)
+                self._store[namespace][key_hash] = Cached(
+                    value=value, expires_at=now + expires_at
+                )
+
+    async def delete(self, key: str) -> None:
+        """Delete a value.
+
+        Parameters
+        ----------
+        key : str
+            cache identifier key.
+
+        """
+        self.logger.debug("Delete 'key=%s'", key)
+
+        namespace, key_hash = self._separate_namespace(key)
+
+        async with self._lock:
+            self._store[namespace].pop(key_hash, None)
+
+    async def delete_many(self, keys: Sequence[str]) -> None:
+        """Delete many values.
+
+        Parameters
+        ----------
+        keys : Sequence[str]
+            cache identifier keys.
+
+        """
+        self.logger.debug("Delete many 'keys=%s'", keys)
+
+        async with self._lock:
+            for key in keys:
+                namespace, key_hash = self._separate_namespace(key)
+                self._store[namespace].pop(key_hash, None)
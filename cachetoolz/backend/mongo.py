@@ -1,10 +1,13 @@
 """Mongo backend."""
 
+from collections import defaultdict
 from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Any, Dict
+from typing import Any, Dict, List, Sequence, Tuple
+from uuid import uuid4
 
 from ..abc import AsyncBackendABC, BackendABC
+from ..types import Value
 
 
 class MongoBackend(BackendABC):
@@ -22,6 +25,10 @@ class MongoBackend(BackendABC):
         Takes the same constructor arguments as
         `pymongo.mongo_client.MongoClient`.
 
+    Notes
+    -----
+    Values are stored as BSON strings or, if they are bytes, as BSON binary.
+
     """
 
     def __init__(
@@ -32,7 +39,8 @@ class MongoBackend(BackendABC):
     ):
         """Initialize the instance."""
         try:
-            from pymongo import MongoClient
+            from pymongo import MongoClient, UpdateOne
+            from pymongo.errors import DuplicateKeyError
         except ImportError as exc:
             raise RuntimeError(
                 "Install cachetoolz with the 'mongo' extra in order "
@@ -40,6 +48,9 @@ class MongoBackend(BackendABC):
             ) from exc
 
         self._client_cls = MongoClient
+        self._duplicate_key_error = DuplicateKeyError
+        self._update_one = UpdateOne
+        self._lease_token = uuid4().hex
         self._kwargs = kwargs
 
         self._kwargs['host'] = host
@@ -88,14 +99,14 @@ class MongoBackend(BackendABC):
 
         self.logger.debug("No cache to 'key=%s'", key)
 
-    def set(self, key: str, value: str, expires_at: timedelta) -> None:
+    def set(self, key: str, value: Value, expires_at: timedelta) -> None:
         """Set a value with expires time.
 
         Parameters
         ----------
         key : str
             cache identifier key.
-        value : str
+        value : str | bytes
             value to cache encoded.
         expires_at : datetime.timedelta
             expiry time.
@@ -139,6 +150,173 @@ class MongoBackend(BackendABC):
         with self._get_database_or_collection() as database:
             database.drop_collection(namespace)
 
+    def acquire_lease(self, key: str, ttl: timedelta) -> bool:
+        """Acquire the lease to compute the value of a key.
+
+        The lease is a document inserted in the ``<namespace>.leases``
+        collection, which has a unique index on the key.
+
+        Parameters
+        ----------
+        key : str
+            cache identifier key.
+        ttl : datetime.timedelta
+            lease expiry time.
+
+        Returns
+        -------
+        acquired : bool
+            If the lease was acquired.
+
+        """
+        self.logger.debug("Acquire lease 'key=%s', 'ttl=%s'", key, ttl)
+
+        namespace, key_hash = self._separate_namespace(key)
+        now = datetime.now()
+
+        with self._get_database_or_collection(
+            f'{namespace}.leases'
+        ) as collection:
+            collection.create_index('key', unique=True)
+            collection.create_index('expires_at', expireAfterSeconds=0)
+
+            # The TTL monitor is not immediate, expired leases are taken over
+            collection.delete_one(
+                {'key': key_hash, 'expires_at': {'$lt': now}}
+            )
+            try:
+                collection.insert_one(
+                    {
+                        'key': key_hash,
+                        'token': self._lease_token,
+                        'expires_at': now + ttl,
+                    }
+                )
+            except self._duplicate_key_error:
+                return False
+
+        return True
+
+    def release_lease(self, key: str) -> None:
+        """Release a lease acquired by this backend.
+
+        Parameters
+        ----------
+        key : str
+            cache identifier key.
+
+        """
+        self.logger.debug("Release lease 'key=%s'", key)
+
+        namespace, key_hash = self._separate_namespace(key)
+
+        with self._get_database_or_collection(
+            f'{namespace}.leases'
+        ) as collection:
+            collection.delete_one(
+                {'key': key_hash, 'token': self._lease_token}
+            )
+
+    def get_many(self, keys: Sequence[str]) -> List[Any]:
+        """Get many values if not expired.
+
+        The keys of each namespace are read with a single ``$in`` query.
+
+        Parameters
+        ----------
+        keys : Sequence[str]
+            cache identifier keys.
+
+        Returns
+        -------
+        values : list[Any]
+            Values cached in the order of the keys, ``None`` for the keys
+            that do not exist or expired.
+
+        """
+        self.logger.debug("Get many 'keys=%s'", keys)
+
+        now = datetime.now()
+        values = {}
+        for namespace, hashes in self._group_by_namespace(keys).items():
+            with self._get_database_or_collection(namespace) as collection:
+                for doc in collection.find({'key': {'$in': hashes}}):
+                    if doc['expires_at'] >= now:
+                        values[f"{namespace}:{doc['key']}"] = doc['value']
+
+        return [values.get(key) for key in keys]
+
+    def set_many(self, items: Sequence[Tuple[str, Value, timedelta]]) -> None:
+        """Set many values with expires time.
+
+        The values of each namespace are written with a single
+        ``bulk_write``.
+
+        Parameters
+        ----------
+        items : Sequence[tuple[str, str | bytes, datetime.timedelta]]
+            cache identifier key, value to cache encoded and expiry time of
+            each value.
+
+        """
+        self.logger.debug("Set many 'keys=%s'", [key for key, *_ in items])
+
+        now = datetime.now()
+        operations = defaultdict(list)
+        for key, value, expires_at in items:
+            namespace, key_hash = self._separate_namespace(key)
+            operations[namespace].append(
+                self._update_one(
+                    {'key': key_hash},
+                    {
+                        '$set': {
+                            'key': key_hash,
+                            'value': value,
+                            'expires_at': now + expires_at,
+                        },
+                    },
+                    upsert=True,
+                )
+            )
+
+        for namespace, requests in operations.items():
+            with self._get_database_or_collection(namespace) as collection:
+                collection.create_index('expires_at', expireAfterSeconds=0)
+                collection.bulk_write(requests, ordered=False)
+
+    def delete(self, key: str) -> None:
+        """Delete a value.
+
+        Parameters
+        ----------
+        key : str
+            cache identifier key.
+
+        """
+        self.logger.debug("Delete 'key=%s'", key)
+
+        namespace, key_hash = self._separate_namespace(key)
+
+        with self._get_database_or_collection(namespace) as collection:
+            collection.delete_one({'key': key_hash})
+
+    def delete_many(self, keys: Sequence[str]) -> None:
+        """Delete many values.
+
+        The keys of each namespace are deleted with a single ``$in`` query.
+
+        Parameters
+        ----------
+        keys : Sequence[str]
+            cache identifier keys.
+
+        """
+        self.logger.debug("Delete many 'keys=%s'", keys)
+
+        for namespace, hashes in self._group_by_namespace(keys).items():
+            with self._get_database_or_collection(namespace) as collection:
+                collection.delete_many({'key': {'$in': hashes}})
+
 
 class AsyncMongoBackend(AsyncBackendABC):
     """Async MongoDB cache.
@@ -155,6 +333,10 @@ class AsyncMongoBackend(AsyncBackendABC):
         Takes the same constructor arguments as
         `pymongo.mongo_client.MongoClient`.
 
+    Notes
+    -----
+    Values are stored as BSON strings or, if they are bytes, as BSON binary.
+
     """
 
     def __init__(
@@ -166,6 +348,8 @@ class AsyncMongoBackend(AsyncBackendABC):
         """Initialize the instance."""
         try:
             from motor.motor_asyncio import AsyncIOMotorClient
+            from pymongo import UpdateOne
+            from pymongo.errors import DuplicateKeyError
         except ImportError as exc:
             raise RuntimeError(
                 "Install cachetoolz with the 'mongo' extra in order "
@@ -173,6 +357,9 @@ class AsyncMongoBackend(AsyncBackendABC):
             ) from exc
 
         self._client_cls = AsyncIOMotorClient
+        self._duplicate_key_error = DuplicateKeyError
+        self._update_one = UpdateOne
+        self._lease_token = uuid4().hex
         self._kwargs = kwargs
         self._kwargs['host'] = host
 
@@ -223,14 +410,14 @@ class AsyncMongoBackend(AsyncBackendABC):
 
         self.logger.debug("No cache to 'key=%s'", key)
 
-    async def set(self, key: str, value: str, expires_at: timedelta) -> None:
+    async def set(self, key: str, value: Value, expires_at: timedelta) -> None:
         """Set a value with expires time.
 
         Parameters
         ----------
         key : str
             cache identifier key.
-        value : str
+        value : str | bytes
             value to cache encoded.
         expires_at : datetime.timedelta
             expiry time.
@@ -273,3 +460,174 @@ class AsyncMongoBackend(AsyncBackendABC):
 
         with self._get_database_or_collection() as database:
             await database.drop_collection(namespace)
+
+    async def acquire_lease(self, key: str, ttl: timedelta) -> bool:
+        """Acquire the lease to compute the value of a key.
+
+        The lease is a document inserted in the ``<namespace>.leases``
+        collection, which has a unique index on the key.
+
+        Parameters
+        ----------
+        key : str
+            cache identifier key.
+        ttl : datetime.timedelta
+            lease expiry time.
+
+        Returns
+        -------
+        acquired : bool
+            If the lease was acquired.
+
+        """
+        self.logger.debug("Acquire lease 'key=%s', 'ttl=%s'", key, ttl)
+
+        namespace, key_hash = self._separate_namespace(key)
+        now = datetime.now()
+
+        with self._get_database_or_collection(
+            f'{namespace}.leases'
+        ) as collection:
+            await collection.create_index('key', unique=True)
+            await collection.create_index('expires_at', expireAfterSeconds=0)
+
+            # The TTL monitor is not immediate, expired leases are taken over
+            await collection.delete_one(
+                {'key': key_hash, 'expires_at': {'$lt': now}}
+            )
+            try:
+                await collection.insert_one(
+                    {
+                        'key': key_hash,
+                        'token': self._lease_token,
+                        'expires_at': now + ttl,
+                    }
+                )
+            except self._duplicate_key_error:
+                return False
+
+        return True
+
+    async def release_lease(self, key: str) -> None:
+        """Release a lease acquired by this backend.
+
+        Parameters
+        ----------
+        key : str
+            cache identifier key.
+
+        """
+        self.logger.debug("Release lease 'key=%s'", key)
+
+        namespace, key_hash = self._separate_namespace(key)
+
+        with self._get_database_or_collection(
+            f'{namespace}.leases'
+        ) as collection:
+            await collection.delete_one(
+                {'key': key_hash, 'token': self._lease_token}
+            )
+
+    async def get_many(self, keys: Sequence[str]) -> List[Any]:
+        """Get many values if not expired.
+
+        The keys of each namespace are read with a single ``$in`` query.
+
+        Parameters
+        ----------
+        keys : Sequence[str]
+            cache identifier keys.
+
+        Returns
+        -------
+        values : list[Any]
+            Values cached in the order of the keys, ``None`` for the keys
+            that do not exist or expired.
+
+        """
+        self.logger.debug("Get many 'keys=%s'", keys)
+
+        now = datetime.now()
+        values = {}
+        for namespace, hashes in self._group_by_namespace(keys).items():
+            with self._get_database_or_collection(namespace) as collection:
+                async for doc in collection.find({'key': {'$in': hashes}}):
+                    if doc['expires_at'] >= now:
+                        values[f"{namespace}:{doc['key']}"] = doc['value']
+
+        return [values.get(key) for key in keys]
+
+    async def set_many(
+        self, items: Sequence[Tuple[str, Value, timedelta]]
+    ) -> None:
+        """Set many values with expires time.
+
+        The values of each namespace are written with a single
+        ``bulk_write``.
+
+        Parameters
+        ----------
+        items : Sequence[tuple[str, str | bytes, datetime.timedelta]]
+            cache identifier key, value to cache encoded and expiry time of
+            each value.
+
+        """
+        self.logger.debug("Set many 'keys=%s'", [key for key, *_ in items])
+
+        now = datetime.now()
+        operations = defaultdict(list)
+        for key, value, expires_at in items:
+            namespace, key_hash = self._separate_namespace(key)
+            operations[namespace].append(
+                self._update_one(
+                    {'key': key_hash},
+                    {
+                        '$set': {
+                            'key': key_hash,
+                            'value': value,
+                            'expires_at': now + expires_at,
+                        },
+                    },
+                    upsert=True,
+                )
+            )
+
+        for namespace, requests in operations.items():
+            with self._get_database_or_collection(namespace) as collection:
+                await collection.create_index(
+                    'expires_at', expireAfterSeconds=0
+                )
+                await collection.bulk_write(requests, ordered=False)
+
+    async def delete(self, key: str) -> None:
+        """Delete a value.
+
+        Parameters
+        ----------
+        key : str
+            cache identifier key.
+
+        """
+        self.logger.debug("Delete 'key=%s'", key)
+
+        namespace, key_hash = self._separate_namespace(key)
+
+        with self._get_database_or_collection(namespace) as collection:
+            await collection.delete_one({'key': key_hash})
+
+    async def delete_many(self, keys: Sequence[str]) -> None:
+        """Delete many values.
+
+        The keys of each namespace are deleted with a single ``$in`` query.
+
+        Parameters
+        ----------
+        keys : Sequence[str]
+            cache identifier keys.
+
+        """
+        self.logger.debug("Delete many 'keys=%s'", keys)
+
+        for namespace, hashes in self._group_by_namespace(keys).items():
+            with self._get_database_or_collection(namespace) as collection:
+                await collection.delete_many({'key': {'$in': hashes}})
@@ -1,9 +1,19 @@
 """Redis memory."""
 
 from datetime import timedelta
-from typing import Any, Dict
+from typing import Any, Dict, List, Sequence, Tuple
+from uuid import uuid4
 
 from ..abc import AsyncBackendABC, BackendABC
+from ..types import Value
+
+# Deletes a lease only if it is still owned by the caller
+RELEASE_LEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
 
 
 class RedisBackend(BackendABC):
@@ -16,8 +26,8 @@ class RedisBackend(BackendABC):
     kwargs : dict[str, Any]
         Takes the same constructor arguments as
         `redis.client.Redis.from_url`.
-        The ``decode_responses`` parameter will always be True
-        as the result needs to be returned as a string.
+        The ``decode_responses`` parameter will always be False, values
+        are returned as the bytes stored, with no decoding.
 
     """
 
@@ -32,8 +42,9 @@ class RedisBackend(BackendABC):
             ) from exc
 
         self._url = url
-        kwargs['decode_responses'] = True
+        kwargs['decode_responses'] = False
         self._backend = Redis.from_url(self._url, **kwargs)
+        self._lease_token = uuid4().hex
 
     def __repr__(self):
         """Creates a visual representation of the instance."""
@@ -62,14 +73,14 @@ class RedisBackend(BackendABC):
 
         self.logger.debug("No cache to 'key=%s'", key)
 
-    def set(self, key: str, value: str, expires_at: timedelta) -> None:
+    def set(self, key: str, value: Value, expires_at: timedelta) -> None:
         """Set a value with expires time.
 
         Parameters
         ----------
         key : str
             cache identifier key.
-        value : str
+        value : str | bytes
             value to cache encoded.
         expires_at : datetime.timedelta
             expiry time.
@@ -82,7 +93,7 @@ class RedisBackend(BackendABC):
             expires_at,
         )
 
-        self._backend.set(key, str(value), ex=expires_at)
+        self._backend.set(key, value, ex=expires_at)
 
     def clear(self, namespace: str) -> None:
         """Clear a namespace.
@@ -98,6 +109,116 @@ class RedisBackend(BackendABC):
         for key in self._backend.scan_iter(f'{namespace}:*'):
             self._backend.delete(key)
 
+    def acquire_lease(self, key: str, ttl: timedelta) -> bool:
+        """Acquire the lease to compute the value of a key.
+
+        The lease is an atomic ``SET NX PX`` on ``<key>:lease``.
+
+        Parameters
+        ----------
+        key : str
+            cache identifier key.
+        ttl : datetime.timedelta
+            lease expiry time.
+
+        Returns
+        -------
+        acquired : bool
+            If the lease was acquired.
+
+        """
+        self.logger.debug("Acquire lease 'key=%s', 'ttl=%s'", key, ttl)
+
+        return bool(
+            self._backend.set(
+                f'{key}:lease', self._lease_token, nx=True, px=ttl
+            )
+        )
+
+    def release_lease(self, key: str) -> None:
+        """Release a lease acquired by this backend.
+
+        Parameters
+        ----------
+        key : str
+            cache identifier key.
+
+        """
+        self.logger.debug("Release lease 'key=%s'", key)
+
+        self._backend.eval(
+            RELEASE_LEASE_SCRIPT, 1, f'{key}:lease', self._lease_token
+        )
+
+    def get_many(self, keys: Sequence[str]) -> List[Any]:
+        """Get many values if not expired.
+
+        The keys are read with a single ``MGET``.
+
+        Parameters
+        ----------
+        keys : Sequence[str]
+            cache identifier keys.
+
+        Returns
+        -------
+        values : list[Any]
+            Values cached in the order of the keys, ``None`` for the keys
+            that do not exist or expired.
+
+        """
+        self.logger.debug("Get many 'keys=%s'", keys)
+
+        if not keys:
+            return []
+        return self._backend.mget(keys)
+
+    def set_many(self, items: Sequence[Tuple[str, Value, timedelta]]) -> None:
+        """Set many values with expires time.
+
+        The values are written with a single pipeline, without a transaction.
+
+        Parameters
+        ----------
+        items : Sequence[tuple[str, str | bytes, datetime.timedelta]]
+            cache identifier key, value to cache encoded and expiry time of
+            each value.
+
+        """
+        self.logger.debug("Set many 'keys=%s'", [key for key, *_ in items])
+
+        with self._backend.pipeline(transaction=False) as pipeline:
+            for key, value, expires_at in items:
+                pipeline.set(key, value, ex=expires_at)
+            pipeline.execute()
+
+    def delete(self, key: str) -> None:
+        """Delete a value.
+
+        Parameters
+        ----------
+        key : str
+            cache identifier key.
+
+        """
+        self.logger.debug("Delete 'key=%s'", key)
+
+        self._backend.delete(key)
+
+    def delete_many(self, keys: Sequence[str]) -> None:
+        """Delete many values.
+
+        Parameters
+        ----------
+        keys : Sequence[str]
+            cache identifier keys.
+
+        """
+        self.logger.debug("Delete many 'keys=%s'", keys)
+
+        if keys:
+            self._backend.delete(*keys)
+
 
 class AsyncRedisBackend(AsyncBackendABC):
     """Async Redis backend.
@@ -111,8 +232,8 @@ class AsyncRedisBackend(AsyncBackendABC):
     kwargs : dict[str, Any]
         Takes the same constructor arguments as
         `redis.asyncio. client.Redis.from_url`.
-        The ``decode_responses`` parameter will always be True
-        as the result needs to be returned as a string.
+        The ``decode_responses`` parameter will always be False, values
+        are returned as the bytes stored, with no decoding.
 
     """
 
@@ -127,8 +248,9 @@ class AsyncRedisBackend(AsyncBackendABC):
             ) from exc
 
         self._url = url
-        kwargs['decode_responses'] = True
+        kwargs['decode_responses'] = False
         self._backend = Redis.from_url(self._url, **kwargs)
+        self._lease_token = uuid4().hex
 
     def __repr__(self):
         """Creates a visual representation of the instance."""
@@ -157,14 +279,14 @@ class AsyncRedisBackend(AsyncBackendABC):
 
         self.logger.debug("No cache to 'key=%s'", key)
 
-    async def set(self, key: str, value: str, expires_at: timedelta) -> None:
+    async def set(self, key: str, value: Value, expires_at: timedelta) -> None:
         """Set a value with expires time.
 
         Parameters
         ----------
         key : str
             cache identifier key.
-        value : str
+        value : str | bytes
             value to cache encoded.
         expires_at : datetime.timedelta
             expiry time.
@@ -177,7 +299,7 @@ class AsyncRedisBackend(AsyncBackendABC):
             expires_at,
         )
 
-        await self._backend.set(key, str(value), ex=expires_at)
+        await self._backend.set(key, value, ex=expires_at)
 
     async def clear(self, namespace: str) -> None:
         """Clear a namespace.
@@ -192,3 +314,115 @@ class AsyncRedisBackend(AsyncBackendABC):
 
         async for key in self._backend.scan_iter(f'{namespace}:*'):
             await self._backend.delete(key)
+
+    async def acquire_lease(self, key: str, ttl: timedelta) -> bool:
+        """Acquire the lease to compute the value of a key.
+
+        The lease is an atomic ``SET NX PX`` on ``<key>:lease``.
+
+        Parameters
+        ----------
+        key : str
+            cache identifier key.
+        ttl : datetime.timedelta
+            lease expiry time.
+
+        Returns
+        -------
+        acquired : bool
+            If the lease was acquired.
+
+        """
+        self.logger.debug("Acquire lease 'key=%s', 'ttl=%s'", key, ttl)
+
+        return bool(
+            await self._backend.set(
+                f'{key}:lease', self._lease_token, nx=True, px=ttl
+            )
+        )
+
+    async def release_lease(self, key: str) -> None:
+        """Release a lease acquired by this backend.
+
+        Parameters
+        ----------
+        key : str
+            cache identifier key.
+
+        """
+        self.logger.debug("Release lease 'key=%s'", key)
+
+        await self._backend.eval(
+            RELEASE_LEASE_SCRIPT, 1, f'{key}:lease', self._lease_token
+        )
+
+    async def get_many(self, keys: Sequence[str]) -> List[Any]:
+        """Get many values if not expired.
+
+        The keys are read with a single ``MGET``.
+
+        Parameters
+        ----------
+        keys : Sequence[str]
+            cache identifier keys.
+
+        Returns
+        -------
+        values : list[Any]
+            Values cached in the order of the keys, ``None`` for the keys
+            that do not exist or expired.
+
+        """
+        self.logger.debug("Get many 'keys=%s'", keys)
+
+        if not keys:
+            return []
+        return await self._backend.mget(keys)
+
+    async def set_many(
+        self, items: Sequence[Tuple[str, Value, timedelta]]
+    ) -> None:
+        """Set many values with expires time.
+
+        The values are written with a single pipeline, without a transaction.
+
+        Parameters
+        ----------
+        items : Sequence[tuple[str, str | bytes, datetime.timedelta]]
+            cache identifier key, value to cache encoded and expiry time of
+            each value.
+
+        """
+        self.logger.debug("Set many 'keys=%s'", [key for key, *_ in items])
+
+        async with self._backend.pipeline(transaction=False) as pipeline:
+            for key, value, expires_at in items:
+                pipeline.set(key, value, ex=expires_at)
+            await pipeline.execute()
+
+    async def delete(self, key: str) -> None:
+        """Delete a value.
+
+        Parameters
+        ----------
+        key : str
+            cache identifier key.
+
+        """
+        self.logger.debug("Delete 'key=%s'", key)
+
+        await self._backend.delete(key)
+
+    async def delete_many(self, keys: Sequence[str]) -> None:
+        """Delete many values.
+
+        Parameters
+        ----------
+        keys : Sequence[str]
+            cache identifier keys.
+
+        """
+        self.logger.debug("Delete many 'keys=%s'", keys)
+
+        if keys:
+            await self._backend.delete(*keys)
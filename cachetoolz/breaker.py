@@ -0,0 +1,145 @@
+"""Circuit breaker implementation."""
+
+import threading
+import time
+from collections import deque
+from datetime import timedelta
+from typing import Deque, Optional, Union
+
+
+def _seconds(value: Union[int, float, timedelta]) -> float:
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    return float(value)
+
+
+class CircuitBreaker:
+    """Stop calling a failing or slow backend for a while.
+
+    The breaker keeps the outcome of the last ``window`` calls. A call fails
+    when it raises or takes longer than ``slow_call``. Once the rate of failed
+    calls in a full window reaches ``error_rate`` the breaker opens and calls
+    are not allowed. After ``cooldown`` a single trial call is allowed, the
+    breaker closes if it succeeds and opens again otherwise.
+
+    Parameters
+    ----------
+    error_rate
+        Rate of failed calls, between 0 and 1, that opens the breaker
+    slow_call
+        Calls that take longer than this are failed calls
+    window
+        Number of recent calls to compute the rate of failed calls
+    cooldown
+        Time the breaker stays open before a trial call
+
+    Examples
+    --------
+    >>> breaker = CircuitBreaker(error_rate=0.5, window=2, cooldown=30)
+    >>> breaker.record(elapsed=0.01, error=True)
+    >>> breaker.record(elapsed=0.01)
+    >>> breaker.state
+    'open'
+    >>> breaker.allow()
+    False
+
+    """
+
+    def __init__(
+        self,
+        error_rate: float = 0.5,
+        slow_call: Union[int, float, timedelta] = 0.5,
+        window: int = 20,
+        cooldown: Union[int, float, timedelta] = 30,
+    ):
+        """Initialize the instance."""
+        if not 0 < error_rate <= 1:
+            raise ValueError(
+                f'error_rate must be between 0 and 1, got {error_rate!r}'
+            )
+        self.error_rate = error_rate
+        self.slow_call = _seconds(slow_call)
+        self.cooldown = _seconds(cooldown)
+        self._outcomes: Deque[bool] = deque(maxlen=window)
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Get the breaker state.
+
+        Returns
+        -------
+        state : str
+            ``'closed'``, ``'open'`` or ``'half_open'`` once the cooldown is
+            over and a trial call is allowed.
+
+        """
+        if (opened_at := self._opened_at) is None:
+            return 'closed'
+        if time.monotonic() - opened_at < self.cooldown:
+            return 'open'
+        return 'half_open'
+
+    def allow(self) -> bool:
+        """Check if a call is allowed.
+
+        A call allowed while the breaker is half open is the trial call,
+        its outcome must be recorded.
+
+        """
+        if self._opened_at is None:
+            return True
+
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._probing or self.state == 'open':
+                return False
+            self._probing = True
+            return True
+
+    def record(self, elapsed: float, error: bool = False) -> None:
+        """Record the outcome of an allowed call.
+
+        Parameters
+        ----------
+        elapsed : float
+            Seconds spent in the call.
+        error : bool
+            If the call raised.
+
+        """
+        failed = error or elapsed > self.slow_call
+
+        with self._lock:
+            if self._opened_at is not None:
+                # Calls allowed before the breaker opened are ignored
+                if not self._probing:
+                    return
+                self._probing = False
+                if failed:
+                    self._open()
+                else:
+                    self._close()
+                return
+
+            if len(self._outcomes) == self._outcomes.maxlen:
+                self._failures -= self._outcomes[0]
+            self._outcomes.append(failed)
+            self._failures += failed
+
+            calls = len(self._outcomes)
+            if calls == self._outcomes.maxlen:
+                if self._failures >= self.error_rate * calls:
+                    self._open()
+
+    def _open(self) -> None:
+        self._opened_at = time.monotonic()
+
+    def _close(self) -> None:
+        self._opened_at = None
+        self._outcomes.clear()
+        self._failures = 0
@@ -0,0 +1,152 @@
+"""Request coalescing implementation."""
+
+import asyncio
+import threading
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from .types import Func, P, T
+
+# Result of a call whose leader was cancelled, its followers call again
+RETRY = object()
+
+
+class _Call:
+    """In-flight call shared by the callers of a key."""
+
+    __slots__ = ('done', 'result', 'exception')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.exception: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Deduplicate concurrent synchronous calls by key.
+
+    Only the first caller of a key runs the function, the callers that
+    arrive while it is running wait for its result in their threads.
+
+    Examples
+    --------
+    >>> flight = SingleFlight()
+    >>> flight.do('key', sum, [1, 2])
+    3
+
+    """
+
+    def __init__(self):
+        """Initialize the instance."""
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def do(
+        self, key: Hashable, func: Func, *args: P.args, **kwargs: P.kwargs
+    ) -> T:
+        """Run a function once for all concurrent callers of a key.
+
+        Parameters
+        ----------
+        key
+            Call identifier
+        func
+            Function
+        args
+            Function positional arguments
+        kwargs
+            Named function arguments
+
+        Returns
+        -------
+            Function result, shared by all callers of the key
+
+        """
+        with self._lock:
+            if leader := (call := self._calls.get(key)) is None:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.exception is not None:
+                raise call.exception
+            return call.result
+
+        try:
+            call.result = func(*args, **kwargs)
+        except BaseException as exception:
+            call.exception = exception
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.result
+
+
+class AsyncSingleFlight:
+    """Deduplicate concurrent asynchronous calls by key.
+
+    Only the first caller of a key runs the function, the callers that
+    arrive while it is running await for its result. Calls are only shared
+    within the same event loop. If the first caller is cancelled, one of
+    the callers waiting runs the function instead.
+
+    Examples
+    --------
+    >>> flight = AsyncSingleFlight()
+    >>> await flight.do('key', asyncio.sleep, 0, 'result')
+    'result'
+
+    """
+
+    def __init__(self):
+        """Initialize the instance."""
+        self._calls: Dict[Tuple[int, Hashable], asyncio.Future] = {}
+
+    async def do(
+        self, key: Hashable, func: Func, *args: P.args, **kwargs: P.kwargs
+    ) -> T:
+        """Run a coroutine function once for all concurrent callers of a key.
+
+        Parameters
+        ----------
+        key
+            Call identifier
+        func
+            Coroutine function
+        args
+            Function positional arguments
+        kwargs
+            Named function arguments
+
+        Returns
+        -------
+            Function result, shared by all callers of the key
+
+        """
+        loop = asyncio.get_running_loop()
+        call_key = (id(loop), key)
+
+        while (future := self._calls.get(call_key)) is not None:
+            if (result := await asyncio.shield(future)) is not RETRY:
+                return result
+
+        future = self._calls[call_key] = loop.create_future()
+        try:
+            result = await func(*args, **kwargs)
+        except asyncio.CancelledError:
+            # Only the leader is cancelled, the followers call again
+            future.set_result(RETRY)
+            raise
+        except BaseException as exception:
+            future.set_exception(exception)
+            # Avoid "exception was never retrieved" without waiters
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            del self._calls[call_key]
+
+        return result
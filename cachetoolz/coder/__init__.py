@@ -1,21 +1,33 @@
 """Module interface."""
 
-import json
 from inspect import isclass
 from typing import Any, Dict, Type, Union
 
 from ..abc import CoderABC, SerializerABC
 from ..exceptions import RegistryError
+from ..types import Value
 from ..utils import decoder_name
+from .binary import PickleCoder
+from .compress import CompressedCoder
 from .decoder import Decoder
 from .decoder import register as decoder_register
 from .encoder import Encoder
 from .encoder import register as encoder_register
 
+__all__ = ('Coder', 'CompressedCoder', 'PickleCoder', 'coder')
+
 
 class Coder(CoderABC):
     """Coder class."""
 
+    def __init__(self):
+        """Initialize the instance."""
+        # The JSON encoder and decoder are stateless, building one per call
+        # dominates small values. Registered coders are looked up on every
+        # encode and decode
+        self._decoder = Decoder()
+        self._encoder = Encoder()
+
     def encode(self, value: Any) -> str:
         """Encode value.
 
@@ -30,15 +42,15 @@ class Coder(CoderABC):
             Value encoded.
 
         """
-        return json.dumps(value, cls=Encoder)
+        return self._encoder.encode(value)
 
-    def decode(self, value: str) -> Dict[str, Any]:
+    def decode(self, value: Value) -> Dict[str, Any]:
         """Decode value.
 
         Parameters
         ----------
-        value : Any
-            Value to decode.
+        value : str | bytes
+            Value to decode, bytes are UTF-8 encoded JSON.
 
         Returns
         -------
@@ -46,7 +58,9 @@ class Coder(CoderABC):
             Value decoded.
 
         """
-        return json.loads(value, cls=Decoder)
+        if isinstance(value, bytes):
+            value = value.decode()
+        return self._decoder.decode(value)
 
     @staticmethod
     def register(serializer: Union[Type[SerializerABC], SerializerABC]):
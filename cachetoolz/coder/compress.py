@@ -0,0 +1,173 @@
+"""Compressed coder implementation."""
+
+import bz2
+import lzma
+import threading
+import time
+import zlib
+from functools import partial
+from typing import Any, Callable, Dict, Optional, Union
+
+from ..abc import CoderABC
+from ..types import Value
+
+# Compressed values start with this byte and the algorithm id, the values of
+# the wrapped coder that start with it are stored with the ``none`` id
+HEADER = b'\x01'
+
+# Algorithm id and name of its level parameter
+ALGORITHMS = {
+    'zlib': (b'z', 'level'),
+    'lzma': (b'x', 'preset'),
+    'bz2': (b'b', 'compresslevel'),
+}
+
+COMPRESSORS: Dict[bytes, Callable[..., bytes]] = {
+    b'z': zlib.compress,
+    b'x': lzma.compress,
+    b'b': bz2.compress,
+}
+
+DECOMPRESSORS: Dict[bytes, Callable[[bytes], bytes]] = {
+    b'z': zlib.decompress,
+    b'x': lzma.decompress,
+    b'b': bz2.decompress,
+    b'n': bytes,
+}
+
+
+class CompressedCoder(CoderABC):
+    """Compress the values of another coder.
+
+    The values encoded above ``threshold`` bytes are compressed when it makes
+    them smaller. A two bytes header marks the compressed values, so values
+    stored with any algorithm, or without compression, are decoded.
+
+    Parameters
+    ----------
+    coder
+        Coder of the values, it must decode the bytes of the values it
+        encodes as strings, like the JSON and pickle coders
+    algorithm
+        ``'zlib'``, ``'lzma'`` or ``'bz2'``
+    threshold
+        Minimum size in bytes of the values compressed
+    level
+        Compression level of the algorithm, its default if not set
+
+    Examples
+    --------
+    >>> from cachetoolz import Cache, RedisBackend
+    >>> from cachetoolz.coder import CompressedCoder, coder
+    >>> cache = Cache(RedisBackend(), coder=CompressedCoder(coder))
+
+    """
+
+    def __init__(
+        self,
+        coder: CoderABC,
+        algorithm: str = 'zlib',
+        threshold: int = 1024,
+        level: Optional[int] = None,
+    ):
+        """Initialize the instance."""
+        if algorithm not in ALGORITHMS:
+            raise ValueError(
+                f'algorithm must be one of {", ".join(ALGORITHMS)}, '
+                f'got {algorithm!r}'
+            )
+
+        self.coder = coder
+        self.threshold = threshold
+        self._id, level_name = ALGORITHMS[algorithm]
+        self._compress = COMPRESSORS[self._id]
+        if level is not None:
+            self._compress = partial(self._compress, **{level_name: level})
+        self._lock = threading.Lock()
+        self._count = 0
+        self._size = 0
+        self._compressed_size = 0
+        self._compress_time = 0.0
+        self._decompress_time = 0.0
+
+    @property
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """Get the compression counters.
+
+        Returns
+        -------
+        stats : dict[str, int | float]
+            ``compression_count`` is the number of values compressed and
+            ``compression_ratio`` their size divided by their compressed
+            size. ``compression_cpu_seconds`` and
+            ``decompression_cpu_seconds`` are the CPU time spent.
+
+        """
+        with self._lock:
+            return {
+                'compression_count': self._count,
+                'compression_ratio': self._size / (self._compressed_size or 1),
+                'compression_cpu_seconds': self._compress_time,
+                'decompression_cpu_seconds': self._decompress_time,
+            }
+
+    def encode(self, value: Any) -> Value:
+        """Encode and compress value.
+
+        Parameters
+        ----------
+        value : Any
+            Value to encode.
+
+        Returns
+        -------
+        encoded : str | bytes
+            Value encoded, bytes with the header if it was compressed.
+
+        """
+        encoded = self.coder.encode(value)
+        data = encoded.encode() if isinstance(encoded, str) else encoded
+
+        if len(data) >= self.threshold:
+            if compressed := self._compressed(data):
+                return compressed
+
+        if data.startswith(HEADER):
+            return HEADER + b'n' + data
+        return encoded
+
+    def _compressed(self, data: bytes) -> Optional[bytes]:
+        start = time.thread_time()
+        compressed = HEADER + self._id + self._compress(data)
+        elapsed = time.thread_time() - start
+
+        smaller = len(compressed) < len(data)
+        with self._lock:
+            self._compress_time += elapsed
+            if smaller:
+                self._count += 1
+                self._size += len(data)
+                self._compressed_size += len(compressed)
+        return compressed if smaller else None
+
+    def decode(self, value: Value) -> Any:
+        """Decompress and decode value.
+
+        Parameters
+        ----------
+        value : str | bytes
+            Value to decode.
+
+        Returns
+        -------
+        decoded : Any
+            Value decoded.
+
+        """
+        if isinstance(value, bytes) and value.startswith(HEADER):
+            start = time.thread_time()
+            value = DECOMPRESSORS[value[1:2]](value[2:])
+            elapsed = time.thread_time() - start
+            with self._lock:
+                self._decompress_time += elapsed
+        return self.coder.decode(value)
@@ -2,6 +2,7 @@
 
 import json
 import re
+from base64 import b64decode
 from collections import deque
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal
@@ -15,13 +16,30 @@ from ipaddress import (
 )
 from json import JSONDecoder
 from pathlib import Path
-from typing import Any, ClassVar, Dict
+from typing import Any, ClassVar, Dict, Union
 from uuid import UUID
 
 from .. import types
 from ..exceptions import RegistryError, UnknownDecoderError
 
 
+def decode_bytes(value: Union[str, Dict[str, str]]) -> bytes:
+    """Decode bytes encoded in base64.
+
+    Bytes encoded by previous versions, as text with its encoding, are
+    decoded as well.
+
+    Parameters
+    ----------
+    value
+        Base64 text, or a dict with the ``bytes`` text and its ``encoding``
+
+    """
+    if isinstance(value, dict):
+        return value['bytes'].encode(value['encoding'])
+    return b64decode(value)
+
+
 class Decoder(JSONDecoder):
     """JSON decoder class."""
 
@@ -41,11 +59,12 @@ class Decoder(JSONDecoder):
         'ipv6network': IPv6Network,
         'set': set,
         'frozenset': frozenset,
-        'bytes': lambda val: val['bytes'].encode(val['encoding']),
+        'bytes': decode_bytes,
         'deque': lambda val: deque(val['iterable'], val['maxlen']),
         'pattern': lambda val: re.compile(
             json.loads(val['pattern']), val['flags']
         ),
+        'cachederror': lambda val: types.CachedError(**val),
     }
 
     def __init__(self, **kwargs):
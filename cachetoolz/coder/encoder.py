@@ -2,6 +2,7 @@
 
 import json
 import re
+from base64 import b64encode
 from collections import deque
 from collections.abc import Set
 from datetime import date, datetime, time, timedelta
@@ -17,6 +18,7 @@ from ipaddress import (
 )
 from json import JSONEncoder
 from pathlib import PosixPath
+from typing import Dict, Sequence
 from uuid import UUID
 
 try:
@@ -24,13 +26,19 @@ try:
 except ImportError:
     from get_annotations import get_annotations
 
-from charset_normalizer import detect
-from funcy import walk
-
 from .. import types
 from ..exceptions import RegistryError, UnknownEncoderError
 from ..utils import decoder_name
 
+# Types encoded by the JSON encoder itself
+NATIVE_TYPES = frozenset(
+    {str, int, float, bool, type(None), list, tuple, dict}
+)
+
+# Encoder of each exact type, ``encode`` walks the MRO of unseen types.
+# Cleared when an encoder is registered
+_encoders: Dict[type, types.Encoder] = {}
+
 
 class Encoder(JSONEncoder):
     """JSON encoder class."""
@@ -44,7 +52,55 @@ class Encoder(JSONEncoder):
             Python object
 
         """
-        return encode(o)
+        return dispatch(type(o))(o)
+
+    def encode(self, o) -> str:
+        """Return a JSON string of a python object.
+
+        Parameters
+        ----------
+        o
+            Python object
+
+        """
+        if type(o) is list or type(o) is tuple:
+            o = encode_items(o)
+        return super().encode(o)
+
+
+def dispatch(cls: type) -> types.Encoder:
+    """Get the encoder of a type.
+
+    Parameters
+    ----------
+    cls
+        Exact type of the values
+
+    """
+    try:
+        return _encoders[cls]
+    except KeyError:
+        func = _encoders[cls] = encode.dispatch(cls)
+        return func
+
+
+def encode_items(values: Sequence) -> Sequence:
+    """Encode the items of a sequence of a single registered type.
+
+    Any other sequence is returned as is, its items of native types are
+    encoded by the JSON encoder and the others by ``Encoder.default``.
+
+    Parameters
+    ----------
+    values
+        Sequence of python objects
+
+    """
+    if values and type(values[0]) not in NATIVE_TYPES:
+        if len(set(map(type, values))) == 1:
+            func = dispatch(type(values[0]))
+            return [func(value) for value in values]
+    return values
 
 
 def register(name: str) -> types.Decorator:
@@ -79,6 +135,7 @@ def register(name: str) -> types.Decorator:
         encode.register(_type)(
             lambda value: {'__val': func(value), '__decoder': name}
         )
+        _encoders.clear()
         return func
 
     return wrapper
@@ -111,7 +168,7 @@ def _(value):
 @encode.register
 def _(value: Set) -> types.Encoded:
     return {
-        '__val': walk(encode, list(value)),
+        '__val': encode_items(list(value)),
         '__decoder': decoder_name(value),
     }
 
@@ -125,7 +182,7 @@ def _(value: timedelta) -> types.Encoded:
 def _(value: deque) -> types.Encoded:
     return {
         '__val': {
-            'iterable': walk(encode, list(value)),
+            'iterable': encode_items(list(value)),
             'maxlen': value.maxlen,
         },
         '__decoder': decoder_name(value),
@@ -140,11 +197,18 @@ def _(value: re.Pattern) -> types.Encoded:
     }
 
 
+@encode.register
+def _(value: types.CachedError) -> types.Encoded:
+    return {
+        '__val': {'name': value.name, 'args': value.args},
+        '__decoder': decoder_name(value),
+    }
+
+
 @encode.register
 def _(value: bytes) -> types.Encoded:
-    encoding = detect(value).get('encoding', 'utf-8')
     return {
-        '__val': {'bytes': value.decode(encoding), 'encoding': encoding},
+        '__val': b64encode(value).decode(),
         '__decoder': decoder_name(value),
     }
 
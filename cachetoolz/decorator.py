@@ -1,17 +1,208 @@
 """Decorator module."""
 
 import asyncio
+import contextvars
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from copy import copy, deepcopy
+from dataclasses import dataclass, replace
 from datetime import timedelta
-from math import inf, isinf
-from typing import Optional, Sequence, Union
+from functools import partial, wraps
+from math import inf
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 from funcy import autocurry as curry
 
-from .abc import AsyncBackendABC, BackendABC
-from .coder import coder
+from .abc import AsyncBackendABC, BackendABC, CoderABC
+from .breaker import CircuitBreaker
+from .coalesce import AsyncSingleFlight, SingleFlight
+from .coder import coder as default_coder
+from .entry import Entry, is_packed, pack, unpack
+from .exceptions import UnknownEncoderError
+from .keygen import code_fingerprint
+from .loader import BatchLoader
 from .log import get_logger
-from .types import Decorator, Func, KeyGenerator, P, T
-from .utils import ensure_async, make_key, manipulate
+from .types import CachedError, Decorator, Func, KeyGenerator, P, T, Value
+from .utils import (
+    BlockingProxy,
+    EventLoopThread,
+    ensure_async,
+    key_function,
+    manipulate,
+    to_timedelta,
+)
+from .writer import AsyncWriteBehind, Write, WriteBehind
+
+# Seconds between the reads of callers waiting for a lease holder
+LEASE_POLL_INTERVAL = 0.05
+
+# Copies of the computed value returned on a miss, instead of decoding it
+MISS_COPIES = {
+    'none': lambda value: value,
+    'shallow': copy,
+    'deep': deepcopy,
+}
+
+# Computed value not available, it must be decoded
+MISSING = object()
+
+# Backend not available, the function is called without caching
+BYPASS = object()
+
+
+def error_name(error: Type[BaseException]) -> str:
+    """Get the qualified name of an exception class.
+
+    Parameters
+    ----------
+    error
+        Exception class
+
+    """
+    return f'{error.__module__}.{error.__qualname__}'
+
+
+def encode_error(
+    exception: BaseException, coder: CoderABC = default_coder
+) -> Value:
+    """Encode an exception to be cached.
+
+    The exception arguments that can not be encoded are replaced by the
+    exception message.
+
+    Parameters
+    ----------
+    exception
+        Exception to encode
+    coder
+        Coder of the cached values
+
+    """
+    name = error_name(type(exception))
+    try:
+        return coder.encode(CachedError(name=name, args=list(exception.args)))
+    except (Exception, UnknownEncoderError):
+        return coder.encode(CachedError(name=name, args=[str(exception)]))
+
+
+@dataclass(frozen=True)
+class CacheOptions:
+    """Options of a cached function.
+
+    Attributes
+    ----------
+    ttl : datetime.timedelta
+        cache ttl (time to live)
+    namespace : str
+        namespace to cache
+    keygen : Optional[cachetoolz.types.KeyGenerator]
+        function to generate a cache identifier key, the default key
+        generator is used if None
+    typed : bool
+        If arguments of different types are cached separately
+    key_args : Optional[tuple[str, ...]]
+        names of the only arguments in the key, all of them if None
+    ignore_args : tuple[str, ...]
+        names of the arguments left out of the key
+    key_cache : int
+        number of keys of recent arguments kept in memory, keys are not
+        kept if 0
+    version : Optional[str]
+        version of the function in its keys, ``'auto'`` for a fingerprint
+        of its code, keys are not versioned if None
+    coalesce : bool
+        If concurrent misses of the same key share a single call
+    lease_ttl : Optional[datetime.timedelta]
+        expiry time of the backend lease to compute a missing key, no lease
+        is used if None
+    lease_wait : datetime.timedelta
+        maximum time to wait for the value computed by the lease holder
+    stale_ttl : Optional[datetime.timedelta]
+        time after the ttl during which the stale value is returned while
+        it is refreshed in background, values are not kept stale if None
+    early_recompute : Optional[float]
+        XFetch factor to refresh values before their ttl, values are only
+        refreshed after the ttl if None
+    miss_copy : Optional[Callable[[Any], Any]]
+        copy of the computed value returned on a miss, the encoded value is
+        decoded if None
+    write_behind : bool
+        If computed values are written to the backend in background
+    cache_errors : tuple[type[BaseException], ...]
+        exceptions raised by the function that are cached
+    error_ttl : datetime.timedelta
+        cache ttl of the exceptions
+
+    """
+
+    ttl: timedelta
+    namespace: str
+    keygen: Optional[KeyGenerator]
+    typed: bool
+    key_args: Optional[Tuple[str, ...]]
+    ignore_args: Tuple[str, ...]
+    key_cache: int
+    version: Optional[str]
+    coalesce: bool
+    lease_ttl: Optional[timedelta]
+    lease_wait: timedelta
+    stale_ttl: Optional[timedelta]
+    early_recompute: Optional[float]
+    miss_copy: Optional[Callable[[Any], Any]]
+    write_behind: bool
+    cache_errors: Tuple[Type[BaseException], ...]
+    error_ttl: timedelta
+
+    @property
+    def error_types(self) -> Dict[str, Type[BaseException]]:
+        """Get the cached exception types by qualified name."""
+        return {error_name(error): error for error in self.cache_errors}
+
+    @property
+    def with_metadata(self) -> bool:
+        """If entries are stored with their metadata."""
+        return self.stale_ttl is not None or self.early_recompute is not None
+
+
+@dataclass(frozen=True)
+class BatchOptions:
+    """Options of a batch cached function.
+
+    Attributes
+    ----------
+    ttl : datetime.timedelta
+        cache ttl (time to live) of each item
+    namespace : str
+        namespace to cache
+    keygen : Optional[cachetoolz.types.KeyGenerator]
+        function to generate a cache identifier key, the default key
+        generator is used if None
+    typed : bool
+        If arguments of different types are cached separately
+
+    """
+
+    ttl: timedelta
+    namespace: str
+    keygen: Optional[KeyGenerator]
+    typed: bool
 
 
 class Cache:
@@ -25,6 +216,21 @@ class Cache:
     ----------
     backend
         Cache backend
+    write_queue_size
+        Maximum number of writes queued by ``write_behind`` functions, more
+        writes are dropped
+    breaker
+        Circuit breaker of the backend reads. While it is open, the
+        functions are called without reading or writing the backend
+    get_timeout
+        Maximum time to wait for a backend read, slower reads are abandoned
+        and the function is called without caching
+    batch_window
+        If set, the reads of asynchronous functions issued within this many
+        seconds are sent as a single ``get_many``
+    coder
+        Coder of the cached values. ``cachetoolz.coder.PickleCoder`` encodes
+        any picklable object without registered serializers
 
     Examples
     --------
@@ -37,6 +243,10 @@ class Cache:
     >>> from cachetoolz import RedisBackend, Cache
     >>> cache = Cache(RedisBackend())
 
+    With the pickle coder
+    >>> from cachetoolz.coder import PickleCoder
+    >>> cache = Cache(RedisBackend(), coder=PickleCoder(allow=['myapp']))
+
 
     # @cache
     Decorator for caching a function call.
@@ -52,6 +262,55 @@ class Cache:
         will be cached separately
     keygen : Optional[cachetoolz.types.KeyGenerator], default=None
         function to generate a cache identifier key
+    key_args : Optional[Sequence[str]], default=None
+        Names of the only arguments in the key, e.g. ``['user_id']``. The
+        key generator is called with them by name
+    ignore_args : Sequence[str], default=()
+        Names of the arguments left out of the key, e.g. ``['self']`` so
+        the instances of a class share their values
+    key_cache : int, default=0
+        If set, the keys of this many recent hashable arguments are kept in
+        memory instead of built again. Like ``functools.lru_cache``, equal
+        arguments of different types are only told apart at the top level.
+        Asynchronous key generators are not kept
+    version : Optional[str | int], default=None
+        If set, the version is part of the keys, so the values of previous
+        versions are no longer read and expire on their own. ``'auto'``
+        uses a fingerprint of the function bytecode, computed once
+    coalesce : bool, default=True
+        If set to true, concurrent calls that miss the same key wait for
+        the first one instead of calling the function again
+    lease_ttl : Optional[int | float | timedelta], default=None
+        If set, a miss only calls the function after acquiring a backend
+        lease on the key, which is shared by all processes using the
+        backend. Callers without the lease wait for the value
+    lease_wait : int | float | timedelta, default=1
+        maximum time to wait for the lease holder before calling the
+        function anyway
+    stale_ttl : Optional[int | float | timedelta], default=None
+        If set, the value is kept for this time after the ttl. A stale value
+        is returned right away while a single background call refreshes it.
+        Synchronous functions are refreshed in a thread pool
+    early_recompute : Optional[float], default=None
+        If set, a value may be refreshed in background before its ttl, with a
+        probability that rises as the ttl gets closer and with the time spent
+        computing it (XFetch). It spreads the refreshes of keys written at the
+        same time. ``1.0`` is a good default, higher values refresh earlier
+    miss_copy : Optional[str], default=None
+        By default a miss returns the value decoded from its encoded form,
+        exactly as a hit would. Set it to return the computed value itself,
+        without decoding it: ``'none'`` returns the same object, ``'shallow'``
+        and ``'deep'`` return a copy of it, so changes to the returned object
+        do not leak to other callers that share the same computation
+    write_behind : bool, default=False
+        If set to true, a miss returns without waiting for the backend write.
+        The write is queued to a bounded background writer that sends it in
+        batches, writes are dropped when the queue is full
+    cache_errors : tuple[type[BaseException], ...], default=()
+        Exceptions raised by the function that are cached. While cached, the
+        calls raise an equivalent exception without calling the function
+    error_ttl : int | float | timedelta, default=5
+        cache ttl of the exceptions
 
     Examples
     --------
@@ -80,6 +339,55 @@ class Cache:
     ...     ...
     ...
 
+    Return the stale value for up to 5 minutes while it is refreshed
+    >>> @cache(ttl=60, stale_ttl=300)
+    ... def func(*args, **kwargs):
+    ...     ...
+    ...
+
+    Refresh values before they expire to avoid synchronized misses
+    >>> @cache(ttl=60, early_recompute=1.0)
+    ... def func(*args, **kwargs):
+    ...     ...
+    ...
+
+    Return the computed object itself on a miss instead of decoding it
+    >>> @cache(miss_copy='shallow')
+    ... def func(*args, **kwargs):
+    ...     ...
+    ...
+
+    Do not wait for the backend write on a miss
+    >>> @cache(write_behind=True)
+    ... def func(*args, **kwargs):
+    ...     ...
+    ...
+
+    Stop reading the values of a previous version of the function
+    >>> @cache(version='auto')
+    ... def func(*args, **kwargs):
+    ...     ...
+    ...
+
+    Share the values of a method between instances
+    >>> class Repository:
+    ...     @cache(ignore_args=['self', 'session'])
+    ...     def get(self, session, user_id):
+    ...         ...
+    ...
+
+    Cache timeouts for 5 seconds to protect a failing upstream
+    >>> @cache(cache_errors=(TimeoutError,), error_ttl=5)
+    ... def func(*args, **kwargs):
+    ...     ...
+    ...
+
+    Only one process recomputes an expired key
+    >>> @cache(ttl=60, lease_ttl=10, lease_wait=2)
+    ... def func(*args, **kwargs):
+    ...     ...
+    ...
+
     Differentiate caching based on argument types
     >>> @cache(typed=True)
     ... def func(*args, **kwargs):
@@ -117,41 +425,687 @@ class Cache:
 
     """
 
-    def __init__(self, backend: Union[AsyncBackendABC, BackendABC]):
+    def __init__(
+        self,
+        backend: Union[AsyncBackendABC, BackendABC],
+        write_queue_size: int = 1000,
+        breaker: Optional[CircuitBreaker] = None,
+        get_timeout: Optional[Union[int, float, timedelta]] = None,
+        batch_window: Optional[float] = None,
+        coder: CoderABC = default_coder,
+    ):
         """Initialize the cache instance.
 
         Parameters
         ----------
         backend
             Cache backend
+        write_queue_size
+            Maximum number of writes queued by ``write_behind`` functions
+        breaker
+            Circuit breaker of the backend reads. While it is open, the
+            functions are called without reading or writing the backend
+        get_timeout
+            Maximum time to wait for a backend read, slower reads are
+            abandoned and the function is called without caching
+        batch_window
+            If set, the reads of asynchronous functions issued within this
+            many seconds are sent as a single ``get_many``. ``0`` batches the
+            reads issued in the same event loop iteration
+        coder
+            Coder of the cached values, the JSON coder by default
 
         """
         self.backend = backend
+        self.coder = coder
+        self.breaker = breaker
+        self._get_timeout = None
+        if get_timeout is not None:
+            self._get_timeout = to_timedelta(get_timeout).total_seconds()
+        # Reads that go through the breaker and timeout guard
+        self._guarded = breaker is not None or get_timeout is not None
         self._logger = get_logger()
+        self._loop = EventLoopThread()
+        self._async_backend = asyncio.iscoroutinefunction(backend.get)
+        # Synchronous functions reach async backends through a long-lived
+        # loop thread, so clients bound to the loop are reused across calls
+        self._blocking = backend
+        if self._async_backend:
+            self._blocking = BlockingProxy(backend, self._loop)
+        self._writer = WriteBehind(self._write, write_queue_size)
+        # Asynchronous functions write to async backends from their own loop
+        self._async_writer = AsyncWriteBehind(
+            self._write_async, write_queue_size
+        )
+        self._flight = AsyncSingleFlight()
+        self._sync_flight = SingleFlight()
+        self._refreshing: Set[str] = set()
+        self._refreshing_lock = threading.Lock()
+        self._tasks: Set[asyncio.Task] = set()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._get_executor: Optional[ThreadPoolExecutor] = None
+        self._loader: Optional[BatchLoader] = None
+        self._key_caches: List[Callable[[], Any]] = []
+        if batch_window is not None:
+            self._loader = BatchLoader(self._get_many, batch_window)
+
+    @property
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """Get the cache counters.
+
+        Returns
+        -------
+        stats : dict[str, int | float]
+            ``write_behind_dropped`` is the number of writes dropped because
+            the write behind queue was full and ``write_behind_pending`` the
+            number of queued writes. ``key_cache_hits`` and
+            ``key_cache_misses`` count the keys found and built by the
+            ``key_cache`` of all the functions, ``key_cache_hit_ratio`` is
+            the ratio of keys found. The counters of a coder with ``stats``,
+            like ``CompressedCoder``, are included as well.
+
+        """
+        infos = [cache_info() for cache_info in self._key_caches]
+        hits = sum(info.hits for info in infos)
+        misses = sum(info.misses for info in infos)
+        return {
+            'write_behind_dropped': (
+                self._writer.dropped + self._async_writer.dropped
+            ),
+            'write_behind_pending': (
+                self._writer.pending + self._async_writer.pending
+            ),
+            'key_cache_hits': hits,
+            'key_cache_misses': misses,
+            'key_cache_hit_ratio': hits / (hits + misses or 1),
+            **getattr(self.coder, 'stats', {}),
+        }
+
+    def flush(self) -> None:
+        """Wait until the writes queued by ``write_behind`` are done.
 
-    async def _cache(
+        The writes of asynchronous functions to an async backend are sent by
+        their event loop, ``aflush`` waits for them.
+
+        """
+        self._writer.flush()
+
+    async def aflush(self) -> None:
+        """Wait until the writes queued by ``write_behind`` are done.
+
+        The writes queued by asynchronous functions in the running event
+        loop are waited for, along with those of the writer thread.
+
+        """
+        await self._async_writer.flush()
+        await asyncio.get_running_loop().run_in_executor(
+            None, self._writer.flush
+        )
+
+    def close(self) -> None:
+        """Stop the threads used by synchronous functions and write behind.
+
+        Pending background refreshes and writes are waited for. The
+        threads are started again if the cache is used afterwards.
+
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self._get_executor is not None:
+            # Reads still running were abandoned by their callers
+            self._get_executor.shutdown(wait=False)
+            self._get_executor = None
+        self._writer.close()
+        self._loop.close()
+
+    def _write(self, writes: List[Write]) -> None:
+        # Errors are logged by the writer with the keys of the batch
+        self._blocking.set_many(writes)
+
+    async def _write_async(self, writes: List[Write]) -> None:
+        await self.backend.set_many(writes)
+
+    def _entry(
+        self, options: CacheOptions, value: Value, delta: float
+    ) -> Tuple[Value, timedelta]:
+        if not options.with_metadata:
+            return value, options.ttl
+
+        fresh_until = time.time() + options.ttl.total_seconds()
+        entry = Entry(value=value, fresh_until=fresh_until, delta=delta)
+        return pack(entry), options.ttl + (options.stale_ttl or timedelta())
+
+    def _result(self, options: CacheOptions, computed: Tuple[Value, Any]) -> T:
+        encoded, value = computed
+        if options.miss_copy is None or value is MISSING:
+            return self.coder.decode(encoded)
+        return options.miss_copy(value)
+
+    def _raise_cached(self, options: CacheOptions, error: CachedError) -> None:
+        # Errors of types that are no longer cached are treated as misses
+        if (error_type := options.error_types.get(error.name)) is None:
+            return
+        try:
+            exception = error_type(*error.args)
+        except Exception:
+            return
+        raise exception
+
+    def _is_fresh(self, options: CacheOptions, entry: Entry) -> bool:
+        return entry.is_fresh(time.time(), options.early_recompute or 0.0)
+
+    def _spawn(self, coroutine: Coroutine) -> None:
+        # Tasks are referenced until done so they are not garbage collected
+        task = asyncio.ensure_future(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _submit(self, func: Func, *args: P.args, **kwargs: P.kwargs) -> None:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                thread_name_prefix='cachetoolz-refresh'
+            )
+        # Keep the caller context variables in the worker thread
+        context = contextvars.copy_context()
+        self._executor.submit(context.run, func, *args, **kwargs)
+
+    def _claim_refresh(self, key: str) -> bool:
+        with self._refreshing_lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def _release_refresh(self, key: str) -> None:
+        with self._refreshing_lock:
+            self._refreshing.discard(key)
+
+    def _submit_read(self, method: str, *args: Any) -> Future:
+        if self._get_executor is None:
+            self._get_executor = ThreadPoolExecutor(
+                thread_name_prefix='cachetoolz-get'
+            )
+        return self._get_executor.submit(getattr(self.backend, method), *args)
+
+    def _record(self, start: float, error: bool) -> None:
+        if self.breaker is not None:
+            self.breaker.record(time.perf_counter() - start, error)
+
+    async def _get_many(self, keys: List[str]) -> List[Any]:
+        return await ensure_async(self.backend.get_many, keys)
+
+    def _reader(self, method: str, *args: Any) -> Awaitable:
+        if self._loader is not None and method == 'get':
+            return self._loader.load(*args)
+        if self._async_backend or self._get_timeout is None:
+            return ensure_async(getattr(self.backend, method), *args)
+        # Synchronous reads run in a thread so they can be abandoned
+        return asyncio.wrap_future(self._submit_read(method, *args))
+
+    async def _read(self, method: str, *args: Any) -> Any:
+        read = self._reader(method, *args)
+        if self._get_timeout is None:
+            return await read
+        return await asyncio.wait_for(read, self._get_timeout)
+
+    async def _get(self, method: str, key: Any) -> Any:
+        if self.breaker is not None and not self.breaker.allow():
+            return BYPASS
+
+        start = time.perf_counter()
+        try:
+            result = await self._read(method, key)
+        except BaseException as exception:
+            self._record(start, error=True)
+            if not isinstance(exception, Exception):
+                raise
+            return self._read_error(key, exception)
+        self._record(start, error=False)
+        return result
+
+    def _compile(self, options: CacheOptions) -> Decorator:
+        def wrapper(func: Func) -> Func:
+            if asyncio.iscoroutinefunction(func):
+                return wraps(func)(self._compile_async(options, func))
+            return wraps(func)(self._compile_sync(options, func))
+
+        return wrapper
+
+    def _key_function(
         self,
-        ttl: timedelta,
-        keygen: KeyGenerator,
+        options: CacheOptions,
+        func: Func,
+        run: Optional[Callable[..., Any]] = None,
+    ) -> Callable[..., Any]:
+        key_of = key_function(
+            options.namespace,
+            options.keygen,
+            options.typed,
+            func,
+            run=run,
+            key_args=options.key_args,
+            ignore_args=options.ignore_args,
+            version=(
+                code_fingerprint(func)
+                if options.version == 'auto'
+                else options.version
+            ),
+            key_cache=options.key_cache,
+        )
+        if (cache_info := getattr(key_of, 'cache_info', None)) is not None:
+            self._key_caches.append(cache_info)
+        return key_of
+
+    def _compile_async(self, options: CacheOptions, func: Func) -> Func:
+        # Everything known at decoration time is resolved once, so a hit
+        # only builds the key, reads it and decodes the value
+        key_of = self._key_function(options, func)
+        async_key = asyncio.iscoroutinefunction(key_of)
+        read, async_read = self._hit_reader()
+        hit, load = self._hit, self._load
+
+        async def cached(*args: P.args, **kwargs: P.kwargs) -> T:
+            key = key_of(*args, **kwargs)
+            if async_key:
+                key = await key
+            try:
+                result = read(key)
+                if async_read:
+                    result = await result
+            except Exception as exception:
+                result = self._read_error(key, exception)
+
+            if result is BYPASS:
+                return await func(*args, **kwargs)
+            value = hit(options, key, result, func, *args, **kwargs)
+            if value is MISSING:
+                return await load(options, key, func, *args, **kwargs)
+            return value
+
+        return cached
+
+    def _hit_reader(self) -> Tuple[Callable[[str], Any], bool]:
+        # The backend is read directly when there is nothing to apply
+        if self._guarded or self._loader is not None:
+            return partial(self._get, 'get'), True
+        return self.backend.get, self._async_backend
+
+    def _read_error(self, key: Any, exception: Exception) -> Any:
+        self._logger.error(
+            "Error to get cache 'key=%s': exception=%s", key, exception
+        )
+        return BYPASS
+
+    def _decode_hit(self, options: CacheOptions, value: Value) -> Any:
+        if not isinstance(value := self.coder.decode(value), CachedError):
+            return value
+        # Raises the cached error, unless it must be recomputed
+        self._raise_cached(options, value)
+        return MISSING
+
+    def _waited(
+        self, options: CacheOptions, result: Value
+    ) -> Optional[Tuple[Value, Any]]:
+        # The lease holder may have cached an error, it is raised like a hit.
+        # Errors that must be recomputed leave the waiter to compute
+        value = unpack(result).value
+        if self._decode_hit(options, value) is MISSING:
+            return None
+        return value, MISSING
+
+    def _hit(
+        self,
+        options: CacheOptions,
+        key: str,
+        result: Optional[str],
+        func: Func,
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Any:
+        if result is None:
+            return MISSING
+        # Only entries stored with their metadata can be stale
+        if is_packed(result):
+            entry = unpack(result)
+            if not self._is_fresh(options, entry) and self._claim_refresh(key):
+                self._spawn(self._refresh(options, key, func, *args, **kwargs))
+            result = entry.value
+        return self._decode_hit(options, result)
+
+    async def _load(
+        self,
+        options: CacheOptions,
+        key: str,
         func: Func,
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> T:
-        key = await keygen(func, *args, **kwargs)
+        if options.coalesce:
+            computed = await self._flight.do(
+                key, self._miss, options, key, func, *args, **kwargs
+            )
+        else:
+            computed = await self._miss(options, key, func, *args, **kwargs)
+
+        return self._result(options, computed)
 
-        if (result := await ensure_async(self.backend.get, key)) is not None:
-            return coder.decode(result)
+    async def _miss(
+        self,
+        options: CacheOptions,
+        key: str,
+        func: Func,
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Tuple[Value, Any]:
+        if options.lease_ttl is None:
+            return await self._compute(options, key, func, *args, **kwargs)
 
-        result = coder.encode(await ensure_async(func, *args, **kwargs))
+        if not await self._acquire_lease(options, key):
+            if (result := await self._wait_lease(options, key)) is not None:
+                return result
+            return await self._compute(options, key, func, *args, **kwargs)
 
         try:
-            await ensure_async(self.backend.set, key, result, ttl)
+            return await self._compute(options, key, func, *args, **kwargs)
+        finally:
+            try:
+                await ensure_async(self.backend.release_lease, key)
+            except Exception as exception:
+                self._logger.error(
+                    "Error to release lease 'key=%s': exception=%s",
+                    key,
+                    exception,
+                )
+
+    async def _acquire_lease(self, options: CacheOptions, key: str) -> bool:
+        try:
+            return await ensure_async(
+                self.backend.acquire_lease, key, options.lease_ttl
+            )
+        except Exception as exception:
+            self._logger.error(
+                "Error to acquire lease 'key=%s': exception=%s", key, exception
+            )
+            return True
+
+    async def _wait_lease(
+        self, options: CacheOptions, key: str
+    ) -> Optional[Tuple[Value, Any]]:
+        deadline = time.monotonic() + options.lease_wait.total_seconds()
+        while time.monotonic() < deadline:
+            await asyncio.sleep(LEASE_POLL_INTERVAL)
+            if (
+                result := await ensure_async(self.backend.get, key)
+            ) is not None:
+                return self._waited(options, result)
+        return None
+
+    async def _compute(
+        self,
+        options: CacheOptions,
+        key: str,
+        func: Func,
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Tuple[Value, Any]:
+        start = time.perf_counter()
+        try:
+            value = await ensure_async(func, *args, **kwargs)
+        except options.cache_errors as exception:
+            await self._store(
+                options,
+                key,
+                encode_error(exception, self.coder),
+                options.error_ttl,
+            )
+            raise
+        result = self.coder.encode(value)
+        delta = time.perf_counter() - start
+
+        await self._store(options, key, *self._entry(options, result, delta))
+        return result, value
+
+    async def _store(
+        self,
+        options: CacheOptions,
+        key: str,
+        value: Value,
+        expires_at: timedelta,
+    ) -> None:
+        if options.write_behind:
+            if self._async_backend:
+                self._async_writer.put(key, value, expires_at)
+            else:
+                self._writer.put(key, value, expires_at)
+            return
+
+        try:
+            await ensure_async(self.backend.set, key, value, expires_at)
         except Exception as exception:
             self._logger.error(
                 "Error to set cache 'key=%s': exception=%s", key, exception
             )
 
-        return coder.decode(result)
+    async def _refresh(
+        self,
+        options: CacheOptions,
+        key: str,
+        func: Func,
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> None:
+        # A failed refresh keeps the stale value, errors are not cached
+        options = replace(options, cache_errors=())
+        try:
+            await self._compute(options, key, func, *args, **kwargs)
+        except Exception as exception:
+            self._logger.error(
+                "Error to refresh cache 'key=%s': exception=%s", key, exception
+            )
+        finally:
+            self._release_refresh(key)
+
+    def _read_sync(self, method: str, *args: Any) -> Any:
+        if self._get_timeout is None:
+            return getattr(self._blocking, method)(*args)
+        if self._async_backend:
+            future = asyncio.run_coroutine_threadsafe(
+                getattr(self.backend, method)(*args), self._loop.loop
+            )
+        else:
+            future = self._submit_read(method, *args)
+        try:
+            return future.result(self._get_timeout)
+        finally:
+            future.cancel()
+
+    def _hit_reader_sync(self) -> Callable[[str], Any]:
+        if self._guarded:
+            return partial(self._get_sync, 'get')
+        return self._blocking.get
+
+    def _get_sync(self, method: str, key: Any) -> Any:
+        if self.breaker is not None and not self.breaker.allow():
+            return BYPASS
+
+        start = time.perf_counter()
+        try:
+            result = self._read_sync(method, key)
+        except BaseException as exception:
+            self._record(start, error=True)
+            if not isinstance(exception, Exception):
+                raise
+            return self._read_error(key, exception)
+        self._record(start, error=False)
+        return result
+
+    def _compile_sync(self, options: CacheOptions, func: Func) -> Func:
+        key_of = self._key_function(options, func, run=self._loop.run)
+        read = self._hit_reader_sync()
+        hit, load = self._hit_sync, self._load_sync
+
+        def cached(*args: P.args, **kwargs: P.kwargs) -> T:
+            key = key_of(*args, **kwargs)
+            try:
+                result = read(key)
+            except Exception as exception:
+                result = self._read_error(key, exception)
+
+            if result is BYPASS:
+                return func(*args, **kwargs)
+            value = hit(options, key, result, func, *args, **kwargs)
+            if value is MISSING:
+                return load(options, key, func, *args, **kwargs)
+            return value
+
+        return cached
+
+    def _hit_sync(
+        self,
+        options: CacheOptions,
+        key: str,
+        result: Optional[str],
+        func: Func,
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Any:
+        if result is None:
+            return MISSING
+        if is_packed(result):
+            entry = unpack(result)
+            if not self._is_fresh(options, entry) and self._claim_refresh(key):
+                self._submit(
+                    self._refresh_sync, options, key, func, *args, **kwargs
+                )
+            result = entry.value
+        return self._decode_hit(options, result)
+
+    def _load_sync(
+        self,
+        options: CacheOptions,
+        key: str,
+        func: Func,
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> T:
+        if options.coalesce:
+            computed = self._sync_flight.do(
+                key, self._miss_sync, options, key, func, *args, **kwargs
+            )
+        else:
+            computed = self._miss_sync(options, key, func, *args, **kwargs)
+
+        return self._result(options, computed)
+
+    def _miss_sync(
+        self,
+        options: CacheOptions,
+        key: str,
+        func: Func,
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Tuple[Value, Any]:
+        if options.lease_ttl is None:
+            return self._compute_sync(options, key, func, *args, **kwargs)
+
+        if not self._acquire_lease_sync(options, key):
+            if (result := self._wait_lease_sync(options, key)) is not None:
+                return result
+            return self._compute_sync(options, key, func, *args, **kwargs)
+
+        try:
+            return self._compute_sync(options, key, func, *args, **kwargs)
+        finally:
+            try:
+                self._blocking.release_lease(key)
+            except Exception as exception:
+                self._logger.error(
+                    "Error to release lease 'key=%s': exception=%s",
+                    key,
+                    exception,
+                )
+
+    def _acquire_lease_sync(self, options: CacheOptions, key: str) -> bool:
+        try:
+            return self._blocking.acquire_lease(key, options.lease_ttl)
+        except Exception as exception:
+            self._logger.error(
+                "Error to acquire lease 'key=%s': exception=%s", key, exception
+            )
+            return True
+
+    def _wait_lease_sync(
+        self, options: CacheOptions, key: str
+    ) -> Optional[Tuple[Value, Any]]:
+        deadline = time.monotonic() + options.lease_wait.total_seconds()
+        while time.monotonic() < deadline:
+            time.sleep(LEASE_POLL_INTERVAL)
+            if (result := self._blocking.get(key)) is not None:
+                return self._waited(options, result)
+        return None
+
+    def _compute_sync(
+        self,
+        options: CacheOptions,
+        key: str,
+        func: Func,
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Tuple[Value, Any]:
+        start = time.perf_counter()
+        try:
+            value = func(*args, **kwargs)
+        except options.cache_errors as exception:
+            self._store_sync(
+                options,
+                key,
+                encode_error(exception, self.coder),
+                options.error_ttl,
+            )
+            raise
+        result = self.coder.encode(value)
+        delta = time.perf_counter() - start
+
+        self._store_sync(options, key, *self._entry(options, result, delta))
+        return result, value
+
+    def _store_sync(
+        self,
+        options: CacheOptions,
+        key: str,
+        value: Value,
+        expires_at: timedelta,
+    ) -> None:
+        if options.write_behind:
+            self._writer.put(key, value, expires_at)
+            return
+
+        try:
+            self._blocking.set(key, value, expires_at)
+        except Exception as exception:
+            self._logger.error(
+                "Error to set cache 'key=%s': exception=%s", key, exception
+            )
+
+    def _refresh_sync(
+        self,
+        options: CacheOptions,
+        key: str,
+        func: Func,
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> None:
+        # A failed refresh keeps the stale value, errors are not cached
+        options = replace(options, cache_errors=())
+        try:
+            self._compute_sync(options, key, func, *args, **kwargs)
+        except Exception as exception:
+            self._logger.error(
+                "Error to refresh cache 'key=%s': exception=%s", key, exception
+            )
+        finally:
+            self._release_refresh(key)
 
     def __call__(
         self,
@@ -162,17 +1116,49 @@ class Cache:
         namespace: str = 'default',
         typed: bool = False,
         keygen: Optional[KeyGenerator] = None,
+        key_args: Optional[Sequence[str]] = None,
+        ignore_args: Sequence[str] = (),
+        key_cache: int = 0,
+        version: Optional[Union[str, int]] = None,
+        coalesce: bool = True,
+        lease_ttl: Optional[Union[int, float, timedelta]] = None,
+        lease_wait: Union[int, float, timedelta] = 1,
+        stale_ttl: Optional[Union[int, float, timedelta]] = None,
+        early_recompute: Optional[float] = None,
+        miss_copy: Optional[str] = None,
+        write_behind: bool = False,
+        cache_errors: Tuple[Type[BaseException], ...] = (),
+        error_ttl: Union[int, float, timedelta] = 5,
     ) -> Decorator:
         """Caches a function call and stores it in the namespace."""
-        if isinstance(ttl, (int, float)) and not isinf(ttl):
-            ttl = timedelta(seconds=ttl)
-        elif isinstance(ttl, timedelta):
-            pass
-        elif isinf(ttl):
-            ttl = timedelta(weeks=20e3)
+        if version is not None and ':' in str(version):
+            raise ValueError(f'version must not contain ":", got {version!r}')
+        if miss_copy is not None and miss_copy not in MISS_COPIES:
+            raise ValueError(
+                f'miss_copy must be one of {sorted(MISS_COPIES)}, '
+                f'got {miss_copy!r}'
+            )
 
-        keygen = curry(make_key)(namespace, keygen, typed)
-        manipulator = manipulate(curry(Cache._cache)(self, ttl, keygen))
+        options = CacheOptions(
+            ttl=to_timedelta(ttl),
+            namespace=namespace,
+            keygen=keygen,
+            typed=typed,
+            key_args=None if key_args is None else tuple(key_args),
+            ignore_args=tuple(ignore_args),
+            key_cache=key_cache,
+            version=None if version is None else str(version),
+            coalesce=coalesce,
+            lease_ttl=None if lease_ttl is None else to_timedelta(lease_ttl),
+            lease_wait=to_timedelta(lease_wait),
+            stale_ttl=None if stale_ttl is None else to_timedelta(stale_ttl),
+            early_recompute=early_recompute,
+            miss_copy=MISS_COPIES.get(miss_copy),
+            write_behind=write_behind,
+            cache_errors=tuple(cache_errors),
+            error_ttl=to_timedelta(error_ttl),
+        )
+        manipulator = self._compile(options)
 
         if func:
             # @cache
@@ -180,6 +1166,199 @@ class Cache:
         # @cache()
         return manipulator
 
+    async def _set_many(self, writes: List[Write]) -> None:
+        try:
+            await ensure_async(self.backend.set_many, writes)
+        except Exception as exception:
+            self._logger.error(
+                "Error to set cache 'keys=%s': exception=%s",
+                [key for key, *_ in writes],
+                exception,
+            )
+
+    def _set_many_sync(self, writes: List[Write]) -> None:
+        try:
+            self._blocking.set_many(writes)
+        except Exception as exception:
+            self._logger.error(
+                "Error to set cache 'keys=%s': exception=%s",
+                [key for key, *_ in writes],
+                exception,
+            )
+
+    def _merge(
+        self,
+        options: BatchOptions,
+        ids: List[Hashable],
+        keys: List[str],
+        found: Dict[Hashable, Any],
+        computed: Mapping[Hashable, Any],
+    ) -> Tuple[Dict[Hashable, Any], List[Write]]:
+        writes = []
+        for id_, key in zip(ids, keys):
+            if id_ in found or id_ not in computed:
+                continue
+            encoded = self.coder.encode(computed[id_])
+            writes.append((key, encoded, options.ttl))
+            found[id_] = self.coder.decode(encoded)
+        return {id_: found[id_] for id_ in ids if id_ in found}, writes
+
+    def _compile_batch(self, options: BatchOptions) -> Decorator:
+        def wrapper(func: Func) -> Func:
+            if asyncio.iscoroutinefunction(func):
+                key_of = key_function(
+                    options.namespace, options.keygen, options.typed, func
+                )
+
+                async def batched(
+                    ids: Iterable[Hashable], *args: P.args, **kwargs: P.kwargs
+                ) -> Dict[Hashable, Any]:
+                    return await self._batch(
+                        options, key_of, func, ids, *args, **kwargs
+                    )
+
+            else:
+                key_of = key_function(
+                    options.namespace,
+                    options.keygen,
+                    options.typed,
+                    func,
+                    run=self._loop.run,
+                )
+
+                def batched(
+                    ids: Iterable[Hashable], *args: P.args, **kwargs: P.kwargs
+                ) -> Dict[Hashable, Any]:
+                    return self._batch_sync(
+                        options, key_of, func, ids, *args, **kwargs
+                    )
+
+            return wraps(func)(batched)
+
+        return wrapper
+
+    async def _batch(
+        self,
+        options: BatchOptions,
+        key_of: Callable[..., Any],
+        func: Func,
+        ids: Iterable[Hashable],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Dict[Hashable, Any]:
+        ids = list(dict.fromkeys(ids))
+        keys = [key_of(id_, *args, **kwargs) for id_ in ids]
+        if asyncio.iscoroutinefunction(key_of):
+            keys = [await key for key in keys]
+
+        if (values := await self._get('get_many', keys)) is BYPASS:
+            return await ensure_async(func, ids, *args, **kwargs)
+
+        found = {
+            id_: self.coder.decode(value)
+            for id_, value in zip(ids, values)
+            if value is not None
+        }
+        if not (missing := [id_ for id_ in ids if id_ not in found]):
+            return found
+
+        computed = await ensure_async(func, missing, *args, **kwargs)
+        result, writes = self._merge(options, ids, keys, found, computed)
+        if writes:
+            await self._set_many(writes)
+        return result
+
+    def _batch_sync(
+        self,
+        options: BatchOptions,
+        key_of: Callable[..., Any],
+        func: Func,
+        ids: Iterable[Hashable],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Dict[Hashable, Any]:
+        ids = list(dict.fromkeys(ids))
+        keys = [key_of(id_, *args, **kwargs) for id_ in ids]
+
+        if (values := self._get_sync('get_many', keys)) is BYPASS:
+            return func(ids, *args, **kwargs)
+
+        found = {
+            id_: self.coder.decode(value)
+            for id_, value in zip(ids, values)
+            if value is not None
+        }
+        if not (missing := [id_ for id_ in ids if id_ not in found]):
+            return found
+
+        computed = func(missing, *args, **kwargs)
+        result, writes = self._merge(options, ids, keys, found, computed)
+        if writes:
+            self._set_many_sync(writes)
+        return result
+
+    def batch(
+        self,
+        func: Optional[Func] = None,
+        /,
+        *,
+        ttl: Union[int, float, timedelta] = inf,
+        namespace: str = 'default',
+        typed: bool = False,
+        keygen: Optional[KeyGenerator] = None,
+    ) -> Decorator:
+        """Caches each item of a function that takes a list of ids.
+
+        The decorated function takes an iterable of hashable ids as its
+        first argument and returns a mapping of id to item. Each item is
+        cached with its own key, built from the id and the other
+        arguments. All the keys are read in a single bulk read and the
+        function is only called with the missing ids. The new items are
+        written in a single bulk write.
+
+        The result is a dict of the found ids in the order they were
+        given, ids missing from the function result are not cached.
+
+        Parameters
+        ----------
+        ttl : int | float | timedelta, default=math.inf
+            cache ttl (time to live) of each item
+        namespace : str, default='default'
+            namespace to cache
+        typed : bool, default=False
+            If typed is set to true, function arguments of different types
+            will be cached separately
+        keygen : Optional[cachetoolz.types.KeyGenerator], default=None
+            function to generate the cache identifier key of an item, it
+            is called with the id as the first argument
+
+        Examples
+        --------
+        A simple batch cache
+        >>> @cache.batch
+        ... def get_heroes(ids):
+        ...     return {hero.id: hero for hero in fetch_heroes(ids)}
+
+        Set an expiration time in seconds
+        >>> @cache.batch(ttl=60, namespace='heroes')
+        ... async def get_heroes(ids):
+        ...     return {hero.id: hero for hero in await fetch_heroes(ids)}
+
+        """
+        options = BatchOptions(
+            ttl=to_timedelta(ttl),
+            namespace=namespace,
+            keygen=keygen,
+            typed=typed,
+        )
+        manipulator = self._compile_batch(options)
+
+        if func:
+            # @cache.batch
+            return manipulator(func)
+        # @cache.batch(ttl=60)
+        return manipulator
+
     async def _clear(
         self,
         namespaces: Sequence[str],
@@ -198,8 +1377,26 @@ class Cache:
                 exception,
             )
 
-        result = coder.encode(await ensure_async(func, *args, **kwargs))
-        return coder.decode(result)
+        return await ensure_async(func, *args, **kwargs)
+
+    def _clear_sync(
+        self,
+        namespaces: Sequence[str],
+        func: Func,
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> T:
+        try:
+            for namespace in namespaces:
+                self._blocking.clear(namespace)
+        except Exception as exception:
+            self._logger.error(
+                "Error to clear cache 'namespaces=%s': exception=%s",
+                namespaces,
+                exception,
+            )
+
+        return func(*args, **kwargs)
 
     def clear(
         self,
@@ -231,7 +1428,10 @@ class Cache:
         ...     ...
 
         """
-        manipulator = manipulate(curry(Cache._clear)(self, namespaces))
+        sync_manipulator = partial(self._clear_sync, namespaces)
+        manipulator = manipulate(
+            curry(Cache._clear)(self, namespaces), sync_manipulator
+        )
 
         if func:
             # @cache.clear
@@ -0,0 +1,121 @@
+"""Cache entry implementation."""
+
+from dataclasses import dataclass
+from math import inf, log
+from random import random
+
+from .types import Value
+
+# Encoded values never start with a null character, so entries with metadata
+# and plain encoded values can be told apart
+MARKER = '\x00'
+BYTES_MARKER = MARKER.encode()
+
+
+@dataclass
+class Entry:
+    """Cached value with its metadata.
+
+    Attributes
+    ----------
+    value : str | bytes
+        value to cache encoded.
+    fresh_until : float
+        timestamp after which the value is stale.
+    delta : float
+        seconds spent computing the value.
+
+    Examples
+    --------
+    >>> Entry(value='[1, 2]', fresh_until=time.time() + 60, delta=0.2)
+
+    """
+
+    value: Value
+    fresh_until: float = inf
+    delta: float = 0.0
+
+    def is_fresh(self, now: float, beta: float = 0.0) -> bool:
+        """Check if the value is fresh.
+
+        With a positive ``beta`` the value may be considered stale before
+        its deadline, with a probability that rises as the deadline gets
+        closer and with the time spent computing it (XFetch). This spreads
+        the refreshes of keys that were written together.
+
+        Parameters
+        ----------
+        now : float
+            Current timestamp.
+        beta : float
+            Early recompute factor, values above 1 favor earlier refreshes.
+
+        """
+        if beta:
+            # 1 - random() is in (0, 1], so the logarithm is defined
+            now -= self.delta * beta * log(1.0 - random())
+        return now < self.fresh_until
+
+
+def is_packed(value: Value) -> bool:
+    """Check if a value read from a backend has the metadata header.
+
+    Parameters
+    ----------
+    value : str | bytes
+        Value read from the backend.
+
+    """
+    return value.startswith(
+        BYTES_MARKER if isinstance(value, bytes) else MARKER
+    )
+
+
+def pack(entry: Entry) -> Value:
+    """Serialize an entry to be stored in a backend.
+
+    Parameters
+    ----------
+    entry : Entry
+        Entry to serialize.
+
+    Returns
+    -------
+    packed : str | bytes
+        Value with the metadata header, of the same type of the value.
+
+    """
+    header = f'{MARKER}{entry.fresh_until!r};{entry.delta!r}\n'
+    if isinstance(entry.value, bytes):
+        return header.encode() + entry.value
+    return header + entry.value
+
+
+def unpack(value: Value) -> Entry:
+    """Deserialize an entry stored in a backend.
+
+    Values stored without metadata are always fresh.
+
+    Parameters
+    ----------
+    value : str | bytes
+        Value read from the backend.
+
+    Returns
+    -------
+    entry : Entry
+        Entry with its metadata.
+
+    """
+    if not is_packed(value):
+        return Entry(value=value)
+
+    if isinstance(value, bytes):
+        header, value = value[1:].split(b'\n', 1)
+        header = header.decode()
+    else:
+        header, value = value[1:].split('\n', 1)
+    fresh_until, delta = header.split(';')
+    return Entry(
+        value=value, fresh_until=float(fresh_until), delta=float(delta)
+    )
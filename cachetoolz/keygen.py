@@ -0,0 +1,688 @@
+"""Default key generator implementation."""
+
+import pickle
+from array import array
+from collections.abc import Set
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from hashlib import blake2b
+from inspect import Parameter, iscode, signature, unwrap
+from types import CodeType
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Tuple
+
+from .exceptions import UnknownEncoderError
+from .types import Func, P
+
+Write = Callable[[bytes], Any]
+
+# Bytes of the key digest, 32 hexadecimal characters
+DIGEST_SIZE = 16
+
+# Version of the pickle protocol of the values without a canonical encoding
+PICKLE_PROTOCOL = 4
+
+# Bytes of a buffer written at a time, buffers are hashed without a copy
+CHUNK_SIZE = 1 << 20
+
+
+def qualified_name(kind: type) -> str:
+    """Get the qualified name of a type.
+
+    Parameters
+    ----------
+    kind
+        Type
+
+    """
+    return f'{kind.__module__}.{kind.__qualname__}'
+
+
+def write_sized(tag: bytes, data: bytes, write: Write) -> None:
+    """Write a value with its size, so it ends without a delimiter.
+
+    Parameters
+    ----------
+    tag
+        Type tag
+    data
+        Encoded value
+    write
+        Writes the encoded bytes
+
+    """
+    write(b'%s%d:' % (tag, len(data)))
+    write(data)
+
+
+def write_buffer(tag: bytes, value: Any, write: Write) -> None:
+    """Write the bytes of a buffer in chunks, without copying them.
+
+    Only buffers that are not contiguous are copied.
+
+    Parameters
+    ----------
+    tag
+        Type tag
+    value
+        Object that supports the buffer protocol
+    write
+        Writes the encoded bytes, it must accept a memoryview
+
+    """
+    if not (view := memoryview(value)).c_contiguous:
+        view = memoryview(view.tobytes())
+    view = view.cast('B')
+    write(b'%s%d:' % (tag, view.nbytes))
+    for start in range(0, view.nbytes, CHUNK_SIZE):
+        end = start + CHUNK_SIZE
+        write(view[start:end])
+
+
+def encode_str(value: str, tag: bytes = b's') -> bytes:
+    """Encode a string to UTF-8, prefixed by its size.
+
+    Parameters
+    ----------
+    value
+        String
+    tag
+        Type tag
+
+    """
+    data = value.encode('utf-8', 'surrogatepass')
+    return b'%s%d:%s' % (tag, len(data), data)
+
+
+def write_str(value: str, write: Write, tag: bytes = b's') -> None:
+    """Write a string encoded to UTF-8.
+
+    Parameters
+    ----------
+    value
+        String
+    write
+        Writes the encoded bytes
+    tag
+        Type tag
+
+    """
+    write(encode_str(value, tag))
+
+
+def write_items(
+    tag: bytes, items: Iterable[Any], write: Write, typed: bool
+) -> None:
+    """Write the items of a sequence in their order.
+
+    Parameters
+    ----------
+    tag
+        Type tag
+    items
+        Items of the sequence
+    write
+        Writes the encoded bytes
+    typed
+        If the exact types of the objects are encoded
+
+    """
+    items = list(items)
+    write(b'%s%d:' % (tag, len(items)))
+    for item in items:
+        write_canonical(item, write, typed)
+
+
+def write_unordered(
+    tag: bytes, items: Iterable[Any], write: Write, typed: bool
+) -> None:
+    """Write the items of a collection sorted by their encoding.
+
+    Parameters
+    ----------
+    tag
+        Type tag
+    items
+        Items of the collection
+    write
+        Writes the encoded bytes
+    typed
+        If the exact types of the objects are encoded
+
+    """
+    encoded = sorted(canonical(item, typed) for item in items)
+    write(b'%s%d:' % (tag, len(encoded)))
+    for item in encoded:
+        write(item)
+
+
+# Canonical encoding of the exact types encoded by their value alone
+PRIMITIVES: Dict[type, Callable[[Any], bytes]] = {
+    type(None): lambda value: b'N',
+    bool: lambda value: b'T' if value else b'F',
+    int: lambda value: b'i%d;' % value,
+    float: lambda value: b'f%s;' % value.hex().encode(),
+    str: encode_str,
+}
+
+# Canonical encoding of each exact type, subclasses are encoded as objects
+ENCODERS: Dict[type, Callable[[Any, Write, bool], None]] = {
+    type(None): lambda value, write, typed: write(b'N'),
+    bool: lambda value, write, typed: write(b'T' if value else b'F'),
+    int: lambda value, write, typed: write(b'i%d;' % value),
+    float: lambda value, write, typed: write(b'f%s;' % value.hex().encode()),
+    str: lambda value, write, typed: write_str(value, write),
+    bytes: lambda value, write, typed: write_buffer(b'b', value, write),
+    bytearray: lambda value, write, typed: write_buffer(b'b', value, write),
+    memoryview: lambda value, write, typed: write_buffer(b'b', value, write),
+    array: lambda value, write, typed: write_buffer(
+        b'a%s' % value.typecode.encode(), value, write
+    ),
+    tuple: lambda value, write, typed: write_items(b't', value, write, typed),
+    list: lambda value, write, typed: write_items(b'l', value, write, typed),
+    dict: lambda value, write, typed: write_unordered(
+        b'd', value.items(), write, typed
+    ),
+    set: lambda value, write, typed: write_unordered(
+        b'S', value, write, typed
+    ),
+    frozenset: lambda value, write, typed: write_unordered(
+        b'Z', value, write, typed
+    ),
+}
+
+
+def write_object(value: Any, write: Write, typed: bool) -> None:
+    """Write an object without an encoder of its exact type.
+
+    Parameters
+    ----------
+    value
+        Object
+    write
+        Writes the encoded bytes
+    typed
+        If the exact types of the objects are encoded
+
+    """
+    kind = type(value)
+    if isinstance(value, Enum):
+        write_str(qualified_name(kind), write, b'e')
+        write_canonical(value.value, write, typed)
+    elif is_dataclass(value) and not isinstance(value, type):
+        write_str(qualified_name(kind), write, b'D')
+        write_items(
+            b't',
+            (getattr(value, field.name) for field in fields(value)),
+            write,
+            typed,
+        )
+    elif isinstance(value, Set):
+        write_str(qualified_name(kind), write, b'o')
+        write_unordered(b'S', value, write, typed)
+    else:
+        write_coded(value, write, typed)
+
+
+def write_coded(value: Any, write: Write, typed: bool) -> None:
+    """Write an object by its coder encoding, or pickled without one.
+
+    Parameters
+    ----------
+    value
+        Object
+    write
+        Writes the encoded bytes
+    typed
+        If the exact types of the objects are encoded
+
+    """
+    # The coder imports the utils, which import this module
+    from .coder.encoder import encode
+
+    try:
+        encoded = encode(value)
+    except UnknownEncoderError:
+        write_unknown(value, write)
+        return
+
+    # Subclasses share the encoder of their registered base
+    write_str(qualified_name(type(value)) if typed else '', write, b'o')
+    if encoded is value:
+        # Subclasses of the primitives are encoded by their value
+        write_primitive(value, write)
+    else:
+        write_canonical(encoded, write, typed)
+
+
+def write_primitive(value: Any, write: Write) -> None:
+    """Write an object by the encoding of its primitive base.
+
+    Objects without a primitive base are pickled.
+
+    Parameters
+    ----------
+    value
+        Object, e.g. an instance of a subclass of ``str`` or ``int``
+    write
+        Writes the encoded bytes
+
+    """
+    for base in type(value).__mro__:
+        if (encode := PRIMITIVES.get(base)) is not None:
+            write(encode(value))
+            return
+    write_unknown(value, write)
+
+
+def write_unknown(value: Any, write: Write) -> None:
+    """Write an object without encoding, its buffer or pickled.
+
+    Parameters
+    ----------
+    value
+        Object
+    write
+        Writes the encoded bytes
+
+    """
+    try:
+        view = memoryview(value)
+    except TypeError:
+        write_sized(b'p', pickle.dumps(value, PICKLE_PROTOCOL), write)
+        return
+
+    # e.g. numpy arrays, the same bytes have a different meaning by shape
+    with view:
+        write_str(qualified_name(type(value)), write, b'm')
+        write_str(view.format, write)
+        write_items(b't', view.shape, write, False)
+        write_buffer(b'b', view, write)
+
+
+def write_canonical(value: Any, write: Write, typed: bool = False) -> None:
+    """Write the canonical encoding of a value.
+
+    Parameters
+    ----------
+    value
+        Value to encode
+    write
+        Writes the encoded bytes
+    typed
+        If the exact types of the objects encoded by the coder are encoded
+
+    """
+    if (encoder := ENCODERS.get(type(value))) is not None:
+        encoder(value, write, typed)
+    else:
+        write_object(value, write, typed)
+
+
+def canonical(value: Any, typed: bool = False) -> bytes:
+    """Encode a value to bytes that only depend on the value.
+
+    Equal values are encoded to the same bytes in every process and Python
+    version. Every value starts with a type tag, so values of different
+    types are encoded apart.
+
+    * ``None``, ``bool``, ``int`` and ``float`` are encoded by their value,
+      floats in hexadecimal
+    * ``str`` is encoded to UTF-8 and the buffers, ``bytes``,
+      ``bytearray``, ``memoryview`` and ``array.array``, as is, prefixed
+      by their size
+    * ``tuple`` and ``list`` items are encoded in their order, ``dict``
+      items, ``set`` and ``frozenset`` are sorted by their encoding
+    * ``Enum`` members by their class and value, dataclasses by their class
+      and the values of their fields
+    * types known by the ``coder`` (``UUID``, ``datetime``, ``Decimal``,
+      ...) by their coder encoding, including registered serializers
+    * other buffers by their class, format, shape and bytes
+    * other values are pickled, which only gives the same bytes while their
+      pickle does not change
+
+    Parameters
+    ----------
+    value
+        Value to encode
+    typed
+        If the exact types of the objects encoded by the coder are encoded,
+        otherwise subclasses are encoded as their registered base
+
+    Returns
+    -------
+        Canonical encoding
+
+    Examples
+    --------
+    >>> canonical({'b': 1.5, 'a': [None]})
+    b'd2:t2:s1:al1:Nt2:s1:bf0x1.8000000000000p+0;'
+
+    """
+    parts = []
+    write_canonical(value, parts.append, typed)
+    return b''.join(parts)
+
+
+def encode_primitives(
+    args: Tuple[Any, ...], kwargs: Dict[str, Any]
+) -> Optional[bytes]:
+    """Encode the arguments of a call at once if they are all primitives.
+
+    Parameters
+    ----------
+    args
+        Function positional arguments
+    kwargs
+        Named function arguments
+
+    Returns
+    -------
+        The bytes written by ``write_each_argument``, None if an argument
+        is not a primitive
+
+    """
+    parts = [b't%d:' % len(args)]
+    for value in args:
+        if (encode := PRIMITIVES.get(type(value))) is None:
+            return None
+        parts.append(encode(value))
+
+    parts.append(b'k%d:' % len(kwargs))
+    for name in sorted(kwargs):
+        if (encode := PRIMITIVES.get(type(value := kwargs[name]))) is None:
+            return None
+        parts.append(encode_str(name))
+        parts.append(encode(value))
+    return b''.join(parts)
+
+
+def write_each_argument(
+    typed: bool, args: Tuple[Any, ...], kwargs: Dict[str, Any], write: Write
+) -> None:
+    """Write the ``canonical`` encoding of each argument of a call.
+
+    The positional arguments are written as a tuple and the named ones
+    sorted by their name, so no argument is encoded to sort them.
+
+    Parameters
+    ----------
+    typed
+        If typed is set to true, function arguments of different types
+        will be cached separately
+    args
+        Function positional arguments
+    kwargs
+        Named function arguments
+    write
+        Writes the encoded bytes
+
+    """
+    write_items(b't', args, write, typed)
+    write(b'k%d:' % len(kwargs))
+    for name in sorted(kwargs):
+        write_str(name, write)
+        write_canonical(kwargs[name], write, typed)
+
+
+def write_arguments(
+    typed: bool, args: Tuple[Any, ...], kwargs: Dict[str, Any], write: Write
+) -> None:
+    """Write the encoding of the arguments of a call.
+
+    Primitive arguments are encoded at once, with a single write. The
+    others are written one by one, straight to a hasher, which avoids
+    copying large buffers.
+
+    Parameters
+    ----------
+    typed
+        If typed is set to true, function arguments of different types
+        will be cached separately
+    args
+        Function positional arguments
+    kwargs
+        Named function arguments
+    write
+        Writes the encoded bytes
+
+    """
+    if (encoded := encode_primitives(args, kwargs)) is not None:
+        write(encoded)
+    else:
+        write_each_argument(typed, args, kwargs, write)
+
+
+def function_identity(func: Func) -> bytes:
+    """Get the bytes that identify a function in its keys.
+
+    Parameters
+    ----------
+    func
+        Function
+
+    """
+    # Methods of different classes must not share their keys
+    name = getattr(func, '__qualname__', func.__name__)
+    return f'{func.__module__}:{name}\n'.encode()
+
+
+def write_code(code: CodeType, write: Write) -> None:
+    """Write the bytecode of a code object with its constants and names.
+
+    Parameters
+    ----------
+    code
+        Code object
+    write
+        Writes the encoded bytes
+
+    """
+    write_sized(b'c', code.co_code, write)
+    write_canonical(code.co_names, write)
+    for const in code.co_consts:
+        if iscode(const):
+            # Nested functions, lambdas and comprehensions
+            write_code(const, write)
+        else:
+            write_canonical(const, write)
+
+
+def code_fingerprint(func: Func) -> str:
+    """Get a fingerprint of the code of a function.
+
+    The fingerprint changes when the bytecode, the constants or the global
+    names used by the function change, e.g. after a deploy. It does not
+    change with the functions it calls, and the bytecode itself changes
+    between Python versions.
+
+    Parameters
+    ----------
+    func
+        Function, decorators that set ``__wrapped__`` are unwrapped
+
+    Returns
+    -------
+        Eight hexadecimal characters
+
+    Raises
+    ------
+    ValueError
+        If the function has no Python code, e.g. a builtin.
+
+    """
+    if (code := getattr(unwrap(func), '__code__', None)) is None:
+        raise ValueError(f'{func!r} has no Python code to fingerprint')
+
+    hasher = blake2b(digest_size=4)
+    write_code(code, hasher.update)
+    return hasher.hexdigest()
+
+
+class ArgumentSelector:
+    """Select the arguments of a call that are part of its key.
+
+    The signature of the function is inspected once, a call only maps the
+    positional arguments to their names and fills the defaults, so equal
+    calls select the same arguments whether they are passed by position,
+    by name or left to their default.
+
+    Parameters
+    ----------
+    func
+        Function
+    key_args
+        Names of the only arguments selected, all of them if None
+    ignore_args
+        Names of the arguments that are not selected, e.g. ``self``
+
+    Attributes
+    ----------
+    names : tuple[str, ...]
+        Names of the selected arguments, in the order of the signature.
+
+    Raises
+    ------
+    ValueError
+        If a name is not a parameter of the function, or both ``key_args``
+        and ``ignore_args`` are given.
+
+    Examples
+    --------
+    >>> def get(self, user_id, region='eu'):
+    ...     ...
+    >>> select = ArgumentSelector(get, ignore_args=['self'])
+    >>> select(repository, 1)
+    {'user_id': 1, 'region': 'eu'}
+
+    """
+
+    def __init__(
+        self,
+        func: Func,
+        key_args: Optional[Sequence[str]] = None,
+        ignore_args: Sequence[str] = (),
+    ):
+        """Initialize the instance."""
+        if key_args is not None and ignore_args:
+            raise ValueError('key_args and ignore_args are exclusive')
+
+        self._signature = signature(func)
+        parameters = self._signature.parameters
+        for name in (*(key_args or ()), *ignore_args):
+            if name not in parameters:
+                raise ValueError(
+                    f'{name!r} is not a parameter of {func.__name__}'
+                )
+
+        self.names = tuple(
+            name
+            for name in parameters
+            if (name in key_args if key_args is not None else True)
+            and name not in ignore_args
+        )
+        self._positional = []
+        self._defaults = {}
+        self._var_args = self._var_kwargs = None
+        for name, parameter in parameters.items():
+            self._inspect(name, parameter)
+
+    def _inspect(self, name: str, parameter: Parameter) -> None:
+        if parameter.kind is Parameter.VAR_POSITIONAL:
+            self._var_args = name
+        elif parameter.kind is Parameter.VAR_KEYWORD:
+            self._var_kwargs = name
+        elif parameter.kind is not Parameter.KEYWORD_ONLY:
+            self._positional.append(name)
+
+        if parameter.default is not Parameter.empty:
+            self._defaults[name] = parameter.default
+
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> Dict[str, Any]:
+        """Select the arguments of a call by name.
+
+        Parameters
+        ----------
+        args
+            Function positional arguments
+        kwargs
+            Named function arguments
+
+        Returns
+        -------
+            Selected arguments by name
+
+        """
+        arguments = self._defaults.copy()
+        arguments.update(zip(self._positional, args))
+        if self._var_args is not None:
+            start = len(self._positional)
+            arguments[self._var_args] = args[start:]
+        if self._var_kwargs is not None:
+            arguments[self._var_kwargs] = {
+                name: value
+                for name, value in kwargs.items()
+                if name not in self._signature.parameters
+            }
+        arguments.update(kwargs)
+
+        try:
+            return {name: arguments[name] for name in self.names}
+        except KeyError:
+            # Raises the TypeError of the call without a required argument
+            self._signature.bind(*args, **kwargs)
+            raise
+
+
+def compile_keygen(typed: bool, func: Func) -> Callable[..., str]:
+    """Build the default key generator of a function.
+
+    The function identity is hashed once, a call only encodes the
+    arguments and hashes them on a copy of that state.
+
+    Parameters
+    ----------
+    typed
+        If typed is set to true, function arguments of different types
+        will be cached separately
+    func
+        Function
+
+    Returns
+    -------
+        Function of the call arguments that returns the cache identifier
+        key, as ``default_keygen`` would
+
+    """
+    seed = blake2b(function_identity(func), digest_size=DIGEST_SIZE)
+
+    def keygen(*args: P.args, **kwargs: P.kwargs) -> str:
+        hasher = seed.copy()
+        write_arguments(typed, args, kwargs, hasher.update)
+        return hasher.hexdigest()
+
+    return keygen
+
+
+def default_keygen(
+    typed: bool, func: Func, *args: P.args, **kwargs: P.kwargs
+) -> str:
+    """Build a key to a function.
+
+    Parameters
+    ----------
+    typed
+        If typed is set to true, function arguments of different types
+        will be cached separately
+    func
+        Function
+    args
+        Function positional arguments
+    kwargs
+        Named function arguments
+
+    Returns
+    -------
+        Cache identifier key
+
+    """
+    return compile_keygen(typed, func)(*args, **kwargs)
@@ -0,0 +1,108 @@
+"""Read batching implementation."""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Set
+
+LoadMany = Callable[[List[Hashable]], Awaitable[List[Any]]]
+
+
+class BatchLoader:
+    """Batch the concurrent loads of an event loop.
+
+    The keys loaded within the same loop iteration, or within ``window``
+    seconds of the first one, are loaded together with a single call of
+    ``load_many``. Concurrent loads of the same key share its result.
+
+    Parameters
+    ----------
+    load_many
+        Coroutine function that loads a list of keys, returning their values
+        in the same order
+    window
+        Seconds to wait for more keys after the first one, ``0`` only waits
+        for the current loop iteration
+    max_batch
+        Maximum number of keys loaded in a single call, a full batch is
+        loaded right away
+
+    Examples
+    --------
+    >>> backend = AsyncInMemory()
+    >>> loader = BatchLoader(backend.get_many)
+    >>> await asyncio.gather(loader.load('ns:a'), loader.load('ns:b'))
+    [None, None]
+
+    """
+
+    def __init__(
+        self, load_many: LoadMany, window: float = 0.0, max_batch: int = 1000
+    ):
+        """Initialize the instance."""
+        self._load_many = load_many
+        self._window = window
+        self._max_batch = max_batch
+        # Keys waiting to be loaded by loop, the futures are bound to it
+        self._batches: Dict[int, Dict[Hashable, asyncio.Future]] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def load(self, key: Hashable) -> Any:
+        """Load a key in the next batch.
+
+        Parameters
+        ----------
+        key
+            Key to load
+
+        Returns
+        -------
+            Value loaded to the key
+
+        """
+        loop = asyncio.get_running_loop()
+
+        if (batch := self._batches.get(id(loop))) is None:
+            batch = self._batches[id(loop)] = {}
+            if self._window:
+                loop.call_later(self._window, self._dispatch, loop, batch)
+            else:
+                loop.call_soon(self._dispatch, loop, batch)
+
+        if (future := batch.get(key)) is None:
+            future = batch[key] = loop.create_future()
+            if len(batch) >= self._max_batch:
+                self._dispatch(loop, batch)
+
+        # A cancelled caller does not cancel the load shared with others
+        return await asyncio.shield(future)
+
+    def _dispatch(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        batch: Dict[Hashable, asyncio.Future],
+    ) -> None:
+        # The batch may have been dispatched early because it was full
+        if self._batches.get(id(loop)) is not batch:
+            return
+        del self._batches[id(loop)]
+
+        task = loop.create_task(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: Dict[Hashable, asyncio.Future]) -> None:
+        try:
+            values = await self._load_many(list(batch))
+        except asyncio.CancelledError:
+            for future in batch.values():
+                future.cancel()
+            raise
+        except Exception as exception:
+            # The futures are shielded from their callers, only set here
+            for future in batch.values():
+                future.set_exception(exception)
+                # Avoid "exception was never retrieved" without waiters
+                future.exception()
+            return
+
+        for future, value in zip(batch.values(), values):
+            future.set_result(value)
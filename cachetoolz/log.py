@@ -1,8 +1,10 @@
 """Logging implemetation."""
 
 import logging
+from functools import lru_cache
 
 
+@lru_cache(maxsize=None)
 def get_logger(name='cachetoolz') -> logging.Logger:
     """Get a logger.
 
@@ -14,6 +16,9 @@ def get_logger(name='cachetoolz') -> logging.Logger:
     """
     logger = logging.getLogger(name)
 
+    if logger.handlers:
+        return logger
+
     log_level = logger.level
     if log_level == logging.NOTSET:
         log_level = logging.WARN
@@ -1,6 +1,7 @@
 """Types implemetations."""
 
-from typing import Any, Awaitable, Callable, TypedDict, TypeVar, Union
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, List, TypedDict, TypeVar, Union
 
 from typing_extensions import Concatenate, ParamSpec, TypeAlias
 
@@ -15,6 +16,8 @@ Manipulator: TypeAlias = Callable[
 ]
 Encoder: TypeAlias = Callable[[Any], Any]
 Decoder: TypeAlias = Callable[[Any], Any]
+# Encoded value stored in a backend
+Value: TypeAlias = Union[str, bytes]
 
 
 class Encoded(TypedDict):
@@ -22,3 +25,24 @@ class Encoded(TypedDict):
 
     __val: Any
     __decoder: str
+
+
+@dataclass
+class CachedError:
+    """Exception cached by negative caching.
+
+    Attributes
+    ----------
+    name : str
+        qualified name of the exception class.
+    args : list[Any]
+        exception arguments.
+
+    Examples
+    --------
+    >>> CachedError(name='builtins.TimeoutError', args=['upstream'])
+
+    """
+
+    name: str
+    args: List[Any]
@@ -1,30 +1,38 @@
 """Utils functions."""
 
 import asyncio
-import pickle
-from functools import wraps
-from hashlib import md5
-from inspect import isawaitable
-from itertools import chain
-from typing import Any, Optional
-
-import nest_asyncio
+import threading
+from datetime import timedelta
+from functools import lru_cache, partial, wraps
+from inspect import Parameter, isawaitable, signature
+from math import isinf
+from typing import Any, Callable, Optional, Sequence, Tuple, Union
 
+from .keygen import ArgumentSelector, compile_keygen, default_keygen
 from .types import Decorator, Func, KeyGenerator, Manipulator, P, T
 
 
-def default_keygen(
-    typed: bool, func: Func, *args: P.args, **kwargs: P.kwargs
+async def make_key(
+    namespace: str,
+    keygen: Optional[KeyGenerator],
+    typed: bool,
+    func: Func,
+    *args: P.args,
+    **kwargs: P.kwargs,
 ) -> str:
-    """Build a key to a function.
+    """Make a key to a function.
 
     Parameters
     ----------
+    namespaces
+        namespace to cache
+    keygen
+        function to generate a cache identifier key
+    func
+        Function
     typed
         If typed is set to true, function arguments of different types
         will be cached separately
-    func
-        Function
     args
         Function positional arguments
     kwargs
@@ -32,56 +40,240 @@ def default_keygen(
 
     Returns
     -------
-        Cache identifier key
+        Cache identifier key with namespace
 
     """
-    hashable_args = (
-        (func.__module__, func.__name__),
-        args,
-        tuple(sorted(kwargs.items())),
+    key = await ensure_async(
+        keygen or default_keygen, typed, func, *args, **kwargs
     )
-    if typed:
-        hashable_args += tuple(
-            type(value) for value in chain(args, sorted(kwargs.values()))
-        )
-    return md5(pickle.dumps(hashable_args)).hexdigest()
+    return f'{namespace}:{key}'
 
 
-async def make_key(
+def key_function(
     namespace: str,
     keygen: Optional[KeyGenerator],
     typed: bool,
     func: Func,
-    *args: P.args,
-    **kwargs: P.kwargs,
-) -> str:
-    """Make a key to a function.
+    run: Optional[Callable[..., Any]] = None,
+    key_args: Optional[Sequence[str]] = None,
+    ignore_args: Sequence[str] = (),
+    version: Optional[str] = None,
+    key_cache: int = 0,
+) -> Callable[..., Any]:
+    """Build the key function of a decorated function.
+
+    The namespace prefix and the key generator are resolved once, so
+    building a key is a single call of the key generator.
+
+    With ``key_args`` or ``ignore_args`` the key generator is only called
+    with the selected arguments, by name.
 
     Parameters
     ----------
-    namespaces
+    namespace
         namespace to cache
     keygen
         function to generate a cache identifier key
-    func
-        Function
     typed
         If typed is set to true, function arguments of different types
         will be cached separately
-    args
-        Function positional arguments
-    kwargs
-        Named function arguments
+    func
+        Function
+    run
+        Runs an asynchronous key generator to completion, e.g.
+        ``EventLoopThread.run``. Without it, the key function of an
+        asynchronous key generator is a coroutine function
+    key_args
+        Names of the only arguments in the key, all of them if None
+    ignore_args
+        Names of the arguments left out of the key
+    version
+        Version of the function, the keys of each version are apart
+    key_cache
+        Number of keys of the most recent selected arguments kept, with the
+        ``cache_info`` of their ``lru_cache`` on the key function. Keys of
+        asynchronous key generators are awaited, not kept
 
     Returns
     -------
-        Cache identifier key with namespace
+        Function of the call arguments that returns the cache identifier
+        key with namespace
+
+    Raises
+    ------
+    ValueError
+        If a selected argument has the name of a parameter of ``keygen``,
+        e.g. ``typed`` or ``func``.
 
     """
-    key = await ensure_async(
-        keygen or default_keygen, typed, func, *args, **kwargs
+    prefix = f'{namespace}:' if version is None else f'{namespace}:{version}-'
+
+    if keygen is None:
+        compiled = compile_keygen(typed, func)
+
+        def key(*args: P.args, **kwargs: P.kwargs) -> str:
+            return prefix + compiled(*args, **kwargs)
+
+    elif not asyncio.iscoroutinefunction(keygen):
+
+        def key(*args: P.args, **kwargs: P.kwargs) -> str:
+            return prefix + keygen(typed, func, *args, **kwargs)
+
+    elif run is not None:
+
+        def key(*args: P.args, **kwargs: P.kwargs) -> str:
+            return prefix + run(partial(keygen, typed, func, *args, **kwargs))
+
+    else:
+
+        async def key(*args: P.args, **kwargs: P.kwargs) -> str:
+            return prefix + await keygen(typed, func, *args, **kwargs)
+
+    return select_arguments(
+        key, func, key_args, ignore_args, keygen, key_cache
     )
-    return f'{namespace}:{key}'
+
+
+def select_arguments(
+    key: Callable[..., Any],
+    func: Func,
+    key_args: Optional[Sequence[str]] = None,
+    ignore_args: Sequence[str] = (),
+    keygen: Optional[KeyGenerator] = None,
+    key_cache: int = 0,
+) -> Callable[..., Any]:
+    """Call a key function with the selected arguments only.
+
+    Parameters
+    ----------
+    key
+        Key function
+    func
+        Function
+    key_args
+        Names of the only arguments in the key, all of them if None
+    ignore_args
+        Names of the arguments left out of the key
+    keygen
+        Key generator called by the key function, the selected arguments
+        are passed to it by name
+    key_cache
+        Number of keys of the most recent selected arguments kept, with the
+        ``cache_info`` of their ``lru_cache`` on the key function. Keys of
+        asynchronous key functions are awaited, not kept
+
+    Returns
+    -------
+        Key function of the call arguments, the same key function if all
+        the arguments are selected
+
+    Raises
+    ------
+    ValueError
+        If a selected argument has the name of a parameter of ``keygen``.
+
+    """
+    # Only the selected arguments are kept, e.g. not a session or self
+    if key_cache and not asyncio.iscoroutinefunction(key):
+        key = memoize_key(key, key_cache)
+    if key_args is None and not ignore_args:
+        return key
+
+    select = ArgumentSelector(func, key_args, ignore_args)
+    clashes = set(select.names).intersection(keyword_parameters(keygen))
+    if clashes:
+        names = ', '.join(map(repr, sorted(clashes)))
+        raise ValueError(
+            f'arguments {names} of {func.__name__} are parameters of the '
+            f'key generator {keygen.__name__}, leave them out of the key or '
+            'rename them'
+        )
+    if asyncio.iscoroutinefunction(key):
+
+        async def selected(*args: P.args, **kwargs: P.kwargs) -> str:
+            return await key(**select(*args, **kwargs))
+
+    else:
+
+        def selected(*args: P.args, **kwargs: P.kwargs) -> str:
+            return key(**select(*args, **kwargs))
+
+        selected.cache_info = getattr(key, 'cache_info', None)
+
+    return selected
+
+
+def keyword_parameters(func: Optional[Callable[..., Any]]) -> Tuple[str, ...]:
+    """Get the names of the parameters that can be passed by name.
+
+    Parameters
+    ----------
+    func
+        Function
+
+    Returns
+    -------
+        Names of the parameters, none without a function or if its
+        signature is unknown
+
+    """
+    if func is None:
+        return ()
+    try:
+        parameters = signature(func).parameters.values()
+    except (TypeError, ValueError):
+        return ()
+
+    kinds = (Parameter.POSITIONAL_OR_KEYWORD, Parameter.KEYWORD_ONLY)
+    return tuple(param.name for param in parameters if param.kind in kinds)
+
+
+def memoize_key(key: Callable[..., str], maxsize: int) -> Callable[..., str]:
+    """Keep the keys of the most recent arguments.
+
+    The keys are kept by a ``functools.lru_cache`` of the hashable
+    arguments, arguments of different types are kept apart. Calls with
+    arguments that are not hashable build their key every time.
+
+    Parameters
+    ----------
+    key
+        Synchronous key function
+    maxsize
+        Maximum number of keys kept
+
+    Returns
+    -------
+        Key function with the ``cache_info`` of its ``lru_cache``
+
+    """
+    cached = lru_cache(maxsize=maxsize, typed=True)(key)
+
+    def memoized(*args: P.args, **kwargs: P.kwargs) -> str:
+        try:
+            return cached(*args, **kwargs)
+        except TypeError:
+            return key(*args, **kwargs)
+
+    memoized.cache_info = cached.cache_info
+    return memoized
+
+
+def to_timedelta(value: Union[int, float, timedelta]) -> timedelta:
+    """Convert seconds to a timedelta.
+
+    Parameters
+    ----------
+    value
+        Seconds or timedelta, ``math.inf`` is converted to the longest
+        supported time
+
+    """
+    if isinstance(value, timedelta):
+        return value
+    if isinf(value):
+        return timedelta(weeks=20e3)
+    return timedelta(seconds=value)
 
 
 def decoder_name(obj) -> str:
@@ -113,32 +305,130 @@ async def ensure_async(func: Func, *args: P.args, **kwargs: P.kwargs) -> Any:
     return await result if isawaitable(result) else result
 
 
-def manipulate(manipulator: Manipulator) -> Decorator:
+def manipulate(
+    manipulator: Manipulator, sync_manipulator: Manipulator
+) -> Decorator:
     """Decorate a function.
 
     Parameters
     ----------
     manipulator
-        Function that will handle a decorated function
+        Asynchronous function that will handle a decorated asynchronous
+        function
+    sync_manipulator
+        Synchronous function that will handle a decorated synchronous
+        function, with plain calls, without creating an event loop
 
     """
-    try:
-        nest_asyncio.apply()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        nest_asyncio.apply(loop)
 
     def wrapper(func: Func) -> Func:
         async def _async(*args: P.args, **kwargs: P.kwargs) -> T:
             return await manipulator(func, *args, **kwargs)
 
         def _sync(*args: P.args, **kwargs: P.kwargs) -> T:
-            return asyncio.run(
-                ensure_async(manipulator, func, *args, **kwargs)
-            )
+            return sync_manipulator(func, *args, **kwargs)
 
         if asyncio.iscoroutinefunction(func):
             return wraps(func)(_async)
         return wraps(func)(_sync)
 
     return wrapper
+
+
+class EventLoopThread:
+    """Long-lived event loop running in a daemon thread.
+
+    Allows synchronous code to run coroutines without creating an event loop
+    per call, so anything bound to the loop (e.g. connection pools) is reused
+    across calls. The thread is started on first use.
+
+    Examples
+    --------
+    >>> runner = EventLoopThread()
+    >>> runner.run(asyncio.sleep, 0, 'done')
+    'done'
+
+    """
+
+    def __init__(self):
+        """Initialize the instance."""
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Get the running loop, starting its thread if needed.
+
+        Returns
+        -------
+        loop : asyncio.AbstractEventLoop
+            Event loop running in the background thread.
+
+        """
+        if self._loop is None:
+            with self._lock:
+                if self._loop is None:
+                    loop = asyncio.new_event_loop()
+                    self._thread = threading.Thread(
+                        target=loop.run_forever,
+                        name='cachetoolz-loop',
+                        daemon=True,
+                    )
+                    self._thread.start()
+                    self._loop = loop
+        return self._loop
+
+    def run(self, func: Func, *args: P.args, **kwargs: P.kwargs) -> Any:
+        """Run a function in the loop and wait for its result.
+
+        Parameters
+        ----------
+        func
+            Function
+        args
+            Function positional arguments
+        kwargs
+            Named function arguments
+
+        """
+        return asyncio.run_coroutine_threadsafe(
+            ensure_async(func, *args, **kwargs), self.loop
+        ).result()
+
+    def close(self) -> None:
+        """Stop the loop and wait for its thread to finish."""
+        with self._lock:
+            if self._loop is None:
+                return
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+            self._loop = self._thread = None
+
+
+class BlockingProxy:
+    """Call the methods of an asynchronous object from synchronous code.
+
+    Every method call is run on an ``EventLoopThread``.
+
+    Parameters
+    ----------
+    obj
+        Object with asynchronous methods
+    runner
+        Event loop thread where the methods run
+
+    """
+
+    def __init__(self, obj: Any, runner: EventLoopThread):
+        """Initialize the instance."""
+        self._obj = obj
+        self._runner = runner
+
+    def __getattr__(self, name: str) -> Any:
+        """Get a blocking version of an attribute of the object."""
+        attr = getattr(self._obj, name)
+        if not callable(attr):
+            return attr
+        return partial(self._runner.run, attr)
@@ -0,0 +1,280 @@
+"""Write-behind implementation."""
+
+import asyncio
+import atexit
+import queue
+import threading
+from datetime import timedelta
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from .log import get_logger
+from .types import Value
+
+Write = Tuple[str, Value, timedelta]
+
+# Stops the writer thread once the writes queued before it are done
+_STOP = object()
+
+
+class WriteBehind:
+    """Bounded background writer of cache entries.
+
+    Writes are queued and sent to the backend in batches by a daemon thread,
+    started on first use. When the queue is full, writes are dropped and
+    counted. Pending writes are flushed on interpreter exit.
+
+    Parameters
+    ----------
+    write
+        Function that stores a batch of ``(key, value, expires_at)`` writes
+    maxsize
+        Maximum number of queued writes
+    batch_size
+        Maximum number of writes sent in a single batch
+
+    Examples
+    --------
+    >>> backend = InMemory()
+    >>> writer = WriteBehind(
+    ...     lambda batch: [backend.set(*write) for write in batch]
+    ... )
+    >>> writer.put('ns:key', '1', timedelta(seconds=60))
+    True
+    >>> writer.flush()
+
+    """
+
+    def __init__(
+        self,
+        write: Callable[[List[Write]], None],
+        maxsize: int = 1000,
+        batch_size: int = 100,
+    ):
+        """Initialize the instance."""
+        self._write = write
+        self._batch_size = batch_size
+        self._queue: queue.Queue = queue.Queue(maxsize)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._logger = get_logger()
+        self.dropped = 0
+
+    @property
+    def pending(self) -> int:
+        """Get the number of queued writes."""
+        return self._queue.qsize()
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._run, name='cachetoolz-writer', daemon=True
+            )
+            self._thread.start()
+        atexit.register(self.close)
+
+    def put(self, key: str, value: Value, expires_at: timedelta) -> bool:
+        """Queue a write.
+
+        Parameters
+        ----------
+        key : str
+            cache identifier key.
+        value : str | bytes
+            value to cache encoded.
+        expires_at : datetime.timedelta
+            expiry time.
+
+        Returns
+        -------
+        queued : bool
+            If the write was queued, it is dropped when the queue is full.
+
+        """
+        if self._thread is None:
+            self._start()
+
+        try:
+            self._queue.put_nowait((key, value, expires_at))
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            self._logger.warning("Write behind queue full, drop 'key=%s'", key)
+            return False
+        return True
+
+    def _next_batch(self) -> list:
+        batch = [self._queue.get()]
+        while len(batch) < self._batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            writes = [write for write in batch if write is not _STOP]
+            try:
+                if writes:
+                    self._write(writes)
+            except Exception as exception:
+                self._logger.error(
+                    "Error to write behind 'keys=%s': exception=%s",
+                    [key for key, *_ in writes],
+                    exception,
+                )
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+            if len(writes) < len(batch):
+                return
+
+    def flush(self) -> None:
+        """Wait until every queued write is done."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        """Flush the queued writes and stop the writer thread.
+
+        The thread is started again on the next write.
+
+        """
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._queue.put(_STOP)
+        thread.join()
+        atexit.unregister(self.close)
+
+
+class AsyncWriteBehind:
+    """Bounded background writer of cache entries of event loops.
+
+    Writes are queued by event loop and sent to the backend in batches by a
+    task of that loop, started on first use, so clients bound to the loop,
+    like connection pools, are only used from it. When the queue is full,
+    writes are dropped and counted. The writes still queued when the task
+    is cancelled, e.g. at the end of ``asyncio.run``, are sent before it
+    ends.
+
+    Parameters
+    ----------
+    write
+        Coroutine function that stores a batch of ``(key, value,
+        expires_at)`` writes
+    maxsize
+        Maximum number of queued writes of each loop
+    batch_size
+        Maximum number of writes sent in a single batch
+
+    Examples
+    --------
+    >>> backend = AsyncInMemory()
+    >>> writer = AsyncWriteBehind(backend.set_many)
+    >>> writer.put('ns:key', '1', timedelta(seconds=60))
+    True
+    >>> await writer.flush()
+
+    """
+
+    def __init__(
+        self,
+        write: Callable[[List[Write]], Awaitable[None]],
+        maxsize: int = 1000,
+        batch_size: int = 100,
+    ):
+        """Initialize the instance."""
+        self._write = write
+        self._maxsize = maxsize
+        self._batch_size = batch_size
+        # Writes waiting to be sent by loop, the queues are bound to it
+        self._queues: Dict[int, asyncio.Queue] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._lock = threading.Lock()
+        self._logger = get_logger()
+        self.dropped = 0
+
+    @property
+    def pending(self) -> int:
+        """Get the number of queued writes of all the loops."""
+        return sum(queue_.qsize() for queue_ in list(self._queues.values()))
+
+    def _start(self, loop: asyncio.AbstractEventLoop) -> asyncio.Queue:
+        queue_ = self._queues[id(loop)] = asyncio.Queue(self._maxsize)
+        task = loop.create_task(self._run(queue_))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        task.add_done_callback(lambda _: self._forget(id(loop), queue_))
+        return queue_
+
+    def _forget(self, loop_id: int, queue_: asyncio.Queue) -> None:
+        if self._queues.get(loop_id) is queue_:
+            del self._queues[loop_id]
+
+    def put(self, key: str, value: Value, expires_at: timedelta) -> bool:
+        """Queue a write to the running loop.
+
+        Parameters
+        ----------
+        key : str
+            cache identifier key.
+        value : str | bytes
+            value to cache encoded.
+        expires_at : datetime.timedelta
+            expiry time.
+
+        Returns
+        -------
+        queued : bool
+            If the write was queued, it is dropped when the queue is full.
+
+        """
+        loop = asyncio.get_running_loop()
+        if (queue_ := self._queues.get(id(loop))) is None:
+            queue_ = self._start(loop)
+
+        try:
+            queue_.put_nowait((key, value, expires_at))
+        except asyncio.QueueFull:
+            with self._lock:
+                self.dropped += 1
+            self._logger.warning("Write behind queue full, drop 'key=%s'", key)
+            return False
+        return True
+
+    async def _write_batch(self, queue_: asyncio.Queue, batch: list) -> None:
+        while len(batch) < self._batch_size and not queue_.empty():
+            batch.append(queue_.get_nowait())
+        try:
+            await self._write(batch)
+        except Exception as exception:
+            self._logger.error(
+                "Error to write behind 'keys=%s': exception=%s",
+                [key for key, *_ in batch],
+                exception,
+            )
+        finally:
+            for _ in batch:
+                queue_.task_done()
+
+    async def _run(self, queue_: asyncio.Queue) -> None:
+        try:
+            while True:
+                await self._write_batch(queue_, [await queue_.get()])
+        except asyncio.CancelledError:
+            # The loop is closing, the writes left are sent before it does
+            while not queue_.empty():
+                await self._write_batch(queue_, [])
+            raise
+
+    async def flush(self) -> None:
+        """Wait until every write queued by the running loop is done."""
+        loop = asyncio.get_running_loop()
+        if (queue_ := self._queues.get(id(loop))) is not None:
+            await queue_.join()
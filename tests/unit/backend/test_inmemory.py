@@ -115,3 +115,94 @@ async def _(backend=async_backend):
     await backend.clear(namespace)
 
     assert not backend._store[namespace]
+
+
+@test('InMemory(lease): acquire', tags=['unit', 'backend', 'inmemory', 'lease'])
+def _(backend=sync_backend):
+    key = 'namespace:key'
+
+    assert backend.acquire_lease(key, timedelta(seconds=10))
+    assert not backend.acquire_lease(key, timedelta(seconds=10))
+
+    backend.release_lease(key)
+    assert backend.acquire_lease(key, timedelta(seconds=10))
+
+
+@test('InMemory(lease): expired', tags=['unit', 'backend', 'inmemory', 'lease'])
+def _(backend=sync_backend):
+    key = 'namespace:key'
+
+    assert backend.acquire_lease(key, -timedelta(seconds=10))
+    assert backend.acquire_lease(key, timedelta(seconds=10))
+
+
+@test(
+    'AsyncInMemory(lease): acquire',
+    tags=['unit', 'backend', 'inmemory', 'async', 'lease'],
+)
+async def _(backend=async_backend):
+    key = 'namespace:key'
+
+    assert await backend.acquire_lease(key, timedelta(seconds=10))
+    assert not await backend.acquire_lease(key, timedelta(seconds=10))
+
+    await backend.release_lease(key)
+    assert await backend.acquire_lease(key, timedelta(seconds=10))
+
+
+@test(
+    'AsyncInMemory(lease): expired',
+    tags=['unit', 'backend', 'inmemory', 'async', 'lease'],
+)
+async def _(backend=async_backend):
+    key = 'namespace:key'
+
+    assert await backend.acquire_lease(key, -timedelta(seconds=10))
+    assert await backend.acquire_lease(key, timedelta(seconds=10))
+
+
+@test('InMemory(many): set, get and delete', tags=['unit', 'backend', 'inmemory', 'many'])
+def _(backend=sync_backend):
+    backend.set_many(
+        [
+            ('ns:a', '1', timedelta(seconds=60)),
+            ('other:b', '2', timedelta(seconds=60)),
+            ('ns:c', '3', -timedelta(seconds=60)),
+        ]
+    )
+
+    assert backend.get_many(['ns:a', 'other:b', 'ns:c', 'ns:d']) == [
+        '1',
+        '2',
+        None,
+        None,
+    ]
+
+    backend.delete_many(['ns:a', 'ns:d'])
+    backend.delete('other:b')
+    assert backend.get_many(['ns:a', 'other:b']) == [None, None]
+
+
+@test(
+    'AsyncInMemory(many): set, get and delete',
+    tags=['unit', 'backend', 'inmemory', 'async', 'many'],
+)
+async def _(backend=async_backend):
+    await backend.set_many(
+        [
+            ('ns:a', '1', timedelta(seconds=60)),
+            ('other:b', '2', timedelta(seconds=60)),
+            ('ns:c', '3', -timedelta(seconds=60)),
+        ]
+    )
+
+    assert await backend.get_many(['ns:a', 'other:b', 'ns:c', 'ns:d']) == [
+        '1',
+        '2',
+        None,
+        None,
+    ]
+
+    await backend.delete_many(['ns:a', 'ns:d'])
+    await backend.delete('other:b')
+    assert await backend.get_many(['ns:a', 'other:b']) == [None, None]
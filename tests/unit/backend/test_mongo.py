@@ -70,9 +70,8 @@ def _(backend=sync_backend):
 
 
 @test('MongoBackend(get): found', tags=['unit', 'backend', 'mongo', 'get'])
-def _(backend=sync_backend):
+def _(backend=sync_backend, value=each(fake.pystr(), b'\x80\x00\xff')):
     key = 'namespace:{fake.uuid4()}'
-    value = fake.pystr()
     backend.set(key, value, expires_at=timedelta(days=10))
 
     assert backend.get(key) == value
@@ -132,9 +131,10 @@ async def _(backend=async_backend):
     'AsyncMongoBackend(get): found',
     tags=['unit', 'backend', 'mongo', 'async', 'get'],
 )
-async def _(backend=async_backend):
+async def _(
+    backend=async_backend, value=each(fake.pystr(), b'\x80\x00\xff')
+):
     key = 'namespace:{fake.uuid4()}'
-    value = fake.pystr()
     await backend.set(key, value, expires_at=timedelta(seconds=60))
 
     assert await backend.get(key) == value
@@ -151,3 +151,82 @@ async def _(backend=async_backend, database=async_mongo):
     await backend.clear(namespace)
 
     assert namespace not in await database.list_collection_names()
+
+
+@test('MongoBackend(lease): acquire', tags=['unit', 'backend', 'mongo', 'lease'])
+def _(backend=sync_backend, database=sync_mongo):
+    key = f'namespace:{fake.uuid4()}'
+    other = MongoBackend(url, db_sync)
+
+    assert backend.acquire_lease(key, timedelta(seconds=10))
+    assert not other.acquire_lease(key, timedelta(seconds=10))
+
+    other.release_lease(key)
+    backend.release_lease(key)
+    assert other.acquire_lease(key, timedelta(seconds=10))
+
+
+@test('MongoBackend(lease): expired', tags=['unit', 'backend', 'mongo', 'lease'])
+def _(backend=sync_backend, database=sync_mongo):
+    key = f'namespace:{fake.uuid4()}'
+    other = MongoBackend(url, db_sync)
+
+    assert backend.acquire_lease(key, -timedelta(seconds=10))
+    assert other.acquire_lease(key, timedelta(seconds=10))
+
+
+@test(
+    'AsyncMongoBackend(lease): acquire',
+    tags=['unit', 'backend', 'mongo', 'async', 'lease'],
+)
+async def _(backend=async_backend, database=async_mongo):
+    key = f'namespace:{fake.uuid4()}'
+    other = AsyncMongoBackend(url, db_async)
+
+    assert await backend.acquire_lease(key, timedelta(seconds=10))
+    assert not await other.acquire_lease(key, timedelta(seconds=10))
+
+    await other.release_lease(key)
+    await backend.release_lease(key)
+    assert await other.acquire_lease(key, timedelta(seconds=10))
+
+
+@test('MongoBackend(many): set, get and delete', tags=['unit', 'backend', 'mongo', 'many'])
+def _(backend=sync_backend, database=sync_mongo):
+    keys = ['ns:a', 'other:b', 'ns:c', 'ns:d']
+
+    backend.set_many(
+        [
+            ('ns:a', '1', timedelta(seconds=60)),
+            ('other:b', '2', timedelta(seconds=60)),
+            ('ns:c', '3', -timedelta(seconds=60)),
+        ]
+    )
+
+    assert backend.get_many(keys) == ['1', '2', None, None]
+
+    backend.delete_many(keys)
+    assert database['ns'].count_documents({}) == 0
+    assert database['other'].count_documents({}) == 0
+
+
+@test(
+    'AsyncMongoBackend(many): set, get and delete',
+    tags=['unit', 'backend', 'mongo', 'async', 'many'],
+)
+async def _(backend=async_backend, database=async_mongo):
+    keys = ['ns:a', 'other:b', 'ns:c', 'ns:d']
+
+    await backend.set_many(
+        [
+            ('ns:a', '1', timedelta(seconds=60)),
+            ('other:b', '2', timedelta(seconds=60)),
+            ('ns:c', '3', -timedelta(seconds=60)),
+        ]
+    )
+
+    assert await backend.get_many(keys) == ['1', '2', None, None]
+
+    await backend.delete_many(keys)
+    assert await database['ns'].count_documents({}) == 0
+    assert await database['other'].count_documents({}) == 0
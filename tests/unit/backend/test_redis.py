@@ -67,12 +67,12 @@ def _(backend=sync_backend, database=sync_redis):
 
 
 @test('RedisBackend(get): found', tags=['unit', 'backend', 'redis', 'get'])
-def _(backend=sync_backend):
+def _(backend=sync_backend, value=each(fake.pystr(), b'\x80\x00\xff')):
     key = f'namespace:{fake.uuid4()}'
-    value = fake.pystr()
     backend.set(key, value, expires_at=timedelta(seconds=60))
 
-    assert backend.get(key) == value
+    expect = value.encode() if isinstance(value, str) else value
+    assert backend.get(key) == expect
 
 
 @test(
@@ -129,12 +129,14 @@ async def _(backend=async_backend, database=async_redis):
     'AsyncRedisBackend(get): found',
     tags=['unit', 'backend', 'redis', 'async', 'get'],
 )
-async def _(backend=async_backend):
+async def _(
+    backend=async_backend, value=each(fake.pystr(), b'\x80\x00\xff')
+):
     key = f'namespace:{fake.uuid4()}'
-    value = fake.pystr()
     await backend.set(key, value, expires_at=timedelta(seconds=60))
 
-    assert await backend.get(key) == value
+    expect = value.encode() if isinstance(value, str) else value
+    assert await backend.get(key) == expect
 
 
 @test(
@@ -148,3 +150,67 @@ async def _(backend=async_backend, database=async_redis):
     await backend.clear(namespace)
 
     assert not await database.exists(f'{namespace}:*')
+
+
+@test('RedisBackend(lease): acquire', tags=['unit', 'backend', 'redis', 'lease'])
+def _(backend=sync_backend, database=sync_redis):
+    key = f'namespace:{fake.uuid4()}'
+    other = RedisBackend(sync_url)
+
+    assert backend.acquire_lease(key, timedelta(seconds=10))
+    assert not other.acquire_lease(key, timedelta(seconds=10))
+
+    other.release_lease(key)
+    assert database.exists(f'{key}:lease')
+
+    backend.release_lease(key)
+    assert other.acquire_lease(key, timedelta(seconds=10))
+
+
+@test(
+    'AsyncRedisBackend(lease): acquire',
+    tags=['unit', 'backend', 'redis', 'async', 'lease'],
+)
+async def _(backend=async_backend, database=async_redis):
+    key = f'namespace:{fake.uuid4()}'
+    other = AsyncRedisBackend(async_url)
+
+    assert await backend.acquire_lease(key, timedelta(seconds=10))
+    assert not await other.acquire_lease(key, timedelta(seconds=10))
+
+    await other.release_lease(key)
+    assert await database.exists(f'{key}:lease')
+
+    await backend.release_lease(key)
+    assert await other.acquire_lease(key, timedelta(seconds=10))
+
+
+@test('RedisBackend(many): set, get and delete', tags=['unit', 'backend', 'redis', 'many'])
+def _(backend=sync_backend, database=sync_redis):
+    keys = [f'namespace:{fake.uuid4()}' for _ in range(3)]
+
+    backend.set_many([(key, key, timedelta(seconds=60)) for key in keys[:2]])
+
+    assert backend.get_many(keys) == [keys[0].encode(), keys[1].encode(), None]
+    assert backend.get_many([]) == []
+
+    backend.delete_many(keys)
+    assert database.mget(keys) == [None, None, None]
+
+
+@test(
+    'AsyncRedisBackend(many): set, get and delete',
+    tags=['unit', 'backend', 'redis', 'async', 'many'],
+)
+async def _(backend=async_backend, database=async_redis):
+    keys = [f'namespace:{fake.uuid4()}' for _ in range(3)]
+
+    await backend.set_many(
+        [(key, key, timedelta(seconds=60)) for key in keys[:2]]
+    )
+
+    assert await backend.get_many(keys) == [keys[0].encode(), keys[1].encode(), None]
+    assert await backend.get_many([]) == []
+
+    await backend.delete_many(keys)
+    assert await database.mget(keys) == [None, None, None]
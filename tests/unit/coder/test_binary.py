@@ -0,0 +1,60 @@
+import os
+import pickle
+import re
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from fractions import Fraction
+from ipaddress import IPv4Interface, IPv6Network
+from pathlib import Path
+from uuid import UUID
+
+from ward import each, raises, test
+
+from cachetoolz.coder import PickleCoder
+from cachetoolz.types import CachedError
+
+decoded = (
+    {'key': [1, 2.0, None]},
+    {1, 2},
+    frozenset([1, 2]),
+    b'\x00\xff',
+    bytearray(b'\x80'),
+    deque([1, 2], 4),
+    datetime(2023, 7, 9, 17, 34, tzinfo=timezone(timedelta(hours=-3))),
+    Decimal('Infinity'),
+    Path('.'),
+    IPv4Interface('192.0.2.1/32'),
+    IPv6Network('2001:db8::/128'),
+    re.compile(r'\s'),
+    UUID('aecd57c4-5bf2-433a-b642-08f75465d6b9'),
+    CachedError(name='builtins.TimeoutError', args=['upstream']),
+)
+
+
+@test('pickle round trip: {value}', tags=['unit', 'coder', 'pickle'])
+def _(value=each(*decoded)):
+    coder = PickleCoder()
+    encoded = coder.encode(value)
+
+    assert isinstance(encoded, bytes)
+    assert coder.decode(encoded) == value
+
+
+@test('pickle allowed globals', tags=['unit', 'coder', 'pickle'])
+def _(allow=each(['fractions.Fraction'], ['fractions'])):
+    coder = PickleCoder(allow=allow)
+    assert coder.decode(coder.encode([Fraction(1, 3)])) == [Fraction(1, 3)]
+
+
+@test(
+    'pickle globals not allowed',
+    tags=['unit', 'coder', 'pickle', 'raise'],
+)
+def _(value=each(Fraction(1, 3), os.system, [print])):
+    encoded = pickle.dumps(value, protocol=5)
+
+    with raises(pickle.UnpicklingError) as exp:
+        PickleCoder(allow=['builtins.eval']).decode(encoded)
+
+    assert exp.raised.args[0].endswith('is not allowed')
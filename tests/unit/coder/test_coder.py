@@ -15,12 +15,11 @@ from pathlib import Path
 from typing import Dict
 from uuid import UUID
 
-
 from ward import each, raises, test
 
 from cachetoolz.coder import coder
 from cachetoolz.exceptions import RegistryError, UnknownDecoderError
-
+from cachetoolz.types import CachedError
 
 decoded = (
     {'key': 'value'},
@@ -49,6 +48,7 @@ decoded = (
     IPv6Network('2001:db8::/128'),
     re.compile(r'\s'),
     UUID('aecd57c4-5bf2-433a-b642-08f75465d6b9'),
+    CachedError(name='builtins.TimeoutError', args=['upstream']),
 )
 
 encoded = (
@@ -64,7 +64,7 @@ encoded = (
     '{"__val": [1, 2], "__decoder": "frozenset"}',
     '{"__val": 60.0, "__decoder": "timedelta"}',
     '{"__val": {"iterable": [1, 2], "maxlen": 4}, "__decoder": "deque"}',
-    '{"__val": {"bytes": "b", "encoding": "ascii"}, "__decoder": "bytes"}',
+    '{"__val": "Yg==", "__decoder": "bytes"}',
     '{"__val": "10:00:00", "__decoder": "time"}',
     '{"__val": "2023-07-09", "__decoder": "date"}',
     '{"__val": "2023-07-09 17:34:53.149702", "__decoder": "datetime"}',
@@ -78,6 +78,8 @@ encoded = (
     '{"__val": "2001:db8::/128", "__decoder": "ipv6network"}',
     '{"__val": {"pattern": "\\"\\\\\\\\s\\"", "flags": 32}, "__decoder": "pattern"}',
     '{"__val": "aecd57c4-5bf2-433a-b642-08f75465d6b9", "__decoder": "uuid"}',
+    '{"__val": {"name": "builtins.TimeoutError", "args": ["upstream"]}, '
+    '"__decoder": "cachederror"}',
 )
 
 
@@ -136,6 +138,28 @@ def _(encode=each(*encoded), decode=each(*decoded)):
     assert coder.decode(encode) == decode
 
 
+@test('json: decode bytes', tags=['unit', 'coder', 'decode'])
+def _():
+    assert coder.decode('{"ação": [1]}'.encode()) == {'ação': [1]}
+
+
+@test('json: decode bytes of previous versions', tags=['unit', 'coder'])
+def _(
+    encoded=each(
+        '{"__val": {"bytes": "b", "encoding": "ascii"}, "__decoder": "bytes"}',
+        '{"__val": {"bytes": "ação", "encoding": "utf_8"}, '
+        '"__decoder": "bytes"}',
+    ),
+    expect=each(b'b', 'ação'.encode()),
+):
+    assert coder.decode(encoded) == expect
+
+
+@test('json: bytes round trip', tags=['unit', 'coder'])
+def _(value=each(b'', bytes(range(256)), b'\xff\xfe\x00' * 1000)):
+    assert coder.decode(coder.encode(value)) == value
+
+
 @test('json decoder not found', tags=['unit', 'decode', 'decode', 'raise'])
 def _():
     with raises(UnknownDecoderError) as exp:
@@ -0,0 +1,84 @@
+import zlib
+
+from ward import each, raises, test
+
+from cachetoolz.coder import CompressedCoder, PickleCoder, coder
+
+value = [{'id': index, 'name': 'name' * 10} for index in range(100)]
+
+
+@test('compressed round trip', tags=['unit', 'coder', 'compress'])
+def _(
+    algorithm=each('zlib', 'lzma', 'bz2', 'zlib'),
+    inner=each(coder, coder, PickleCoder(), PickleCoder()),
+    level=each(None, 1, 9, 6),
+):
+    compressed = CompressedCoder(inner, algorithm, level=level)
+    encoded = compressed.encode(value)
+
+    assert encoded[:1] == b'\x01'
+    assert len(encoded) < len(inner.encode(value))
+    assert compressed.decode(encoded) == value
+
+
+@test('small values are not compressed', tags=['unit', 'coder', 'compress'])
+def _(small=each([1, 2], 'a' * 200)):
+    compressed = CompressedCoder(coder, threshold=256)
+
+    assert compressed.encode(small) == coder.encode(small)
+    assert compressed.decode(coder.encode(small).encode()) == small
+    assert compressed.stats['compression_count'] == 0
+
+
+@test('mixed compressed values', tags=['unit', 'coder', 'compress'])
+def _():
+    zlib_coder = CompressedCoder(coder, threshold=0)
+    lzma_coder = CompressedCoder(coder, 'lzma', threshold=0)
+
+    assert lzma_coder.decode(zlib_coder.encode(value)) == value
+    assert zlib_coder.decode(lzma_coder.encode(value)) == value
+    assert zlib_coder.decode(coder.encode(value)) == value
+
+
+class BytesCoder:
+    def encode(self, value):
+        return value
+
+    def decode(self, value):
+        return value
+
+
+@test('values that look compressed', tags=['unit', 'coder', 'compress'])
+def _():
+    compressed = CompressedCoder(BytesCoder(), threshold=0)
+    data = b'\x01z'
+
+    encoded = compressed.encode(data)
+
+    assert encoded == b'\x01n\x01z'
+    assert compressed.decode(encoded) == data
+
+
+@test('compression stats', tags=['unit', 'coder', 'compress'])
+def _():
+    compressed = CompressedCoder(coder)
+    encoded = compressed.encode(value)
+    compressed.decode(encoded)
+
+    stats = compressed.stats
+    size = len(coder.encode(value))
+    assert stats['compression_count'] == 1
+    assert stats['compression_ratio'] == size / len(encoded)
+    assert stats['compression_cpu_seconds'] >= 0
+    assert stats['decompression_cpu_seconds'] >= 0
+    assert zlib.decompress(encoded[2:]).decode() == coder.encode(value)
+
+
+@test('unknown algorithm', tags=['unit', 'coder', 'compress', 'raise'])
+def _():
+    with raises(ValueError) as exp:
+        CompressedCoder(coder, 'gzip')
+
+    assert exp.raised.args[0] == (
+        "algorithm must be one of zlib, lzma, bz2, got 'gzip'"
+    )
@@ -1,8 +1,17 @@
+import json
+from collections import deque
 from dataclasses import dataclass
+from uuid import UUID
 
 from ward import each, raises, test
 
-from cachetoolz.coder.encoder import encode, register
+from cachetoolz.coder.encoder import (
+    Encoder,
+    dispatch,
+    encode,
+    encode_items,
+    register,
+)
 from cachetoolz.exceptions import RegistryError, UnknownEncoderError
 
 
@@ -55,3 +64,53 @@ def _(
 
     assert exp.expected_ex_type == RegistryError
     assert exp.raised.args[0] == error_msg
+
+
+@dataclass
+class ColorCMYK:
+    name: str
+
+
+@test('dispatch is cached by type', tags=['unit', 'encoder', 'dispatch'])
+def _():
+    assert dispatch(ColorCMYK) is encode.dispatch(object)
+
+    @register('color_cmyk')
+    def _(value: ColorCMYK):
+        return value.name
+
+    assert dispatch(ColorCMYK) is encode.dispatch(ColorCMYK)
+    assert dispatch(ColorCMYK) is dispatch(ColorCMYK)
+    assert Encoder().encode([ColorCMYK('cyan')]) == (
+        '[{"__val": "cyan", "__decoder": "color_cmyk"}]'
+    )
+
+
+@test('encode sequence items', tags=['unit', 'encoder', 'dispatch'])
+def _(
+    values=each(
+        [UUID(int=1), UUID(int=2)],
+        (UUID(int=1), 1),
+        [1, UUID(int=1)],
+        [],
+    ),
+    expect=each(
+        [encode(UUID(int=1)), encode(UUID(int=2))],
+        (UUID(int=1), 1),
+        [1, UUID(int=1)],
+        [],
+    ),
+):
+    assert encode_items(values) == expect
+
+
+@test('encoded containers', tags=['unit', 'encoder', 'dispatch'])
+def _(
+    value=each(
+        [UUID(int=1)] * 3,
+        (UUID(int=1), 1, [UUID(int=2)]),
+        {UUID(int=1)},
+        deque([UUID(int=1), 'a', (1, 2)]),
+    )
+):
+    assert Encoder().encode(value) == json.dumps(value, default=encode)
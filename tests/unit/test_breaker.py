@@ -0,0 +1,61 @@
+import time
+
+from ward import raises, test
+
+from cachetoolz.breaker import CircuitBreaker
+
+
+@test('breaker opens on the error rate', tags=['unit', 'breaker'])
+def _():
+    breaker = CircuitBreaker(error_rate=0.5, window=4, cooldown=60)
+
+    for error in (True, False, False):
+        breaker.record(0.01, error)
+    assert breaker.state == 'closed'
+
+    breaker.record(0.01, error=True)
+    assert breaker.state == 'open'
+    assert not breaker.allow()
+
+
+@test('breaker counts slow calls as failures', tags=['unit', 'breaker'])
+def _():
+    breaker = CircuitBreaker(error_rate=1, slow_call=0.1, window=2)
+
+    breaker.record(0.2)
+    breaker.record(0.01)
+    assert breaker.state == 'closed'
+
+    breaker.record(0.2)
+    assert breaker.state == 'closed'
+
+    breaker.record(0.2)
+    assert breaker.state == 'open'
+
+
+@test('breaker allows a single trial call', tags=['unit', 'breaker'])
+def _():
+    breaker = CircuitBreaker(error_rate=1, window=1, cooldown=0.05)
+    breaker.record(0.01, error=True)
+    assert not breaker.allow()
+
+    time.sleep(0.05)
+    assert breaker.state == 'half_open'
+    assert breaker.allow()
+    assert not breaker.allow()
+
+    breaker.record(0.01, error=True)
+    assert breaker.state == 'open'
+
+    time.sleep(0.05)
+    assert breaker.allow()
+    breaker.record(0.01)
+    assert breaker.state == 'closed'
+    assert breaker.allow()
+
+
+@test('breaker rejects an invalid error rate', tags=['unit', 'breaker'])
+def _():
+    with raises(ValueError) as exp:
+        CircuitBreaker(error_rate=2)
+    assert str(exp.raised) == 'error_rate must be between 0 and 1, got 2'
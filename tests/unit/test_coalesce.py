@@ -0,0 +1,111 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from ward import raises, test
+
+from cachetoolz.coalesce import AsyncSingleFlight, SingleFlight
+
+
+@test('single flight shares a call', tags=['unit', 'coalesce'])
+def _():
+    flight = SingleFlight()
+    calls = []
+    release = threading.Event()
+
+    def compute(value):
+        calls.append(value)
+        release.wait()
+        return value * 2
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(flight.do, 'key', compute, 2)]
+        while not calls:
+            pass
+        futures += [
+            executor.submit(flight.do, 'key', compute, 2) for _ in range(7)
+        ]
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert calls == [2]
+    assert results == [4] * 8
+    assert flight.do('key', compute, 3) == 6
+
+
+@test('single flight shares exceptions', tags=['unit', 'coalesce', 'raise'])
+def _():
+    flight = SingleFlight()
+
+    def fail():
+        raise TimeoutError('upstream')
+
+    with raises(TimeoutError):
+        flight.do('key', fail)
+
+    assert not flight._calls
+
+
+@test('async single flight shares a call', tags=['unit', 'coalesce', 'async'])
+async def _():
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def compute(value):
+        calls.append(value)
+        await asyncio.sleep(0.01)
+        return value * 2
+
+    results = await asyncio.gather(
+        *[flight.do('key', compute, 2) for _ in range(8)]
+    )
+
+    assert calls == [2]
+    assert results == [4] * 8
+    assert not flight._calls
+
+
+@test(
+    'async single flight shares exceptions',
+    tags=['unit', 'coalesce', 'async', 'raise'],
+)
+async def _():
+    flight = AsyncSingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise TimeoutError('upstream')
+
+    results = await asyncio.gather(
+        *[flight.do('key', fail) for _ in range(3)], return_exceptions=True
+    )
+
+    assert all(isinstance(result, TimeoutError) for result in results)
+    assert not flight._calls
+
+
+@test(
+    'async single flight survives a cancelled leader',
+    tags=['unit', 'coalesce', 'async'],
+)
+async def _():
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def compute(value):
+        calls.append(value)
+        await asyncio.sleep(0.01)
+        return value * 2
+
+    leader = asyncio.create_task(flight.do('key', compute, 2))
+    await asyncio.sleep(0)
+    followers = [
+        asyncio.create_task(flight.do('key', compute, 2)) for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await asyncio.gather(*followers) == [4] * 3
+    assert leader.cancelled()
+    assert calls == [2, 2]
+    assert not flight._calls
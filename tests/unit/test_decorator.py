@@ -1,12 +1,23 @@
+import asyncio
+import gc
 import operator
+import time
+import weakref
 from datetime import timedelta
+from fractions import Fraction
 from functools import reduce
-from unittest.mock import AsyncMock, Mock, create_autospec, patch
 from typing import Coroutine
+from unittest.mock import AsyncMock, Mock, create_autospec, patch
 
-from ward import each, test
+from ward import each, raises, test
 
+from cachetoolz.backend import AsyncInMemory, InMemory
+from cachetoolz.breaker import CircuitBreaker
+from cachetoolz.coder import CompressedCoder, PickleCoder, coder
 from cachetoolz.decorator import Cache
+from cachetoolz.entry import Entry, pack
+from cachetoolz.keygen import code_fingerprint, write_arguments
+from cachetoolz.types import CachedError
 
 
 def sub(*args):
@@ -26,8 +37,8 @@ def _(
     args=each((3, 5, 7), (2, 6, 8)),
     expect=each('-9', '-12'),
     key=each(
-        'default:694a0d3cd39806a828716e4fa01cffbd',
-        'default:61cc1194bdab22449db8981152909985',
+        'default:9f9296c4a6c1f3880e08e0b9a3017f44',
+        'default:5687a2b6d8ba87709cd9a6f6b1f08979',
     ),
 ):
     backend = Backend()
@@ -54,8 +65,8 @@ async def _(
     args=each((3, 5, 7), (2, 6, 8)),
     expect=each('105', '96'),
     key=each(
-        'default:9608330b4ed4c0cc3c33cdb518f6f3ec',
-        'default:ae24fe22eecba3c67041c0b143f75713',
+        'default:ca328a9a3f2c38c0edc078cb1743a8f8',
+        'default:f85633d0da0fd0c4e654faa1bc6361d9',
     ),
 ):
     backend = Backend()
@@ -80,7 +91,7 @@ async def _(
 def _(
     Backend=each(AsyncMock, Mock),
 ):
-    key = 'default:e7125ccd908f05eb3f898f41fa71106f'
+    key = 'default:4b7ec701989740f65e571bb3d0dbd073'
     expect = [1, 2]
     backend = Backend()
     backend.get.return_value = str(expect)
@@ -104,7 +115,7 @@ def _(
 async def _(
     Backend=each(AsyncMock, Mock),
 ):
-    key = 'default:3ebfe1c6cffc1aeefaf4aa1141935bba'
+    key = 'default:1a1f62ba3760c07027f0d5df52f0702c'
     expect = [1, 2]
     backend = Backend()
     backend.get.return_value = str(expect)
@@ -132,8 +143,8 @@ def _(
     args=each((3, 5, 7), (2, 6, 8)),
     expect=each('-9', '-12'),
     key=each(
-        'default:694a0d3cd39806a828716e4fa01cffbd',
-        'default:61cc1194bdab22449db8981152909985',
+        'default:9f9296c4a6c1f3880e08e0b9a3017f44',
+        'default:5687a2b6d8ba87709cd9a6f6b1f08979',
     ),
 ):
     backend = Backend()
@@ -161,8 +172,8 @@ async def _(
     args=each((3, 5, 7), (2, 6, 8)),
     expect=each('105', '96'),
     key=each(
-        'default:9608330b4ed4c0cc3c33cdb518f6f3ec',
-        'default:ae24fe22eecba3c67041c0b143f75713',
+        'default:ca328a9a3f2c38c0edc078cb1743a8f8',
+        'default:f85633d0da0fd0c4e654faa1bc6361d9',
     ),
 ):
     backend = Backend()
@@ -190,8 +201,8 @@ def _(
     args=each((3, 5, 7), (2, 6, 8)),
     expect=each('-9', '-12'),
     key=each(
-        'default:694a0d3cd39806a828716e4fa01cffbd',
-        'default:61cc1194bdab22449db8981152909985',
+        'default:9f9296c4a6c1f3880e08e0b9a3017f44',
+        'default:5687a2b6d8ba87709cd9a6f6b1f08979',
     ),
 ):
     backend = Backend()
@@ -295,3 +306,799 @@ def _(
         "Error to clear cache 'namespaces=%s': exception=%s", ('default',), exc
     )
     assert result == 1
+
+
+@test(
+    '(cache) synchronous functions with synchronous backend without loop',
+    tags=['unit', 'decorator', 'cache'],
+)
+def _():
+    backend = Mock()
+    backend.get.side_effect = [None, '-9']
+
+    with patch('asyncio.run') as run:
+        cached_sub = Cache(backend)(sub)
+        first, second = cached_sub(3, 5, 7), cached_sub(3, 5, 7)
+
+    run.assert_not_called()
+    backend.set.assert_called_once()
+    assert first == second == -9
+
+
+@test(
+    '(cache) synchronous functions with asynchronous backend reuse a loop',
+    tags=['unit', 'decorator', 'cache'],
+)
+def _():
+    loops = []
+
+    async def get(key):
+        loops.append(asyncio.get_running_loop())
+
+    backend = AsyncMock()
+    backend.get.side_effect = get
+    cache = Cache(backend)
+
+    with patch('asyncio.run') as run:
+        cached_sub = cache(sub)
+        results = cached_sub(3, 5, 7), cached_sub(3, 5, 7)
+
+    cache.close()
+
+    run.assert_not_called()
+    assert results == (-9, -9)
+    assert len(loops) == 2
+    assert loops[0] is loops[1]
+    assert loops[0].is_closed()
+
+
+@test(
+    '(cache) concurrent misses call the function once',
+    tags=['unit', 'decorator', 'cache', 'coalesce'],
+)
+async def _(coalesce=each(True, False), calls=each(1, 5)):
+    backend = AsyncMock()
+    backend.get.return_value = None
+    function = AsyncMock(return_value=[1, 2])
+    function.configure_mock(__name__='function')
+
+    async def slow():
+        await asyncio.sleep(0.01)
+        return await function()
+
+    cached = Cache(backend)(coalesce=coalesce)(slow)
+    results = await asyncio.gather(*[cached() for _ in range(5)])
+
+    assert function.await_count == calls
+    assert backend.set.await_count == calls
+    assert results == [[1, 2]] * 5
+
+
+@test(
+    '(cache) lease holder computes and releases the lease',
+    tags=['unit', 'decorator', 'cache', 'lease'],
+)
+def _(Backend=each(AsyncMock, Mock)):
+    backend = Backend()
+    backend.get.return_value = None
+    backend.acquire_lease.return_value = True
+
+    cache = Cache(backend)
+    result = cache(keygen=lambda *args: 'key', lease_ttl=5)(sub)(3, 2)
+
+    backend.acquire_lease.assert_called_once_with(
+        'default:key', timedelta(seconds=5)
+    )
+    backend.release_lease.assert_called_once_with('default:key')
+    backend.set.assert_called_once()
+    assert result == 1
+
+
+@test(
+    '(cache) without the lease waits for the value',
+    tags=['unit', 'decorator', 'cache', 'lease'],
+)
+async def _(Backend=each(AsyncMock, Mock)):
+    backend = Backend()
+    backend.get.side_effect = [None, None, '[1, 2]']
+    backend.acquire_lease.return_value = False
+    function = AsyncMock(return_value=[3])
+    function.configure_mock(__name__='function')
+
+    result = await Cache(backend)(lease_ttl=5)(function)()
+
+    function.assert_not_called()
+    backend.set.assert_not_called()
+    backend.release_lease.assert_not_called()
+    assert result == [1, 2]
+
+
+@test(
+    '(cache) without the lease computes after the wait',
+    tags=['unit', 'decorator', 'cache', 'lease'],
+)
+def _(Backend=each(AsyncMock, Mock)):
+    backend = Backend()
+    backend.get.return_value = None
+    backend.acquire_lease.return_value = False
+
+    result = Cache(backend)(lease_ttl=5, lease_wait=0.1)(sub)(3, 2)
+
+    assert backend.get.call_count > 1
+    backend.set.assert_called_once()
+    backend.release_lease.assert_not_called()
+    assert result == 1
+
+
+@test(
+    '(cache) without the lease waits for a value with metadata',
+    tags=['unit', 'decorator', 'cache', 'lease', 'stale'],
+)
+async def _(Backend=each(AsyncMock, Mock)):
+    backend = Backend()
+    backend.get.side_effect = [None, None, pack(Entry(value='[1, 2]'))]
+    backend.acquire_lease.return_value = False
+    function = AsyncMock(return_value=[3])
+    function.configure_mock(__name__='function')
+
+    result = await Cache(backend)(lease_ttl=5, stale_ttl=60)(function)()
+
+    function.assert_not_called()
+    assert result == [1, 2]
+
+
+@test(
+    '(cache) without the lease raises the error cached by the holder',
+    tags=['unit', 'decorator', 'cache', 'lease', 'cache_errors'],
+)
+async def _(Backend=each(AsyncMock, Mock)):
+    error = coder.encode(
+        CachedError(name='builtins.TimeoutError', args=['upstream'])
+    )
+    backend = Backend()
+    backend.get.side_effect = [None, None, error, None, None, error]
+    backend.acquire_lease.return_value = False
+    function = AsyncMock(return_value=[3])
+    function.configure_mock(__name__='function')
+    cache = Cache(backend)(cache_errors=(TimeoutError,), lease_ttl=5)
+
+    with raises(TimeoutError) as exp:
+        await cache(function)()
+    assert exp.raised.args == ('upstream',)
+
+    with raises(TimeoutError):
+        cache(Mock(__name__='function'))()
+
+    function.assert_not_called()
+    backend.set.assert_not_called()
+
+
+@test(
+    '(cache) stale value is returned while it is refreshed',
+    tags=['unit', 'decorator', 'cache', 'stale'],
+)
+async def _():
+    calls = []
+    now = [1_000_000.0]
+
+    async def counter():
+        calls.append(None)
+        return len(calls)
+
+    cache = Cache(AsyncInMemory())
+    cached = cache(ttl=60, stale_ttl=600)(counter)
+
+    with patch('cachetoolz.decorator.time.time', lambda: now[0]):
+        assert await cached() == 1
+        now[0] += 120
+        assert await cached() == 1
+        await asyncio.gather(*cache._tasks)
+        assert await cached() == 2
+    assert len(calls) == 2
+
+
+@test(
+    '(cache) stale value of synchronous functions is refreshed in a thread',
+    tags=['unit', 'decorator', 'cache', 'stale'],
+)
+def _():
+    calls = []
+    now = [1_000_000.0]
+
+    def counter():
+        calls.append(None)
+        return len(calls)
+
+    cache = Cache(InMemory())
+    cached = cache(ttl=60, stale_ttl=600)(counter)
+
+    with patch('cachetoolz.decorator.time.time', lambda: now[0]):
+        assert cached() == 1
+        now[0] += 120
+        assert cached() == 1
+        cache.close()
+        assert cached() == 2
+    assert len(calls) == 2
+
+
+@test(
+    '(cache) stale value is kept when the refresh raises a cached error',
+    tags=['unit', 'decorator', 'cache', 'stale', 'cache_errors'],
+)
+async def _():
+    calls = []
+    now = [1_000_000.0]
+
+    async def flaky():
+        calls.append(None)
+        if len(calls) > 1:
+            raise TimeoutError('down')
+        return len(calls)
+
+    cache = Cache(AsyncInMemory())
+    cached = cache(ttl=60, stale_ttl=600, cache_errors=(TimeoutError,))(flaky)
+
+    with patch('cachetoolz.decorator.time.time', lambda: now[0]):
+        assert await cached() == 1
+        now[0] += 120
+        assert await cached() == 1
+        await asyncio.gather(*cache._tasks)
+        assert await cached() == 1
+        await asyncio.gather(*cache._tasks)
+    assert len(calls) == 3
+
+
+@test(
+    '(cache) stale value of synchronous functions is kept when the refresh '
+    'raises a cached error',
+    tags=['unit', 'decorator', 'cache', 'stale', 'cache_errors'],
+)
+def _():
+    calls = []
+    now = [1_000_000.0]
+
+    def flaky():
+        calls.append(None)
+        if len(calls) > 1:
+            raise TimeoutError('down')
+        return len(calls)
+
+    cache = Cache(InMemory())
+    cached = cache(ttl=60, stale_ttl=600, cache_errors=(TimeoutError,))(flaky)
+
+    with patch('cachetoolz.decorator.time.time', lambda: now[0]):
+        assert cached() == 1
+        now[0] += 120
+        assert cached() == 1
+        cache.close()
+        assert cached() == 1
+    cache.close()
+    assert len(calls) == 3
+
+
+@test(
+    '(cache) value is refreshed early with early recompute',
+    tags=['unit', 'decorator', 'cache', 'early_recompute'],
+)
+async def _(early_recompute=each(1000.0, None), calls=each(2, 1)):
+    counter = []
+
+    async def slow():
+        await asyncio.sleep(0.01)
+        counter.append(None)
+        return len(counter)
+
+    cached = Cache(AsyncInMemory())(ttl=60, early_recompute=early_recompute)(
+        slow
+    )
+
+    with patch('cachetoolz.entry.random', return_value=0.9999):
+        assert await cached() == 1
+        assert await cached() == 1
+        await asyncio.sleep(0.05)
+
+    assert await cached() == calls
+
+
+@test(
+    '(cache) miss returns the computed value',
+    tags=['unit', 'decorator', 'cache', 'miss_copy'],
+)
+def _(Backend=each(AsyncInMemory, InMemory)):
+    value = {'heroes': [{'name': 'Deadpond'}]}
+    cache = Cache(Backend())
+
+    def identity():
+        return value
+
+    none = cache(namespace='none', miss_copy='none')(identity)()
+    shallow = cache(namespace='shallow', miss_copy='shallow')(identity)()
+    deep = cache(namespace='deep', miss_copy='deep')(identity)()
+    decoded = cache(namespace='decoded')(identity)()
+
+    assert none is value
+    assert shallow == value and shallow is not value
+    assert shallow['heroes'] is value['heroes']
+    assert deep == value and deep['heroes'] is not value['heroes']
+    assert decoded == value and decoded['heroes'] is not value['heroes']
+
+
+@test(
+    '(cache) methods ignoring self share their values',
+    tags=['unit', 'decorator', 'cache', 'ignore_args'],
+)
+def _():
+    calls = []
+
+    class Repository:
+        def __init__(self, session):
+            self.session = session
+
+        @Cache(InMemory())(ignore_args=['self', 'session'])
+        def get(self, session, user_id, region='eu'):
+            calls.append((self.session, user_id, region))
+            return f'{user_id}-{region}'
+
+    first, second = Repository(object()), Repository(object())
+
+    assert first.get(object(), 1) == '1-eu'
+    assert second.get(object(), user_id=1, region='eu') == '1-eu'
+    assert second.get(None, 1, 'us') == '1-us'
+    assert len(calls) == 2
+
+
+@test(
+    '(cache) only key args are in the key',
+    tags=['unit', 'decorator', 'cache', 'key_args'],
+)
+async def _():
+    backend = AsyncMock()
+    backend.get.return_value = '1'
+
+    async def fetch(user_id, region, session):
+        ...
+
+    cached = Cache(backend)(key_args=['user_id', 'region'])(fetch)
+    await cached(1, 'eu', object())
+    await cached(1, session=object(), region='eu')
+
+    first, second = backend.get.await_args_list
+    assert first == second
+
+
+@test(
+    '(cache) keys of recent arguments are kept',
+    tags=['unit', 'decorator', 'cache', 'key_cache'],
+)
+def _():
+    backend = Mock()
+    backend.get.return_value = '1'
+    cache = Cache(backend)
+    cached = cache(key_cache=2)(sub)
+
+    with patch(
+        'cachetoolz.keygen.write_arguments', wraps=write_arguments
+    ) as build:
+        for args in [(1, 2), (1, 2), (1.0, 2), ([1],), ([1],)]:
+            cached(*args)
+
+    first, second, third, fourth, fifth = backend.get.call_args_list
+    assert first == second and first != third and fourth == fifth
+    assert build.call_count == 4
+    assert cache.stats['key_cache_hits'] == 1
+    assert cache.stats['key_cache_misses'] == 2
+    assert cache.stats['key_cache_hit_ratio'] == 1 / 3
+
+
+@test(
+    '(cache) keys of recent arguments leave the ignored arguments out',
+    tags=['unit', 'decorator', 'cache', 'key_cache'],
+)
+def _():
+    class Session:
+        pass
+
+    def get(session, user_id):
+        return user_id
+
+    backend = Mock()
+    backend.get.return_value = '1'
+    cache = Cache(backend)
+    cached = cache(ignore_args=['session'], key_cache=100)(get)
+
+    sessions = [Session() for _ in range(5)]
+    references = list(map(weakref.ref, sessions))
+    for session in sessions:
+        cached(session, 1)
+    del sessions, session
+    gc.collect()
+
+    assert len({call.args for call in backend.get.call_args_list}) == 1
+    assert cache.stats['key_cache_hits'] == 4
+    assert cache.stats['key_cache_misses'] == 1
+    assert all(reference() is None for reference in references)
+
+
+@test(
+    '(cache) pickle coder',
+    tags=['unit', 'decorator', 'cache', 'coder'],
+)
+def _(Backend=each(InMemory, AsyncInMemory)):
+    calls = []
+
+    def load(numerator):
+        calls.append(numerator)
+        if numerator < 0:
+            raise ValueError(numerator)
+        return [Fraction(numerator, 3)]
+
+    coder = PickleCoder(allow=['fractions.Fraction'])
+    cached = Cache(Backend(), coder=coder)(cache_errors=(ValueError,))(load)
+
+    assert cached(1) == cached(1) == [Fraction(1, 3)]
+    for _ in range(2):
+        with raises(ValueError):
+            cached(-1)
+    assert calls == [1, -1]
+
+
+@test(
+    '(cache) compressed coder',
+    tags=['unit', 'decorator', 'cache', 'coder', 'stats'],
+)
+def _():
+    cache = Cache(InMemory(), coder=CompressedCoder(coder, threshold=64))
+    cached = cache(lambda size: 'a' * size)
+
+    assert cached(1000) == cached(1000) == 'a' * 1000
+    assert cached(10) == cached(10) == 'a' * 10
+    assert cache.stats['compression_count'] == 1
+    assert cache.stats['compression_ratio'] > 10
+
+
+@test(
+    '(cache) bytes values',
+    tags=['unit', 'decorator', 'cache', 'bytes'],
+)
+def _(stored=each(b'[1, 2]', b'\x00inf;0.0\n[1, 2]', '\x00inf;0.0\n[1, 2]')):
+    backend = Mock()
+    backend.get.return_value = stored
+
+    assert Cache(backend)(stale_ttl=60)(sub)(1, 2) == [1, 2]
+    backend.set.assert_not_called()
+
+
+@test(
+    '(cache) versioned keys',
+    tags=['unit', 'decorator', 'cache', 'version'],
+)
+def _(
+    version=each(None, 2, 'auto'),
+    prefix=each('default:', 'default:2-', None),
+):
+    backend = Mock()
+    backend.get.return_value = '1'
+
+    Cache(backend)(version=version)(sub)(1, 2)
+
+    (key,), _ = backend.get.call_args
+    if version == 'auto':
+        prefix = f'default:{code_fingerprint(sub)}-'
+    assert key.startswith(prefix) and len(key) == len(prefix) + 32
+
+
+@test(
+    '(cache) invalid version',
+    tags=['unit', 'decorator', 'cache', 'version', 'raise'],
+)
+def _():
+    with raises(ValueError) as exp:
+        Cache(Mock())(version='v1:2')
+
+    assert exp.raised.args[0] == "version must not contain \":\", got 'v1:2'"
+
+
+@test(
+    '(cache) invalid argument selection',
+    tags=['unit', 'decorator', 'cache', 'key_args', 'raise'],
+)
+def _(
+    key_args=each(['user'], ['x'], None),
+    ignore_args=each((), ['y'], ['self']),
+    message=each(
+        "'user' is not a parameter of add",
+        'key_args and ignore_args are exclusive',
+        "'self' is not a parameter of add",
+    ),
+):
+    def add(x, y):
+        return x + y
+
+    with raises(ValueError) as exp:
+        Cache(Mock())(key_args=key_args, ignore_args=ignore_args)(add)
+
+    assert exp.raised.args[0] == message
+
+
+@test(
+    '(cache) invalid miss copy',
+    tags=['unit', 'decorator', 'cache', 'miss_copy', 'raise'],
+)
+def _():
+    with raises(ValueError) as exp:
+        Cache(Mock())(miss_copy='pickle')
+
+    assert exp.raised.args[0] == (
+        "miss_copy must be one of ['deep', 'none', 'shallow'], got 'pickle'"
+    )
+
+
+@test(
+    '(cache) clear returns the result without encoding it',
+    tags=['unit', 'decorator', 'clear'],
+)
+async def _(Backend=each(AsyncMock, Mock)):
+    value = (1, {2})
+
+    async def func():
+        return value
+
+    assert await Cache(Backend()).clear(func)() is value
+
+
+@test(
+    '(cache) write behind does not wait for the backend write',
+    tags=['unit', 'decorator', 'cache', 'write_behind'],
+)
+def _(Backend=each(AsyncMock, Mock)):
+    backend = Backend()
+    backend.get.return_value = None
+    cache = Cache(backend)
+
+    result = cache(write_behind=True, keygen=lambda *args: 'key')(sub)(3, 2)
+    cache.flush()
+
+    backend.set_many.assert_called_once_with(
+        [('default:key', '1', timedelta(weeks=20e3))]
+    )
+    assert result == 1
+    assert cache.stats == {
+        'write_behind_dropped': 0,
+        'write_behind_pending': 0,
+        'key_cache_hits': 0,
+        'key_cache_misses': 0,
+        'key_cache_hit_ratio': 0.0,
+    }
+    cache.close()
+
+
+@test(
+    '(cache) write behind of asynchronous functions uses their loop',
+    tags=['unit', 'decorator', 'cache', 'write_behind'],
+)
+async def _():
+    loops = []
+    backend = AsyncInMemory()
+    set_many = backend.set_many
+
+    async def record(writes):
+        loops.append(asyncio.get_running_loop())
+        await set_many(writes)
+
+    backend.set_many = record
+    cache = Cache(backend)
+    cached = cache(write_behind=True)(mul)
+
+    assert await cached(3, 2) == 6
+    await cache.aflush()
+    assert await cached(3, 2) == 6
+
+    assert loops == [asyncio.get_running_loop()]
+    assert cache.stats['write_behind_pending'] == 0
+    cache.close()
+
+
+@test(
+    '(cache) cached exceptions are raised again',
+    tags=['unit', 'decorator', 'cache', 'cache_errors'],
+)
+def _(Backend=each(AsyncInMemory, InMemory)):
+    calls = []
+
+    def fail(error):
+        calls.append(error)
+        raise error('upstream', 503)
+
+    cached = Cache(Backend())(cache_errors=(TimeoutError,), error_ttl=60)(fail)
+
+    for _ in range(3):
+        with raises(TimeoutError) as exp:
+            cached(TimeoutError)
+        assert exp.raised.args == ('upstream', 503)
+
+    for _ in range(2):
+        with raises(ValueError):
+            cached(ValueError)
+
+    assert calls == [TimeoutError, ValueError, ValueError]
+
+
+@test(
+    '(cache) cached exceptions of asynchronous functions are raised again',
+    tags=['unit', 'decorator', 'cache', 'cache_errors'],
+)
+async def _():
+    calls = []
+
+    async def fail():
+        calls.append(None)
+        raise ConnectionError(object())
+
+    cache = Cache(AsyncInMemory())
+    cached = cache(cache_errors=(ConnectionError,), error_ttl=60)(fail)
+
+    with raises(ConnectionError):
+        await cached()
+
+    for _ in range(2):
+        with raises(ConnectionError) as exp:
+            await cached()
+        assert exp.raised.args[0].startswith('<object object at')
+
+    uncached = cache(cache_errors=(TimeoutError,))(fail)
+    with raises(ConnectionError):
+        await uncached()
+
+    assert len(calls) == 2
+
+
+@test(
+    '(cache) the function is called when the backend get fails',
+    tags=['unit', 'decorator', 'cache', 'breaker'],
+)
+async def _():
+    backend = AsyncMock()
+    backend.get.side_effect = ConnectionError('unreachable')
+    cache = Cache(backend)
+
+    @cache
+    async def double(value):
+        return value * 2
+
+    assert await double(2) == 4
+    backend.set.assert_not_called()
+
+
+class SlowInMemory(InMemory):
+    def get(self, key):
+        time.sleep(1)
+
+
+class AsyncSlowInMemory(AsyncInMemory):
+    async def get(self, key):
+        await asyncio.sleep(1)
+
+
+@test(
+    '(cache) slow backend reads are abandoned',
+    tags=['unit', 'decorator', 'cache', 'breaker'],
+)
+def _(Slow=each(SlowInMemory, AsyncSlowInMemory)):
+    calls = []
+    cache = Cache(Slow(), get_timeout=0.05)
+
+    @cache
+    def func():
+        calls.append(None)
+        return 'value'
+
+    start = time.perf_counter()
+    assert func() == 'value'
+    assert time.perf_counter() - start < 0.5
+    assert calls == [None]
+    cache.close()
+
+
+@test(
+    '(cache) the backend is bypassed while the breaker is open',
+    tags=['unit', 'decorator', 'cache', 'breaker'],
+)
+def _():
+    backend = Mock()
+    backend.get.side_effect = ConnectionError('unreachable')
+    cache = Cache(backend, breaker=CircuitBreaker(window=2, cooldown=60))
+
+    @cache
+    def func():
+        return 'value'
+
+    assert [func() for _ in range(5)] == ['value'] * 5
+    assert backend.get.call_count == 2
+    assert cache.breaker.state == 'open'
+
+
+@test(
+    '(batch) only the missing ids are computed',
+    tags=['unit', 'decorator', 'batch'],
+)
+def _(Backend=each(AsyncInMemory, InMemory)):
+    calls = []
+    cache = Cache(Backend())
+
+    @cache.batch(ttl=60)
+    def squares(ids, offset=0):
+        calls.append(list(ids))
+        return {id_: id_**2 + offset for id_ in ids if id_ != 4}
+
+    assert squares([3, 1, 2, 1]) == {3: 9, 1: 1, 2: 4}
+    assert squares([4, 2, 5, 3]) == {2: 4, 5: 25, 3: 9}
+    assert squares([4, 2, 5, 3]) == {2: 4, 5: 25, 3: 9}
+    assert squares([1], offset=1) == {1: 2}
+
+    assert calls == [[3, 1, 2], [4, 5], [4], [1]]
+
+
+@test(
+    '(batch) asynchronous functions read and write in bulk',
+    tags=['unit', 'decorator', 'batch'],
+)
+async def _():
+    backend = AsyncInMemory()
+    cache = Cache(backend)
+    calls = []
+
+    @cache.batch
+    async def names(ids):
+        calls.append(ids)
+        return {id_: f'name-{id_}' for id_ in ids}
+
+    with patch.object(
+        backend, 'get_many', wraps=backend.get_many
+    ) as get_many, patch.object(
+        backend, 'set_many', wraps=backend.set_many
+    ) as set_many:
+        assert await names(['a', 'b']) == {'a': 'name-a', 'b': 'name-b'}
+        assert await names(['c', 'a']) == {'c': 'name-c', 'a': 'name-a'}
+
+    assert calls == [['a', 'b'], ['c']]
+    assert get_many.await_count == 2
+    assert set_many.await_count == 2
+
+
+@test(
+    '(batch) the function is called with every id when the backend fails',
+    tags=['unit', 'decorator', 'batch'],
+)
+def _():
+    backend = Mock()
+    backend.get_many.side_effect = ConnectionError('unreachable')
+
+    @Cache(backend).batch
+    def identity(ids):
+        return {id_: id_ for id_ in ids}
+
+    assert identity([1, 2]) == {1: 1, 2: 2}
+    backend.set_many.assert_not_called()
+
+
+@test(
+    '(cache) concurrent reads are batched',
+    tags=['unit', 'decorator', 'cache', 'batch_window'],
+)
+async def _():
+    backend = AsyncInMemory()
+    cache = Cache(backend, batch_window=0)
+
+    @cache
+    async def double(value):
+        return value * 2
+
+    await double(1)
+    with patch.object(
+        backend, 'get_many', wraps=backend.get_many
+    ) as get_many, patch.object(backend, 'get', wraps=backend.get) as get:
+        assert await asyncio.gather(*map(double, [1, 2, 3])) == [2, 4, 6]
+
+    get_many.assert_awaited_once()
+    assert len(get_many.await_args.args[0]) == 3
+    get.assert_not_called()
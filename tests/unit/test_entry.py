@@ -0,0 +1,50 @@
+from math import inf
+from unittest.mock import patch
+
+from ward import each, test
+
+from cachetoolz.entry import Entry, is_packed, pack, unpack
+
+
+@test('pack and unpack an entry', tags=['unit', 'entry'])
+def _(
+    value=each('[1, 2]', '"multi\\nline"', ''),
+    fresh_until=each(1700000000.5, 0.0, inf),
+    delta=each(0.25, 0.0, 1e-06),
+):
+    entry = Entry(value=value, fresh_until=fresh_until, delta=delta)
+    assert unpack(pack(entry)) == entry
+
+
+@test('pack and unpack a bytes entry', tags=['unit', 'entry'])
+def _(value=each(b'\x80\x05\n\x00', b'', b'[1]'), delta=each(0.5, 0.0, 2.0)):
+    entry = Entry(value=value, fresh_until=1700000000.5, delta=delta)
+    packed = pack(entry)
+
+    assert isinstance(packed, bytes) and is_packed(packed)
+    assert unpack(packed) == entry
+
+
+@test('unpack a value without metadata', tags=['unit', 'entry'])
+def _(value=each('[1, 2]', b'{"key": "value"}', b'\x80\x05N.')):
+    assert not is_packed(value)
+    entry = unpack(value)
+    assert entry == Entry(value=value)
+    assert entry.is_fresh(1e20)
+
+
+@test('entry freshness', tags=['unit', 'entry'])
+def _(now=each(9.0, 10.0, 11.0), fresh=each(True, False, False)):
+    assert Entry(value='1', fresh_until=10.0).is_fresh(now) is fresh
+
+
+@test('entry early expiration', tags=['unit', 'entry'])
+def _(
+    random=each(0.0, 0.5, 0.99),
+    beta=each(1.0, 1.0, 0.0),
+    fresh=each(True, False, True),
+):
+    entry = Entry(value='1', fresh_until=10.0, delta=2.0)
+
+    with patch('cachetoolz.entry.random', return_value=random):
+        assert entry.is_fresh(8.9, beta) is fresh
@@ -0,0 +1,319 @@
+import ctypes
+import os
+import subprocess
+import sys
+import tracemalloc
+from array import array
+from dataclasses import dataclass
+from enum import Enum
+from functools import wraps
+from unittest.mock import patch
+from uuid import UUID
+
+from ward import each, raises, test
+
+from cachetoolz.keygen import (
+    ArgumentSelector,
+    canonical,
+    code_fingerprint,
+    compile_keygen,
+    default_keygen,
+    encode_primitives,
+    write_canonical,
+    write_each_argument,
+)
+from cachetoolz.utils import key_function
+
+
+def func(*args, **kwargs):
+    return None
+
+
+class Color(str, Enum):
+    RED = 'red'
+
+
+@test('compiled key generator', tags=['unit', 'keygen'])
+def _(
+    typed=each(False, True, False),
+    args=each((), (2, 'x', None), ([1, 2], {'a': 1})),
+    kwargs=each({}, {'y': 1.5, 'z': (True,)}, {'b': {3}}),
+):
+    result = compile_keygen(typed, func)(*args, **kwargs)
+    assert result == default_keygen(typed, func, *args, **kwargs)
+    assert len(result) == 32
+
+
+@test('primitive arguments are encoded at once', tags=['unit', 'keygen'])
+def _(
+    args=each((1, 'a', 2.5, True, None), ('\u00e9\ud800',), ()),
+    kwargs=each({}, {'b': 1, 'a': 'x'}, {'x': 1.0}),
+):
+    written = []
+    write_each_argument(False, args, kwargs, written.append)
+
+    assert encode_primitives(args, kwargs) == b''.join(written)
+
+
+@test('non primitive arguments', tags=['unit', 'keygen'])
+def _(
+    args=each(([1],), ((1, 2),), (Color.RED,), ()),
+    kwargs=each({}, {}, {}, {'a': b'a'}),
+):
+    assert encode_primitives(args, kwargs) is None
+
+
+@test('equal arguments have the same key', tags=['unit', 'keygen'])
+def _():
+    text = 'ab' * 3
+    keygen = compile_keygen(False, func)
+
+    assert keygen(text, text) == keygen(text, ''.join(['ab'] * 3))
+    assert keygen(x=1, y=2) == keygen(y=2, x=1)
+
+
+@test('argument types have different keys', tags=['unit', 'keygen'])
+def _(typed=each(False, True)):
+    keygen = compile_keygen(typed, func)
+
+    assert len({keygen(1), keygen(1.0), keygen(True), keygen('1')}) == 4
+    assert keygen([1]) != keygen((1,))
+
+
+@test('typed keys of mixed keyword types', tags=['unit', 'keygen'])
+def _():
+    keygen = compile_keygen(True, func)
+    assert keygen(x=[1], y='a') != keygen(x=(1,), y='a')
+
+
+@dataclass
+class Point:
+    x: int
+    y: str
+
+
+@test('canonical encoding', tags=['unit', 'keygen', 'canonical'])
+def _(
+    value=each(
+        None,
+        (True, 1, -2.5),
+        'ação',
+        b'\x00a',
+        [{'b': 1, 'a': 2}],
+        {2, 10},
+        Color.RED,
+        Point(1, 'a'),
+        UUID(int=1),
+    ),
+    expect=each(
+        b'N',
+        b't3:Ti1;f-0x1.4000000000000p+1;',
+        b's6:a\xc3\xa7\xc3\xa3o',
+        b'b2:\x00a',
+        b'l1:d2:t2:s1:ai2;t2:s1:bi1;',
+        b'S2:i10;i2;',
+        b'e17:test_keygen.Colors3:red',
+        b'D17:test_keygen.Pointt2:i1;s1:a',
+        b'o0:d2:t2:s5:__vals36:00000000-0000-0000-0000-000000000001'
+        b't2:s9:__decoders4:uuid',
+    ),
+):
+    assert canonical(value) == expect
+
+
+@test('canonical encoding of unordered values', tags=['unit', 'canonical'])
+def _():
+    assert canonical({'a': 1, 'b': [2]}) == canonical({'b': [2], 'a': 1})
+    assert canonical(frozenset('abc')) == canonical(frozenset('cba'))
+    assert canonical({1}) != canonical(frozenset({1}))
+
+
+@test('canonical encoding of typed objects', tags=['unit', 'canonical'])
+def _():
+    value = UUID(int=1)
+
+    assert canonical(value, typed=True) != canonical(value)
+    assert canonical(value, typed=True).startswith(b'o9:uuid.UUID')
+
+
+class UserId(str):
+    pass
+
+
+class Number(float):
+    pass
+
+
+@test(
+    'canonical encoding of subclasses of primitives',
+    tags=['unit', 'canonical'],
+)
+def _(
+    value=each(UserId('a'), Number(1.5), Number(1.5)),
+    typed=each(False, False, True),
+    expect=each(
+        b'o0:s1:a',
+        b'o0:f0x1.8000000000000p+0;',
+        b'o18:test_keygen.Numberf0x1.8000000000000p+0;',
+    ),
+):
+    assert canonical(value, typed) == expect
+
+
+@test('keys of subclasses of primitives', tags=['unit', 'keygen'])
+def _(typed=each(False, True)):
+    keygen = compile_keygen(typed, func)
+
+    assert keygen(UserId('a')) == keygen(UserId('a'))
+    assert keygen(UserId('a')) != keygen('a')
+
+
+@test('keys do not depend on the process', tags=['unit', 'keygen'])
+def _(seed=each('1', '2')):
+    script = (
+        'from datetime import date\n'
+        'from cachetoolz.keygen import default_keygen\n'
+        'print(default_keygen(False, print, {"a", "b", "c"}, d=date.min))\n'
+    )
+    keys = {
+        subprocess.run(
+            [sys.executable, '-c', script],
+            capture_output=True,
+            check=True,
+            env={**os.environ, 'PYTHONHASHSEED': hash_seed},
+            text=True,
+        ).stdout
+        for hash_seed in (seed, '3')
+    }
+    assert len(keys) == 1
+
+
+@test('canonical encoding of buffers', tags=['unit', 'canonical'])
+def _(
+    value=each(
+        bytearray(b'abc'),
+        memoryview(b'abc'),
+        memoryview(b'aXbXc')[::2],
+        array('b', b'abc'),
+        (ctypes.c_char * 3)(*b'abc'),
+    ),
+    expect=each(
+        b'b3:abc',
+        b'b3:abc',
+        b'b3:abc',
+        b'ab3:abc',
+        b'm26:test_keygen.c_char_Array_3s2:<ct1:i3;b3:abc',
+    ),
+):
+    assert canonical(value) == expect
+
+
+@test('buffers are hashed in chunks', tags=['unit', 'keygen'])
+def _():
+    value = bytes(range(256)) * 20_000
+    written = []
+
+    with patch('cachetoolz.keygen.CHUNK_SIZE', 1 << 16):
+        write_canonical(value, written.append)
+
+    assert [len(chunk) for chunk in written[1:]] == [1 << 16] * 78 + [8192]
+    assert all(isinstance(chunk, memoryview) for chunk in written[1:])
+    assert b''.join(written) == canonical(value)
+
+
+@test('buffer keys do not copy the buffer', tags=['unit', 'keygen'])
+def _():
+    value = bytearray(32 << 20)
+    keygen = compile_keygen(False, func)
+
+    tracemalloc.start()
+    key = keygen(value, size=len(value))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert peak < 1 << 20
+    assert key == keygen(bytes(value), size=len(value))
+
+
+@test('keyword buffer keys do not copy the buffer', tags=['unit', 'keygen'])
+def _(key_args=each(None, ['value'])):
+    def buffer_func(value, size):
+        return None
+
+    value = bytearray(32 << 20)
+    key = key_function('default', None, False, buffer_func, key_args=key_args)
+
+    tracemalloc.start()
+    result = key(value=value, size=len(value))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert peak < 1 << 20
+    assert result == key(value=bytes(value), size=len(value))
+
+
+@test('select arguments', tags=['unit', 'keygen', 'select'])
+def _(
+    key_args=each(None, ['b', 'args'], None, None),
+    ignore_args=each((), (), ['a', 'kwargs'], ['kwargs']),
+    call=each(((1,), {}), ((1, 2, 3, 4), {}), ((1,), {'e': 5}), ((), {})),
+    expect=each(
+        {'a': 1, 'b': 2, 'args': (), 'c': 3, 'kwargs': {}},
+        {'b': 2, 'args': (3, 4)},
+        {'b': 2, 'args': (), 'c': 3},
+        None,
+    ),
+):
+    def func(a, b=2, *args, c=3, **kwargs):
+        ...
+
+    select = ArgumentSelector(func, key_args, ignore_args)
+    args, kwargs = call
+
+    if expect is None:
+        with raises(TypeError):
+            select(*args, **kwargs)
+    else:
+        assert select(*args, **kwargs) == expect
+
+
+@test('methods of different classes have different keys', tags=['unit'])
+def _():
+    class First:
+        def get(self):
+            ...
+
+    class Second:
+        def get(self):
+            ...
+
+    first = compile_keygen(False, First.get)
+    assert first() != compile_keygen(False, Second.get)()
+
+
+@test('code fingerprint', tags=['unit', 'keygen', 'version'])
+def _():
+    def build(scale):
+        def price(value):
+            return [item * scale for item in value]
+
+        return price
+
+    def other(value):
+        return [item * 2 for item in value]
+
+    def renamed(value):
+        return [item * 2 for item in sorted(value)]
+
+    fingerprint = code_fingerprint(build(2))
+
+    assert len(fingerprint) == 8
+    assert fingerprint == code_fingerprint(build(3))
+    assert fingerprint != code_fingerprint(other)
+    assert code_fingerprint(other) != code_fingerprint(renamed)
+    assert code_fingerprint(wraps(other)(lambda: None)) == (
+        code_fingerprint(other)
+    )
+
+    with raises(ValueError):
+        code_fingerprint(len)
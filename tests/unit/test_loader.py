@@ -0,0 +1,71 @@
+import asyncio
+
+from ward import raises, test
+
+from cachetoolz.loader import BatchLoader
+
+
+def recorder(fail=False):
+    batches = []
+
+    async def load_many(keys):
+        batches.append(keys)
+        if fail:
+            raise ConnectionError('unreachable')
+        return [key.upper() for key in keys]
+
+    return batches, load_many
+
+
+@test('loader batches the loads of a loop iteration', tags=['unit', 'loader'])
+async def _():
+    batches, load_many = recorder()
+    loader = BatchLoader(load_many)
+
+    results = await asyncio.gather(
+        loader.load('a'), loader.load('b'), loader.load('a')
+    )
+
+    assert results == ['A', 'B', 'A']
+    assert batches == [['a', 'b']]
+
+    assert await loader.load('c') == 'C'
+    assert batches == [['a', 'b'], ['c']]
+
+
+@test('loader waits for the window', tags=['unit', 'loader'])
+async def _():
+    batches, load_many = recorder()
+    loader = BatchLoader(load_many, window=0.05)
+
+    async def later(key):
+        await asyncio.sleep(0.01)
+        return await loader.load(key)
+
+    assert await asyncio.gather(loader.load('a'), later('b')) == ['A', 'B']
+    assert batches == [['a', 'b']]
+
+
+@test('loader dispatches full batches', tags=['unit', 'loader'])
+async def _():
+    batches, load_many = recorder()
+    loader = BatchLoader(load_many, max_batch=2)
+
+    results = await asyncio.gather(*map(loader.load, 'abc'))
+
+    assert results == ['A', 'B', 'C']
+    assert batches == [['a', 'b'], ['c']]
+
+
+@test('loader errors are raised to every caller', tags=['unit', 'loader'])
+async def _():
+    batches, load_many = recorder(fail=True)
+    loader = BatchLoader(load_many)
+
+    results = await asyncio.gather(
+        loader.load('a'), loader.load('b'), return_exceptions=True
+    )
+
+    assert [type(result) for result in results] == [ConnectionError] * 2
+    with raises(ConnectionError):
+        await loader.load('c')
@@ -4,8 +4,7 @@ from datetime import date, datetime, timedelta
 from unittest import mock
 from uuid import uuid4
 
-from charset_normalizer import detect
-from ward import each, test
+from ward import each, raises, test
 
 from cachetoolz import utils
 
@@ -19,7 +18,7 @@ def _(
     args=each(tuple(), (2,)),
     kwargs=each(dict(), {'y': 1}),
     key_hash=each(
-        'bd7f1a8de0b4f03beaa74640089d77ab', 'c31adf12d6e7cefe404da1c528820202'
+        '625744c4040bfbcd90e58826a69afc78', 'bb2d44c403ad2d0b43ae6be5697896b9'
     ),
 ):
     result = utils.default_keygen(False, func, *args, **kwargs)
@@ -31,7 +30,7 @@ def _(
     args=each((2,), (2.0,)),
     kwargs=each({'y': 1}, {'y': 1.0}),
     key_hash=each(
-        '32675843b113612781754aff2740f422', 'bc8a862455ae47765e5546d50dafbf6a'
+        'bb2d44c403ad2d0b43ae6be5697896b9', '261da0c5296446cec4783fa34701cc5c'
     ),
 ):
     result = utils.default_keygen(True, func, *args, **kwargs)
@@ -41,14 +40,14 @@ def _(
 @test('make key with default key generator', tags=['unit', 'make_key'])
 async def _(namespace=each('default', 'hero', 'chips')):
     result = await utils.make_key(namespace, None, False, func)
-    assert result == f'{namespace}:bd7f1a8de0b4f03beaa74640089d77ab'
+    assert result == f'{namespace}:625744c4040bfbcd90e58826a69afc78'
 
 
 @test('make key with key generator', tags=['unit', 'make_key'])
 async def _(namespace=each('default', 'hero', 'chips')):
     def key_gen(typed, func_, *args, **kwargs):
         key = pickle.dumps(None)
-        return key.decode(detect(key)['encoding'])
+        return key.decode('utf_16_be')
 
     result = await utils.make_key(namespace, key_gen, False, func)
     assert result == f'{namespace}:耄丮'
@@ -59,7 +58,7 @@ async def _(namespace=each('default', 'hero', 'chips')):
     async def key_gen(typed, func_, *args, **kwargs):
         await asyncio.sleep(0.0001)
         key = pickle.dumps(None)
-        return key.decode(detect(key)['encoding'])
+        return key.decode('utf_16_be')
 
     result = await utils.make_key(namespace, key_gen, False, func)
     assert result == f'{namespace}:耄丮'
@@ -93,48 +92,151 @@ def _(
     assert utils.decoder_name(decoder) == name
 
 
-@test('manipulating synchronous functions', tags=['unit', 'manipulate'])
-def _():
-    def to_be_manipulated(x, y):
+@test(
+    'manipulating asynchronous functions', tags=['unit', 'manipulate', 'async']
+)
+async def _():
+    async def to_be_manipulated(x, y):
         return x + y
 
-    def manipulator(func, *args, **kwargs):
-        result = func(*args, **kwargs)
+    async def manipulator(func, *args, **kwargs):
+        result = await func(*args, **kwargs)
         return result * 2
 
-    manipulated = utils.manipulate(manipulator)(to_be_manipulated)
+    sync_manipulator = mock.Mock()
+    manipulated = utils.manipulate(manipulator, sync_manipulator)(
+        to_be_manipulated
+    )
+
+    assert await manipulated(2, 2) == 8
+    sync_manipulator.assert_not_called()
+
+
+@test('key function', tags=['unit', 'key_function'])
+def _(namespace=each('default', 'hero', 'chips')):
+    key = utils.key_function(namespace, None, False, func)
+
+    assert not asyncio.iscoroutinefunction(key)
+    assert key() == f'{namespace}:625744c4040bfbcd90e58826a69afc78'
+
 
-    assert manipulated(2, 2) == 8
+async def typed_keygen(typed, func_, *args, **kwargs):
+    return f'{typed}-{args[0]}'
+
+
+async def pairs_keygen(typed_, func_, /, *args, **kwargs):
+    return str(sorted(kwargs.items()))
+
+
+@test('key function with async key generator', tags=['unit', 'key_function'])
+async def _():
+    key = utils.key_function('hero', typed_keygen, True, func)
+    assert await key(2) == 'hero:True-2'
 
 
 @test(
-    'manipulating synchronous functions with asynchronous manipulator',
-    tags=['unit', 'manipulate'],
+    'key function running an async key generator',
+    tags=['unit', 'key_function'],
 )
 def _():
-    def to_be_manipulated(x, y):
-        return x + y
+    runner = utils.EventLoopThread()
+    key = utils.key_function('hero', typed_keygen, True, func, run=runner.run)
 
-    async def manipulator(func, *args, **kwargs):
-        result = func(*args, **kwargs)
-        return result * 2
+    assert not asyncio.iscoroutinefunction(key)
+    assert key(2) == 'hero:True-2'
+    runner.close()
 
-    manipulated = utils.manipulate(manipulator)(to_be_manipulated)
 
-    assert manipulated(2, 2) == 8
+def parameters_func(typed, func, x=1):
+    return None
 
 
 @test(
-    'manipulating asynchronous functions', tags=['unit', 'manipulate', 'async']
+    'key function selecting arguments named as the key generator parameters',
+    tags=['unit', 'key_function', 'select'],
 )
-async def _():
-    async def to_be_manipulated(x, y):
+def _(keygen=each(None, pairs_keygen)):
+    runner = utils.EventLoopThread()
+    key = utils.key_function(
+        'hero',
+        keygen,
+        False,
+        parameters_func,
+        run=runner.run,
+        ignore_args=['x'],
+    )
+
+    assert key(1, 2) == key(typed=1, func=2)
+    runner.close()
+
+
+@test(
+    'key function rejects arguments named as the key generator parameters',
+    tags=['unit', 'key_function', 'select'],
+)
+def _(key_args=each(['typed', 'x'], ['func'])):
+    def keygen(typed, func, *args, **kwargs):
+        return 'key'
+
+    with raises(ValueError) as exp:
+        utils.key_function(
+            'hero', keygen, False, parameters_func, None, key_args
+        )
+
+    assert 'key generator keygen' in str(exp.raised)
+
+
+@test(
+    'manipulating synchronous functions with synchronous manipulator',
+    tags=['unit', 'manipulate'],
+)
+def _():
+    def to_be_manipulated(x, y):
         return x + y
 
     async def manipulator(func, *args, **kwargs):
-        result = await func(*args, **kwargs)
-        return result * 2
+        raise AssertionError('the event loop path must not be used')
 
-    manipulated = utils.manipulate(manipulator)(to_be_manipulated)
+    def sync_manipulator(func, *args, **kwargs):
+        return func(*args, **kwargs) * 2
 
-    assert await manipulated(2, 2) == 8
+    manipulated = utils.manipulate(manipulator, sync_manipulator)(
+        to_be_manipulated
+    )
+
+    with mock.patch('asyncio.run') as run:
+        assert manipulated(2, 2) == 8
+
+    run.assert_not_called()
+
+
+@test('event loop thread runs coroutines', tags=['unit', 'event_loop_thread'])
+def _():
+    runner = utils.EventLoopThread()
+
+    async def current_loop():
+        return asyncio.get_running_loop()
+
+    first, second = runner.run(current_loop), runner.run(current_loop)
+    runner.close()
+
+    assert first is second
+    assert first.is_closed()
+    assert runner.run(asyncio.sleep, 0, 'done') == 'done'
+    runner.close()
+
+
+@test('blocking proxy', tags=['unit', 'blocking_proxy'])
+def _():
+    class Obj:
+        name = 'obj'
+
+        async def double(self, value):
+            return value * 2
+
+    runner = utils.EventLoopThread()
+    proxy = utils.BlockingProxy(Obj(), runner)
+
+    assert proxy.name == 'obj'
+    assert proxy.double(2) == 4
+    runner.close()
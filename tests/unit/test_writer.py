@@ -0,0 +1,133 @@
+import asyncio
+import threading
+from datetime import timedelta
+
+from ward import test
+
+from cachetoolz.writer import AsyncWriteBehind, WriteBehind
+
+expires_at = timedelta(seconds=60)
+
+
+@test('write behind writes in batches', tags=['unit', 'writer'])
+def _():
+    batches = []
+    release = threading.Event()
+    writer = WriteBehind(
+        lambda batch: (release.wait(), batches.append(batch)), batch_size=10
+    )
+
+    for index in range(15):
+        assert writer.put(f'ns:{index}', str(index), expires_at)
+    release.set()
+    writer.flush()
+
+    assert sum(map(len, batches)) == 15
+    assert all(len(batch) <= 10 for batch in batches)
+    assert writer.pending == 0
+    writer.close()
+
+
+@test('write behind drops writes when full', tags=['unit', 'writer'])
+def _():
+    release = threading.Event()
+    written = []
+    writer = WriteBehind(
+        lambda batch: (release.wait(), written.extend(batch)),
+        maxsize=2,
+        batch_size=1,
+    )
+
+    results = [
+        writer.put(f'ns:{index}', '1', expires_at) for index in range(5)
+    ]
+    release.set()
+    writer.close()
+
+    assert results.count(False) == writer.dropped >= 2
+    assert len(written) == 5 - writer.dropped
+
+
+@test('write behind survives write errors', tags=['unit', 'writer'])
+def _():
+    calls = []
+
+    def write(batch):
+        calls.append(batch)
+        raise ConnectionError('backend down')
+
+    writer = WriteBehind(write)
+    writer.put('ns:key', '1', expires_at)
+    writer.flush()
+    writer.put('ns:key', '2', expires_at)
+    writer.close()
+
+    assert len(calls) == 2
+    assert writer._thread is None
+
+
+@test('async write behind writes in batches', tags=['unit', 'writer'])
+async def _():
+    batches = []
+    loops = []
+
+    async def write(batch):
+        loops.append(asyncio.get_running_loop())
+        batches.append(batch)
+
+    writer = AsyncWriteBehind(write, batch_size=10)
+
+    for index in range(15):
+        assert writer.put(f'ns:{index}', str(index), expires_at)
+    await writer.flush()
+
+    assert sum(map(len, batches)) == 15
+    assert all(len(batch) <= 10 for batch in batches)
+    assert set(loops) == {asyncio.get_running_loop()}
+    assert writer.pending == 0
+
+
+@test('async write behind drops writes when full', tags=['unit', 'writer'])
+async def _():
+    written = []
+
+    async def write(batch):
+        written.extend(batch)
+
+    writer = AsyncWriteBehind(write, maxsize=2)
+
+    results = [
+        writer.put(f'ns:{index}', '1', expires_at) for index in range(5)
+    ]
+    await writer.flush()
+
+    assert results.count(False) == writer.dropped == 3
+    assert len(written) == 2
+
+
+@test(
+    'async write behind writes the queue when its loop closes',
+    tags=['unit', 'writer'],
+)
+def _():
+    written = []
+
+    async def write(batch):
+        if not written:
+            written.append(None)
+            # The first write is still running when the loop closes
+            await asyncio.Event().wait()
+        written.extend(key for key, *_ in batch)
+
+    writer = AsyncWriteBehind(write, batch_size=1)
+
+    async def main():
+        writer.put('ns:0', '1', expires_at)
+        await asyncio.sleep(0)
+        writer.put('ns:1', '1', expires_at)
+        writer.put('ns:2', '1', expires_at)
+
+    asyncio.run(main())
+
+    assert written == [None, 'ns:1', 'ns:2']
+    assert writer.pending == 0